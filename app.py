@@ -14,15 +14,8 @@ if "language" not in st.session_state:
 
 import base64
 
-# ... imports ...
-from ui.home_page import home_page
-from ui.library_page import library_page
-from ui.history_page import history_page
-from ui.simplex_page import simplex_ui
-from ui.branch_and_bound_page import bab_ui
-from ui.sensitivity_page import sensitivity_ui
-from ui.duality_page import duality_ui
-from ui.standard_form_page import standard_form_ui
+# Páginas importadas só quando exibidas (ver ui/page_loader.py)
+from ui.page_loader import lazy_page
 from ui.lang import t, get_available_languages
 
 # Obter idiomas disponíveis
@@ -119,18 +112,18 @@ st.markdown("""
 # --- Definição das Páginas (st.Page) ---
 
 # Principal
-p_home = st.Page(home_page, title=t("menu.home"), icon="🏠")
-p_library = st.Page(library_page, title=t("menu.library"), icon="📚")
-p_history = st.Page(history_page, title=t("menu.history"), icon="🕑")
+p_home = st.Page(lazy_page("ui.home_page", "home_page"), title=t("menu.home"), icon="🏠")
+p_library = st.Page(lazy_page("ui.library_page", "library_page"), title=t("menu.library"), icon="📚")
+p_history = st.Page(lazy_page("ui.history_page", "history_page"), title=t("menu.history"), icon="🕑")
 
 # Solvers
-p_simplex = st.Page(simplex_ui, title=t("menu.simplex"), icon="📐")
-p_bab = st.Page(bab_ui, title=t("menu.bab"), icon="🌳")
+p_simplex = st.Page(lazy_page("ui.simplex_page", "simplex_ui"), title=t("menu.simplex"), icon="📐")
+p_bab = st.Page(lazy_page("ui.branch_and_bound_page", "bab_ui"), title=t("menu.bab"), icon="🌳")
 
 # Ferramentas
-p_duality = st.Page(duality_ui, title=t("menu.duality"), icon="🔄")
-p_sensitivity = st.Page(sensitivity_ui, title=t("menu.sensitivity"), icon="📊")
-p_std_form = st.Page(standard_form_ui, title=t("menu.std_form"), icon="📝")
+p_duality = st.Page(lazy_page("ui.duality_page", "duality_ui"), title=t("menu.duality"), icon="🔄")
+p_sensitivity = st.Page(lazy_page("ui.sensitivity_page", "sensitivity_ui"), title=t("menu.sensitivity"), icon="📊")
+p_std_form = st.Page(lazy_page("ui.standard_form_page", "standard_form_ui"), title=t("menu.std_form"), icon="📝")
 
 # Navegação Organizada
 pg = st.navigation({
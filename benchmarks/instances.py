@@ -0,0 +1,129 @@
+"""Famílias de instâncias PL/PLI geradas com semente fixa.
+
+Todas no formato dos solvers (``Ax <= b``, ``x >= 0``): restrições ``>=``
+entram multiplicadas por -1 e igualdades como um par ``<=``/``>=``. Cada
+gerador recebe um tamanho e uma semente e devolve um dicionário com
+``c``, ``A``, ``b``, ``maximize`` e ``integer`` (se a família é inteira).
+"""
+
+import zlib
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+
+def random_dense_lp(size: int, seed: int) -> Dict:
+    """PL denso aleatório com ``size`` restrições e ``size + size // 2`` variáveis."""
+    rng = np.random.default_rng(seed)
+    m, n = size, size + size // 2
+    A = rng.integers(1, 20, (m, n)).astype(float)
+    b = A.sum(axis=1) * rng.uniform(0.2, 0.6, m)
+    c = rng.integers(1, 30, n).astype(float)
+    return _instance(c, A, b, maximize=True, integer=False)
+
+
+def transportation(size: int, seed: int) -> Dict:
+    """Transporte ``size`` origens x ``size`` destinos (minimiza custo, demanda ``>=``)."""
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(20, 60, size).astype(float)
+    demand = rng.multinomial(int(supply.sum() * 0.9), np.full(size, 1.0 / size)).astype(float)
+    cost = rng.integers(1, 20, (size, size)).astype(float)
+
+    n = size * size
+    rows, rhs = [], []
+    for i in range(size):  # oferta: sum_j x_ij <= s_i
+        row = np.zeros(n)
+        row[i * size:(i + 1) * size] = 1.0
+        rows.append(row)
+        rhs.append(supply[i])
+    for j in range(size):  # demanda: sum_i x_ij >= d_j
+        row = np.zeros(n)
+        row[j::size] = -1.0
+        rows.append(row)
+        rhs.append(-demand[j])
+    return _instance(cost.ravel(), np.array(rows), np.array(rhs), maximize=False, integer=False)
+
+
+def assignment(size: int, seed: int) -> Dict:
+    """Designação ``size`` x ``size`` maximizando o lucro (cada linha/coluna <= 1)."""
+    rng = np.random.default_rng(seed)
+    profit = rng.integers(1, 50, (size, size)).astype(float)
+    n = size * size
+    rows = []
+    for i in range(size):
+        row = np.zeros(n)
+        row[i * size:(i + 1) * size] = 1.0
+        rows.append(row)
+    for j in range(size):
+        row = np.zeros(n)
+        row[j::size] = 1.0
+        rows.append(row)
+    return _instance(profit.ravel(), np.array(rows), np.ones(2 * size), maximize=True, integer=True)
+
+
+def knapsack(size: int, seed: int) -> Dict:
+    """Mochila 0-1 com ``size`` itens (capacidade = metade do peso total)."""
+    rng = np.random.default_rng(seed)
+    weight = rng.integers(5, 40, size).astype(float)
+    value = weight + rng.integers(-4, 10, size)
+    A = np.vstack([weight, np.eye(size)])
+    b = np.concatenate([[np.floor(weight.sum() / 2) + 0.5], np.ones(size)])
+    return _instance(np.maximum(value, 1.0), A, b, maximize=True, integer=True)
+
+
+def set_cover(size: int, seed: int) -> Dict:
+    """Cobertura de ``size`` elementos por ``size`` conjuntos (minimiza custo)."""
+    rng = np.random.default_rng(seed)
+    n_sets = size
+    cover = rng.random((size, n_sets)) < 0.3
+    cover[np.arange(size), rng.integers(0, n_sets, size)] = True  # todo elemento coberto
+    cost = rng.integers(1, 10, n_sets).astype(float)
+    A = np.vstack([-cover.astype(float), np.eye(n_sets)])
+    b = np.concatenate([-np.ones(size), np.ones(n_sets)])
+    return _instance(cost, A, b, maximize=False, integer=True)
+
+
+def production_mix(size: int, seed: int) -> Dict:
+    """Mix de produção: ``size`` produtos, ``size // 2 + 1`` recursos, quantidades inteiras."""
+    rng = np.random.default_rng(seed)
+    m = size // 2 + 1
+    usage = rng.integers(1, 10, (m, size)).astype(float)
+    capacity = usage.sum(axis=1) * rng.uniform(1.5, 3.0, m)
+    profit = rng.integers(5, 40, size).astype(float)
+    return _instance(profit, usage, np.round(capacity, 1), maximize=True, integer=True)
+
+
+# Tamanhos crescentes por família (--levels escolhe quantos usar)
+FAMILIES = {
+    "random_dense": (random_dense_lp, [5, 10, 20, 40]),
+    "transportation": (transportation, [3, 5, 8, 12]),
+    "assignment": (assignment, [3, 5, 8, 12]),
+    "knapsack": (knapsack, [6, 10, 15, 20]),
+    "set_cover": (set_cover, [5, 8, 12, 16]),
+    "production_mix": (production_mix, [4, 8, 12, 16]),
+}
+
+
+def generate(levels: int = 2, families: List[str] | None = None, seed: int = 0) -> Iterator[Dict]:
+    """Gera as instâncias das famílias pedidas, nos ``levels`` primeiros tamanhos.
+
+    A semente de cada instância depende só de ``(família, tamanho, seed)``,
+    então a mesma instância é sempre gerada, independentemente do filtro.
+    """
+    for name, (builder, sizes) in FAMILIES.items():
+        if families and name not in families:
+            continue
+        for size in sizes[:levels]:
+            instance = builder(size, zlib.crc32(f"{name}-{size}-{seed}".encode()))
+            instance.update({"id": f"{name}-{size}", "family": name, "size": size})
+            yield instance
+
+
+def _instance(c, A, b, maximize: bool, integer: bool) -> Dict:
+    return {
+        "c": np.asarray(c, dtype=float).tolist(),
+        "A": np.asarray(A, dtype=float).tolist(),
+        "b": np.asarray(b, dtype=float).tolist(),
+        "maximize": maximize,
+        "integer": integer,
+    }
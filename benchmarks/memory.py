@@ -0,0 +1,141 @@
+"""Memória de um solver resolvido, como fica guardado em ``st.session_state``.
+
+Uso (na raiz do repositório)::
+
+    python -m benchmarks.memory                         # níveis 1-3, todas as famílias
+    python -m benchmarks.memory --levels 4 --families knapsack production_mix
+    python -m benchmarks.memory --no-history            # keep_history=False
+
+Para cada instância resolve com ``SimplexSolver`` e, nas famílias inteiras,
+``BranchBoundSolver`` (BestBound) sob ``tracemalloc`` e informa:
+
+* ``peak``: pico de bytes alocados durante a resolução;
+* ``retained``: bytes ainda alocados depois do ``gc`` com o solver vivo;
+* ``tableaux``/``nodes``/``steps``/``decisions``: tamanho profundo de cada
+  atributo do solver, e ``other`` para o restante do ``__dict__``.
+
+O tamanho do modelo aparece como ``m x n`` (restrições x variáveis).
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.instances import FAMILIES, generate  # noqa: E402
+from core.branch_bound_solver import BranchBoundSolver  # noqa: E402
+from core.simplex_solver import SimplexSolver  # noqa: E402
+
+HERE = Path(__file__).resolve().parent
+COMPONENTS = ("tableaux", "nodes", "steps", "decisions")
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    """Bytes ocupados por ``obj`` e tudo o que ele referencia (cada objeto uma vez).
+
+    Arrays do numpy contam ``nbytes`` do buffer próprio; views contam só o
+    cabeçalho, pois o buffer pertence ao array base.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        if obj.base is None:
+            size = max(size, obj.nbytes + 112)
+        if obj.dtype == object:
+            size += sum(deep_sizeof(item, seen) for item in obj.ravel())
+    elif isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def footprint(solver) -> dict:
+    """Bytes retidos por ``solver``, por componente de ``COMPONENTS`` + ``other``.
+
+    Objetos compartilhados entre componentes contam só no primeiro.
+    """
+    seen = set()
+    state = vars(solver)
+    sizes = {name: deep_sizeof(state[name], seen) if name in state else 0 for name in COMPONENTS}
+    sizes["other"] = deep_sizeof(state, seen)
+    sizes["total"] = sum(sizes.values())
+    return sizes
+
+
+def measure(solve) -> dict:
+    """Executa ``solve()`` sob ``tracemalloc`` e mede pico, retenção e componentes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        solver = solve()
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak": peak - before, "retained": retained - before,
+            "solver": solver, **footprint(solver)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Memória retida pelos solvers após resolver.")
+    parser.add_argument("--levels", type=int, default=3, help="Quantos tamanhos por família (1-4).")
+    parser.add_argument("--families", nargs="*", choices=sorted(FAMILIES), help="Filtra as famílias.")
+    parser.add_argument("--no-history", action="store_true", help="Resolve com keep_history=False.")
+    parser.add_argument("--node-limit", type=int, default=5000)
+    parser.add_argument("--output", type=Path, default=HERE / "memory.json")
+    args = parser.parse_args(argv)
+    keep_history = not args.no_history
+
+    rows = []
+    print(f"{'instância':<20} {'solver':<8} {'m x n':>8} {'peak':>10} {'retained':>10} "
+          + " ".join(f"{name:>10}" for name in COMPONENTS + ("other",)) + "   (KiB)")
+    for instance in generate(args.levels, args.families):
+        c, A, b = instance["c"], instance["A"], instance["b"]
+        runs = [("simplex", lambda: _solve(SimplexSolver(), c, A, b, maximize=instance["maximize"],
+                                           keep_history=keep_history))]
+        if instance["integer"]:
+            c_max = c if instance["maximize"] else [-v for v in c]
+            runs.append(("bb", lambda: _solve(BranchBoundSolver(), c_max, A, b, strategy="BestBound",
+                                              node_limit=args.node_limit, keep_history=keep_history)))
+        for name, solve in runs:
+            result = measure(solve)
+            solver = result.pop("solver")
+            row = {"id": instance["id"], "family": instance["family"], "size": instance["size"],
+                   "solver": name, "m": len(A), "n": len(c), "keep_history": keep_history,
+                   "status": solver.status, **result}
+            rows.append(row)
+            print(_format_row(row))
+
+    args.output.write_text(json.dumps(rows, indent=2))
+    print(f"\nResultados gravados em {args.output}")
+    return 0
+
+
+def _solve(solver, c, A, b, **options):
+    solver.solve(c, A, b, **options)
+    return solver
+
+
+def _format_row(r) -> str:
+    kib = [r[k] / 1024 for k in ("peak", "retained") + COMPONENTS + ("other",)]
+    return (f"{r['id']:<20} {r['solver']:<8} {r['m']:>3} x {r['n']:<4}"
+            + " ".join(f"{v:10.1f}" for v in kib))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""Executa o benchmark das famílias geradas e compara com a linha de base.
+
+Uso (na raiz do repositório)::
+
+    python -m benchmarks.run                    # níveis 1-2, compara com baseline.json
+    python -m benchmarks.run --levels 4 --repeat 5
+    python -m benchmarks.run --update-baseline  # grava os resultados como nova base
+    python -m benchmarks.run --strict-timing    # tempo pior também reprova
+
+Para cada instância mede ``SimplexSolver.solve`` (relaxação linear) e, nas
+famílias inteiras, ``BranchBoundSolver.solve`` com BFS, DFS e BestBound.
+Registra tempo (mínimo de ``--repeat`` execuções), iterações (pivôs),
+nós, pico de memória (``tracemalloc``), status e objetivo. O código de
+saída é 1 se houver regressão (iterações, nós ou memória) ou divergência de
+objetivo; tempo pior é só aviso (``SLOWER``), pois varia entre execuções na
+mesma máquina, a menos que se passe ``--strict-timing``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.instances import FAMILIES, generate  # noqa: E402
+from core.branch_bound_solver import BranchBoundSolver  # noqa: E402
+from core.instrumentation import SolverStats, instrument  # noqa: E402
+from core.simplex_solver import SimplexSolver  # noqa: E402
+
+HERE = Path(__file__).resolve().parent
+STRATEGIES = ("BFS", "DFS", "BestBound")
+
+# Diferenças abaixo destes pisos são ruído de medição, não regressão
+MIN_TIME_DELTA = 0.005      # segundos
+MIN_MEMORY_DELTA = 64_000   # bytes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos solvers de PL/PLI.")
+    parser.add_argument("--levels", type=int, default=2, help="Quantos tamanhos por família (1-4).")
+    parser.add_argument("--families", nargs="*", choices=sorted(FAMILIES), help="Filtra as famílias.")
+    parser.add_argument("--repeat", type=int, default=5, help="Execuções por medida de tempo.")
+    parser.add_argument("--node-limit", type=int, default=5000)
+    parser.add_argument("--time-limit", type=float, default=30.0, help="Limite por resolução (s).")
+    parser.add_argument("--output", type=Path, default=HERE / "results.json")
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Piora relativa tolerada (0.25 = 25%%).")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--strict-timing", action="store_true",
+                        help="Trata tempo pior como regressão (padrão: apenas aviso).")
+    args = parser.parse_args(argv)
+
+    results = []
+    for instance in generate(args.levels, args.families):
+        for solver_name, run in _runs(instance, args):
+            record = _measure(run, args.repeat)
+            record.update({"id": instance["id"], "family": instance["family"],
+                           "size": instance["size"], "solver": solver_name})
+            results.append(record)
+            print(_format_row(record))
+
+    report = {"meta": _meta(args), "results": results}
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\nResultados gravados em {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Linha de base atualizada em {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print("Sem linha de base para comparar (use --update-baseline).")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    findings = compare(baseline["results"], results, args.tolerance, args.strict_timing)
+    for level, message in findings:
+        print(f"[{level}] {message}")
+    failed = any(level in ("REGRESSION", "MISMATCH") for level, _ in findings)
+    print("\nRegressões encontradas." if failed else "\nSem regressões em relação à linha de base.")
+    return 1 if failed else 0
+
+
+def compare(baseline, results, tolerance: float, strict_timing: bool = False):
+    """Compara cada medida com a de mesma ``(id, solver)`` na linha de base.
+
+    Retorna ``[(nível, mensagem)]`` com nível ``"MISMATCH"`` (objetivo ou
+    status diferente), ``"REGRESSION"`` (memória, iterações ou nós piores),
+    ``"SLOWER"`` (tempo pior; ``"REGRESSION"`` com ``strict_timing``) ou
+    ``"IMPROVEMENT"``.
+    """
+    base = {(r["id"], r["solver"]): r for r in baseline}
+    findings = []
+    for new in results:
+        key = (new["id"], new["solver"])
+        old = base.get(key)
+        if old is None:
+            continue
+        label = f"{new['id']} / {new['solver']}"
+
+        if old["status"] != new["status"] or not _same_objective(old["objective"], new["objective"]):
+            findings.append(("MISMATCH", f"{label}: {old['status']} {old['objective']} -> "
+                                         f"{new['status']} {new['objective']}"))
+            continue
+
+        # Tempo oscila entre execuções: por padrão só avisa; memória é reprodutível
+        slower = "REGRESSION" if strict_timing else "SLOWER"
+        measured = (("time_s", MIN_TIME_DELTA, slower), ("peak_bytes", MIN_MEMORY_DELTA, "REGRESSION"))
+        for field, floor, worse in measured:
+            delta = new[field] - old[field]
+            if delta > floor and new[field] > old[field] * (1 + tolerance):
+                findings.append((worse, f"{label}: {field} {old[field]:.4g} -> {new[field]:.4g}"))
+            elif -delta > floor and new[field] < old[field] * (1 - tolerance):
+                findings.append(("IMPROVEMENT", f"{label}: {field} {old[field]:.4g} -> {new[field]:.4g}"))
+
+        # Iterações e nós são determinísticos: qualquer aumento é mudança de algoritmo
+        for field in ("iterations", "nodes"):
+            if new[field] > old[field]:
+                findings.append(("REGRESSION", f"{label}: {field} {old[field]} -> {new[field]}"))
+            elif new[field] < old[field]:
+                findings.append(("IMPROVEMENT", f"{label}: {field} {old[field]} -> {new[field]}"))
+    return findings
+
+
+# ------------------------------------------------------------------ helpers
+def _runs(instance, args):
+    """Pares ``(nome, run)``; ``run(prepare)`` resolve a instância e devolve ``(solver, objetivo)``.
+
+    ``prepare(solver)``, se dado, é chamado antes de resolver (instrumentação).
+    O objetivo já vem no sentido da instância (``None`` sem solução).
+    """
+    c, A, b = instance["c"], instance["A"], instance["b"]
+
+    def simplex(prepare=None):
+        solver = SimplexSolver()
+        if prepare:
+            prepare(solver)
+        solver.solve(c, A, b, maximize=instance["maximize"], time_limit=args.time_limit)
+        return solver, solver.get_solution()[1] if solver.optimal else None
+    yield "simplex", simplex
+
+    if not instance["integer"]:
+        return
+    # O B&B sempre maximiza: minimização entra com -c (como na página do B&B)
+    sign = 1.0 if instance["maximize"] else -1.0
+    c_max = [sign * v for v in c]
+    for strategy in STRATEGIES:
+        def branch_and_bound(prepare=None, strategy=strategy):
+            solver = BranchBoundSolver()
+            if prepare:
+                prepare(solver)
+            solver.solve(c_max, A, b, node_limit=args.node_limit, strategy=strategy,
+                         time_limit=args.time_limit)
+            return solver, sign * solver.best_value if solver.best_solution is not None else None
+        yield f"bb_{strategy}", branch_and_bound
+
+
+def _measure(run, repeat: int):
+    times = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    # Contagens e memória numa execução à parte, para não distorcer o tempo
+    stats = SolverStats()
+    tracemalloc.start()
+    try:
+        solver, objective = run(prepare=lambda s: instrument(s, stats))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    nodes = len(solver.nodes) if isinstance(solver, BranchBoundSolver) else 0
+    return {
+        "time_s": min(times),
+        "iterations": stats.counters.get("pivots", 0),
+        "nodes": nodes,
+        "peak_bytes": peak,
+        "status": solver.status,
+        "objective": None if objective is None else round(float(objective), 9),
+    }
+
+
+def _same_objective(old, new) -> bool:
+    if old is None or new is None:
+        return old is new
+    return abs(old - new) <= 1e-6 * max(1.0, abs(old))
+
+
+def _meta(args):
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "levels": args.levels,
+        "repeat": args.repeat,
+        "node_limit": args.node_limit,
+    }
+
+
+def _format_row(r) -> str:
+    objective = "-" if r["objective"] is None else f"{r['objective']:.4f}"
+    return (f"{r['id']:<20} {r['solver']:<12} {r['time_s'] * 1000:9.2f} ms "
+            f"{r['iterations']:6d} it {r['nodes']:6d} nós {r['peak_bytes'] / 1024:9.1f} KiB "
+            f"{r['status']:<10} {objective}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Resolução em lote de famílias de PLs que compartilham ``A``.
+
+Cenários que diferem apenas em ``b`` (demanda, capacidade) ou em ``c``
+(preços) costumam ter a mesma base ótima. Aqui a base do primeiro cenário é
+fatorada uma única vez e reaproveitada: cenários em que ela continua ótima
+são resolvidos com produtos matriciais em bloco; os demais partem dela com
+Simplex dual (mudou ``b``) ou primal (mudou ``c``).
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from .simplex_solver import SimplexSolver
+from .warm_start import optimal_basis, reoptimize
+
+
+def solve_batch(
+    c,
+    A: List[List[float]],
+    b,
+    maximize: bool = True,
+    iteration_limit: int = 100,
+) -> Dict[str, np.ndarray]:
+    """Resolve ``Max/Min c_k x s.a. A x <= b_k, x >= 0`` para cada cenário k.
+
+    ``c`` pode ser um vetor (n,) ou uma pilha (K, n); ``b`` um vetor (m,) ou
+    uma pilha (K, m). Vetores são replicados para todos os cenários.
+
+    Retorna um dicionário com arrays empilhados:
+    ``solutions`` (K, n), ``objectives`` (K,), ``status`` (K,) e
+    ``iterations`` (K,) — pivôs gastos após o warm start (0 = base reaproveitada).
+    """
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    C = np.atleast_2d(np.asarray(c, dtype=float))
+    Bs = np.atleast_2d(np.asarray(b, dtype=float))
+    K = max(len(C), len(Bs))
+    if len(C) not in (1, K) or len(Bs) not in (1, K):
+        raise ValueError("c e b devem ter o mesmo número de cenários (ou apenas um).")
+    C = np.broadcast_to(C, (K, n))
+    Bs = np.broadcast_to(Bs, (K, m))
+
+    # Trabalhamos sempre maximizando (mesma convenção do SimplexSolver)
+    C_int = C if maximize else -C
+
+    solutions = np.full((K, n), np.nan)
+    objectives = np.full(K, np.nan)
+    status = np.empty(K, dtype=object)
+    iterations = np.zeros(K, dtype=int)
+
+    basis = optimal_basis(C_int[0], A, Bs[0], iteration_limit)
+    if basis is None:
+        basis = list(range(n, n + m))  # base de folgas
+
+    # Forma padrão [A | I]; a base de referência é fatorada uma única vez
+    A_std = np.hstack([A, np.eye(m)])
+    C_std = np.hstack([C_int, np.zeros((K, m))])
+    B_inv = np.linalg.inv(A_std[:, basis])
+    body = B_inv @ A_std                      # linhas do tableau (comuns a todos)
+
+    X_B = Bs @ B_inv.T                        # (K, m) valores básicos
+    C_B = C_std[:, basis]                     # (K, m)
+    reduced = (C_B @ B_inv) @ A_std - C_std   # (K, N) custos reduzidos
+    z = np.einsum("km,km->k", C_B, X_B)
+
+    primal_ok = np.all(X_B >= -1e-9, axis=1)
+    dual_ok = np.all(reduced >= -1e-7, axis=1)
+    direct = primal_ok & dual_ok
+
+    # Cenários em que a base de referência já é ótima: sem nenhum pivô
+    full = np.zeros((int(direct.sum()), n + m))
+    full[:, basis] = X_B[direct]
+    solutions[direct] = full[:, :n]
+    objectives[direct] = z[direct]
+    status[direct] = "optimal"
+
+    # Demais cenários: warm start a partir da mesma base
+    for k in np.where(~direct)[0]:
+        T = np.empty((m + 1, n + m + 1))
+        T[0, :-1] = reduced[k]
+        T[0, -1] = z[k]
+        T[1:, :-1] = body
+        T[1:, -1] = X_B[k]
+        scenario_basis = list(basis)
+        outcome, T, its = reoptimize(T, scenario_basis, iteration_limit)
+
+        if outcome in ("cold", "iteration_limit"):
+            outcome, sol, val, its = _cold_solve(C_int[k], A, Bs[k], iteration_limit)
+            if sol is not None:
+                solutions[k] = sol
+                objectives[k] = val
+        elif outcome == "optimal":
+            full = np.zeros(n + m)
+            full[scenario_basis] = T[1:, -1]
+            solutions[k] = full[:n]
+            objectives[k] = T[0, -1]
+        status[k] = outcome
+        iterations[k] = its
+
+    if not maximize:
+        objectives = -objectives
+
+    return {
+        "solutions": solutions,
+        "objectives": objectives,
+        "status": status,
+        "iterations": iterations,
+    }
+
+
+def _cold_solve(c, A, b, iteration_limit):
+    """Resolução completa (Big-M) de um cenário em que o warm start não se aplica."""
+    solver = SimplexSolver()
+    solver.solve(list(c), A.tolist(), list(b), maximize=True, iteration_limit=iteration_limit)
+    its = sum(1 for p in solver.pivots if p != (-1, -1))
+    if solver.optimal:
+        sol, z = solver.get_solution()
+        return "optimal", np.asarray(sol), z, its
+    if solver.unbounded:
+        return "unbounded", None, None, its
+    if solver.infeasible:
+        return "infeasible", None, None, its
+    return "iteration_limit", None, None, its
@@ -3,9 +3,15 @@ from __future__ import annotations
 
 import math
 from copy import deepcopy
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
+from .cancellation import CancellationToken, make_deadline, remaining_time, stop_requested
+from .events import FinishedEvent, IncumbentEvent, NodeProcessedEvent, PrunedEvent
 from .simplex_solver import SimplexSolver
+from .tree_export import TreeSink
+
+# Motivos de parada que interrompem a relaxação no meio (resultado parcial)
+_INTERRUPTED = ("time_limit", "cancelled")
 
 
 class BranchBoundSolver:
@@ -18,6 +24,17 @@ class BranchBoundSolver:
         self.best_solution: List[float] | None = None
         self.best_value: float = float("-inf")
         self.steps: List[str] = []
+        # Parada antecipada: "node_limit", "time_limit" ou "cancelled"
+        self.stop_reason: str | None = None
+        self.cancel_token: CancellationToken | None = None
+        self._deadline: float | None = None
+        # Histórico (steps e nós encerrados) ou apenas nós em aberto
+        self.keep_history: bool = True
+        # Eventos pendentes para iter_solve (None = ninguém consumindo)
+        self._pending_events = None
+        # Exportação incremental dos nós (ver core.tree_export) e nós ainda não gravados
+        self.sink: TreeSink | None = None
+        self._live: set = set()
 
     # ------------------------------------------------------------------ PUBLIC API
     # ------------------------------------------------------------------ PUBLIC API
@@ -29,13 +46,36 @@ class BranchBoundSolver:
         integer_vars: List[int] | None = None,
         node_limit: int = 100,
         strategy: str = "BFS",
+        time_limit: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        keep_history: bool = True,
+        sink: TreeSink | None = None,
     ) -> None:
-        """Inicializa o solver para execução passo a passo."""
+        """Inicializa o solver para execução passo a passo.
+
+        ``time_limit`` (segundos) e ``cancel_token`` valem para toda a árvore,
+        inclusive dentro das relaxações; ao dispararem, o solver para com
+        ``stop_reason`` preenchido, mantendo o melhor incumbente e os nós já criados.
+
+        Com ``keep_history=False`` os ``steps`` não são registrados e nós
+        encerrados são liberados (``self.nodes[id]`` vira ``None``); só os nós
+        em aberto e o incumbente ficam em memória.
+
+        ``sink`` (ver ``core.tree_export``) recebe cada nó uma vez, ao ser
+        encerrado, e os nós ainda em aberto quando a resolução termina; o
+        solver não o fecha nem o guarda depois de terminar.
+        """
         # Reset state ---------------------------------------------------
         self.nodes.clear()
         self.steps.clear()
         self.best_solution = None
         self.best_value = float("-inf")
+        self.stop_reason = None
+        self.cancel_token = cancel_token
+        self._deadline = make_deadline(time_limit)
+        self.keep_history = keep_history
+        self.sink = sink
+        self._live = set()
         
         # Store problem data
         self.c = c
@@ -51,14 +91,16 @@ class BranchBoundSolver:
         self.finished = False
 
         # ----------------------------------------------------------- Raiz
-        root_simplex = SimplexSolver()
-        root_simplex.solve(self.c, self.A, self.b, maximize=True)
+        root_simplex = self._relax(self.A, self.b)
+        if root_simplex.stop_reason in _INTERRUPTED:
+            self._stop(root_simplex.stop_reason)
+            return
         if not root_simplex.optimal or root_simplex.unbounded:
-            self.steps.append({
+            self._log({
                 "key": "bab.log.relaxed_infeasible",
                 "params": []
             })
-            self.finished = True
+            self._finish()
             return
 
         root_sol, root_val = root_simplex.get_solution()
@@ -72,11 +114,13 @@ class BranchBoundSolver:
         )
         if self._is_int(root_sol, self.integer_vars):
             self.best_solution, self.best_value = root_sol, root_val
-            self.steps.append({
+            self._log({
                 "key": "bab.log.integer_root",
                 "params": []
             })
-            self.finished = True
+            self._new_incumbent(0)
+            self._fathom(0, "integer")
+            self._finish()
             return
 
         self.queue.append(0)
@@ -87,7 +131,15 @@ class BranchBoundSolver:
             return False
             
         if not self.queue or self.next_id >= self.node_limit:
-            self.finished = True
+            if self.queue:
+                self.stop_reason = "node_limit"
+            self._finish()
+            return False
+
+        # Prazo e cancelamento cooperativo (verificados antes de cada nó)
+        reason = stop_requested(self.cancel_token, self._deadline)
+        if reason is not None:
+            self._stop(reason)
             return False
 
         # Seleção do nó baseado na estratégia
@@ -106,6 +158,7 @@ class BranchBoundSolver:
             # Se podado, apenas retornamos True para tentar o próximo na próxima chamada
             # Mas marcamos como processado se não estava
             node["processed"] = True
+            self._fathom(current_id, "bound")
             return True
             
         node["processed"] = True
@@ -114,8 +167,13 @@ class BranchBoundSolver:
         if frac_idx == -1: 
             return True
 
+        if self._pending_events is not None:
+            self._pending_events.append(
+                NodeProcessedEvent(current_id, node["parent"], node["value"], frac_idx)
+            )
+
         x_val = node["solution"][frac_idx]
-        self.steps.append({
+        self._log({
             "key": "bab.log.branch",
             "params": [frac_idx+1, x_val]
         })
@@ -125,11 +183,13 @@ class BranchBoundSolver:
             new_bounds[frac_idx] = (op, bound)
 
             sub_A, sub_b = self._apply_bounds(self.A, self.b, new_bounds)
-            relax = SimplexSolver()
-            relax.solve(self.c, sub_A, sub_b, maximize=True)
+            relax = self._relax(sub_A, sub_b)
+            if relax.stop_reason in _INTERRUPTED:
+                self._stop(relax.stop_reason)
+                return False
 
             if not relax.optimal or relax.unbounded:
-                self.steps.append({
+                self._log({
                     "key": "bab.log.sub_infeasible",
                     "params": [frac_idx+1, op, bound]
                 })
@@ -143,6 +203,7 @@ class BranchBoundSolver:
                     int_vars=self.integer_vars,
                     branch_reason=f"x{frac_idx+1} {op} {bound:.0f}"
                 )
+                self._fathom(self.next_id, "infeasible")
                 self.next_id += 1
                 continue
 
@@ -160,16 +221,24 @@ class BranchBoundSolver:
             # actualização da melhor solução inteira
             if new_node["integer_feasible"] and sub_val > self.best_value:
                 self.best_solution, self.best_value = sub_sol, sub_val
-                self.steps.append({
+                self._log({
                     "key": "bab.log.update_best",
                     "params": [sub_val]
                 })
+                self._new_incumbent(self.next_id)
             # Enfileira nós fracionários promissores
             elif not new_node["integer_feasible"] and sub_val > self.best_value:
                 self.queue.append(self.next_id)
 
+            if new_node["integer_feasible"]:
+                self._fathom(self.next_id, "integer")
+            elif sub_val <= self.best_value:
+                self._fathom(self.next_id, "bound")
+
             self.next_id += 1
-            
+
+        # Nó ramificado: encerrado (liberado se não guardamos histórico)
+        self._release(current_id)
         return True
 
     def solve(
@@ -180,13 +249,107 @@ class BranchBoundSolver:
         integer_vars: List[int] | None = None,
         node_limit: int = 100,
         strategy: str = "BFS",
+        time_limit: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        keep_history: bool = True,
+        sink: TreeSink | None = None,
     ) -> None:
         """Resolve o PLI por Branch & Bound."""
-        self.initialize(c, A, b, integer_vars, node_limit, strategy)
+        self.initialize(c, A, b, integer_vars, node_limit, strategy, time_limit, cancel_token, keep_history, sink)
         while self.step():
             pass
 
+    def iter_solve(self, c, A, b, **options) -> Iterator:
+        """Resolve como ``solve()``, gerando eventos à medida que a árvore cresce.
+
+        Gera ``NodeProcessedEvent``, ``PrunedEvent`` e ``IncumbentEvent`` e
+        termina com um ``FinishedEvent``. Aceita as opções de ``initialize``;
+        o consumidor pode parar a qualquer momento.
+        """
+        self._pending_events = []
+        try:
+            self.initialize(c, A, b, **options)
+            running = True
+            while running:
+                yield from self._pending_events
+                self._pending_events.clear()
+                running = self.step()
+            yield from self._pending_events
+            objective = float(self.best_value) if self.best_solution is not None else None
+            yield FinishedEvent(self.status, objective, len(self.nodes))
+        finally:
+            self._pending_events = None
+
+    @property
+    def status(self) -> str:
+        """``"optimal"``, ``"infeasible"``, motivo de parada ou ``"running"``."""
+        if self.stop_reason is not None:
+            return self.stop_reason
+        if not self.finished:
+            return "running"
+        return "optimal" if self.best_solution is not None else "infeasible"
+
     # ------------------------------------------------------------------ helpers
+    def _relax(self, A: List[List[float]], b: List[float]) -> SimplexSolver:
+        """Resolve a relaxação linear de um nó (restrições de ramificação já em A, b)."""
+        # Relaxações são descartadas após criar o nó: sem histórico de tableaux
+        relax = self._new_simplex()
+        relax.solve(self.c, A, b, maximize=True, keep_history=False, **self._limits())
+        return relax
+
+    def _new_simplex(self) -> SimplexSolver:
+        return SimplexSolver()
+
+    def _limits(self) -> Dict:
+        """Prazo restante e token repassados a cada relaxação."""
+        return {"time_limit": remaining_time(self._deadline), "cancel_token": self.cancel_token}
+
+    def _log(self, step: Dict) -> None:
+        if self.keep_history:
+            self.steps.append(step)
+
+    def _new_incumbent(self, node_id: int) -> None:
+        if self._pending_events is not None:
+            self._pending_events.append(
+                IncumbentEvent(node_id, self.best_value, list(self.best_solution))
+            )
+
+    def _fathom(self, node_id: int, reason: str) -> None:
+        """Encerra o nó sem ramificar: ``"bound"``, ``"infeasible"`` ou ``"integer"``."""
+        node = self.nodes[node_id]
+        node["pruned"] = reason
+        if self._pending_events is not None:
+            self._pending_events.append(PrunedEvent(node_id, reason, node["value"]))
+        self._release(node_id)
+
+    def _release(self, node_id: int) -> None:
+        """Nó encerrado: vai para o sink e, sem histórico, sai da memória (os ids continuam válidos)."""
+        self._live.discard(node_id)
+        if self.sink is not None:
+            self.sink.write(self.nodes[node_id])
+        if not self.keep_history:
+            self.nodes[node_id] = None
+
+    def _finish(self) -> None:
+        """Marca o fim da resolução; nós ainda em aberto vão para o sink."""
+        self.finished = True
+        if self.sink is not None:
+            for node_id in sorted(self._live):
+                self.sink.write(self.nodes[node_id])
+            self.sink.flush()
+            # Sem referência ao arquivo: o solver continua serializável (cache em disco)
+            self.sink = None
+        self._live.clear()
+
+    def _stop(self, reason: str) -> None:
+        """Encerra por prazo/cancelamento mantendo o resultado parcial."""
+        self._log({
+            "key": f"bab.log.stopped_{reason}",
+            "params": [len(self.nodes)]
+        })
+        self.stop_reason = reason
+        self._finish()
+
     def _add_node(
         self,
         node_id: int,
@@ -216,6 +379,7 @@ class BranchBoundSolver:
             "branch_reason": branch_reason,
         }
         self.nodes.append(node)
+        self._live.add(node_id)
         return node
 
     @staticmethod
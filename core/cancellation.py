@@ -0,0 +1,54 @@
+"""Prazos (tempo de parede) e cancelamento cooperativo dos solvers.
+
+Os solvers verificam estes sinais dentro de ``step()``; ao disparar, param
+de forma limpa, registram o motivo em ``stop_reason`` e mantêm o resultado
+parcial (último tableau, melhor incumbente, árvore até ali).
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class CancellationToken:
+    """Sinal de cancelamento compartilhável entre threads (ex.: botão da UI)."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    # O Event não é serializável: um solver salvo (pickle) leva só o estado
+    def __getstate__(self) -> dict:
+        return {"cancelled": self.cancelled}
+
+    def __setstate__(self, state: dict) -> None:
+        self._event = threading.Event()
+        if state["cancelled"]:
+            self._event.set()
+
+
+def make_deadline(time_limit: Optional[float]) -> Optional[float]:
+    """Instante (``time.perf_counter``) em que o limite de tempo expira."""
+    return None if time_limit is None else time.perf_counter() + time_limit
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """Segundos restantes até ``deadline`` (``None`` = sem limite)."""
+    return None if deadline is None else max(0.0, deadline - time.perf_counter())
+
+
+def stop_requested(
+    cancel_token: Optional[CancellationToken], deadline: Optional[float]
+) -> Optional[str]:
+    """Motivo de parada (``"cancelled"`` ou ``"time_limit"``) ou ``None``."""
+    if cancel_token is not None and cancel_token.cancelled:
+        return "cancelled"
+    if deadline is not None and time.perf_counter() >= deadline:
+        return "time_limit"
+    return None
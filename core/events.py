@@ -0,0 +1,49 @@
+"""Eventos leves emitidos por ``iter_solve()`` dos solvers.
+
+São tuplas nomeadas imutáveis, criadas apenas quando há um consumidor
+(``iter_solve``); em ``solve()``/``step()`` nenhum evento é construído.
+Valores de objetivo seguem a convenção de cada solver: o ``SimplexSolver``
+informa Z no sentido do usuário (Max/Min) e o ``BranchBoundSolver`` o valor
+da relaxação (sempre maximizando).
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class PivotEvent(NamedTuple):
+    """Pivô do Simplex (já aplicado)."""
+    iteration: int
+    entering: str
+    leaving: str
+    pivot: Tuple[int, int]
+    objective: float
+    degenerate: bool
+
+
+class NodeProcessedEvent(NamedTuple):
+    """Nó do B&B retirado da fila e ramificado em ``x[branch_var]``."""
+    node_id: int
+    parent: Optional[int]
+    value: float
+    branch_var: int
+
+
+class PrunedEvent(NamedTuple):
+    """Nó do B&B encerrado: ``"bound"``, ``"infeasible"`` ou ``"integer"``."""
+    node_id: int
+    reason: str
+    value: float
+
+
+class IncumbentEvent(NamedTuple):
+    """Nova melhor solução inteira."""
+    node_id: int
+    value: float
+    solution: List[float]
+
+
+class FinishedEvent(NamedTuple):
+    """Último evento: status final (``solver.status``) e objetivo, se houver."""
+    status: str
+    objective: Optional[float]
+    iterations: int
@@ -0,0 +1,144 @@
+from fractions import Fraction
+from math import lcm
+from typing import List
+
+import numpy as np
+
+# Acima deste módulo os produtos p * N podem estourar int64; passamos a inteiros Python
+_INT64_SAFE = 2 ** 30
+
+
+class ExactTableau:
+    """Tableau exato: matriz inteira ``N`` e denominador comum ``d`` (T = N / d).
+
+    Pivoteamento livre de frações (Bareiss / Edmonds): a cada pivô em
+    ``p = N[r, k]``, ``N' = (p N - N[:, k] N[r]) / d`` com divisão exata e
+    ``d' = p``. Nenhuma fração é criada durante as iterações.
+
+    Entradas racionais: cada linha é multiplicada pelo MMC dos seus
+    denominadores e a coluna básica da linha é reescalada para continuar
+    unitária (a base inicial precisa ser a identidade para a divisão ser
+    exata). Essas escalas de variáveis são desfeitas ao exibir o tableau.
+    """
+
+    def __init__(self, T, basis: List[int]) -> None:
+        rows, cols = T.shape
+        T = np.array([[Fraction(v) for v in row] for row in T], dtype=object)
+
+        # Escala por linha (z escalado na linha 0) e por coluna (variáveis básicas)
+        self.row_scale = [lcm(*(v.denominator for v in T[i])) for i in range(rows)]
+        self.col_scale = [1] * (cols - 1)
+        for i, var in enumerate(basis):
+            self.col_scale[var] = self.row_scale[i + 1]
+
+        N = np.empty((rows, cols), dtype=object)
+        for i in range(rows):
+            for j in range(cols):
+                scale = self.col_scale[j] if j < cols - 1 else 1
+                N[i, j] = int(T[i, j] * self.row_scale[i] / scale)
+
+        self.N = N
+        self.d = 1
+        self.basis = list(basis)
+        self._shrink()
+
+    # ------------------------------------------------------------------ pivô
+    def pivot(self, pr: int, pc: int) -> None:
+        """Pivô de Bareiss em ``(pr, pc)``; atualiza ``N``, ``d`` e a base."""
+        N = self.N
+        p = N[pr, pc]
+        N2 = (p * N - np.outer(N[:, pc], N[pr])) // self.d
+        N2[pr] = N[pr]
+        self.N = N2
+        self.d = int(p)
+        self.basis[pr - 1] = pc
+        self._grow_or_shrink()
+
+    def is_optimal(self) -> bool:
+        # d > 0 sempre (pivôs do Simplex são positivos), então basta o sinal de N
+        return bool(np.all(self.N[0, :-1] >= 0))
+
+    def pivot_col(self) -> int:
+        """Dantzig nos custos reduzidos verdadeiros ``N[0, j] * s_j`` (mesma escala)."""
+        costs = self.N[0, :-1]
+        if any(scale != 1 for scale in self.col_scale):
+            costs = costs.astype(object) * np.array(self.col_scale, dtype=object)
+        candidates = np.where(costs < 0)[0]
+        if len(candidates) == 0:
+            return -1
+        return int(candidates[np.argmin(costs[candidates])])
+
+    def pivot_row(self, pc: int, lex_cols=None) -> int:
+        """Teste da razão mínima exato: compara ``N[i, -1] / N[i, pc]`` sem arredondamento.
+
+        Com ``lex_cols``, empates são desfeitos pela regra lexicográfica
+        (razões ``N[i, j] / N[i, pc]`` nas colunas dadas, em ordem). A escala
+        de cada coluna é comum a todas as linhas e não altera a comparação.
+        """
+        rows = [i for i in range(1, self.N.shape[0]) if int(self.N[i, pc]) > 0]
+        if not rows:
+            return -1
+        for j in [-1] + list(lex_cols or []):
+            ratios = {i: Fraction(int(self.N[i, j]), int(self.N[i, pc])) for i in rows}
+            best = min(ratios.values())
+            rows = [i for i in rows if ratios[i] == best]
+            if len(rows) == 1:
+                break
+        return rows[0]
+
+    def is_degenerate(self, row: int) -> bool:
+        """Pivô na linha ``row`` não muda o objetivo (variável básica nula)."""
+        return int(self.N[row, -1]) == 0
+
+    def basic_value(self, row: int) -> Fraction:
+        """Valor exato da variável básica da linha ``row`` (1..m)."""
+        var = self.basis[row - 1]
+        return Fraction(int(self.N[row, -1]), int(self.d) * self.col_scale[var])
+
+    # ------------------------------------------------------------------ exibição
+    def snapshot(self):
+        """Cópia leve do estado (N, d, base) para reconstruir o tableau depois."""
+        return self.N.copy(), self.d, tuple(self.basis)
+
+    def to_fractions(self, snapshot=None) -> np.ndarray:
+        """Tableau exato em ``Fraction`` (mesmo layout do tableau em float)."""
+        N, d, basis = snapshot if snapshot is not None else self.snapshot()
+        rows, cols = N.shape
+        T = np.empty((rows, cols), dtype=object)
+        for i in range(rows):
+            row_div = int(d) * (self.row_scale[0] if i == 0 else self.col_scale[basis[i - 1]])
+            for j in range(cols):
+                scale = self.col_scale[j] if j < cols - 1 else 1
+                T[i, j] = Fraction(int(N[i, j]) * scale, row_div)
+        return T
+
+    def to_float(self) -> np.ndarray:
+        """Tableau em float (para exibição e compatibilidade com o restante do solver)."""
+        T = self.N.astype(float)
+        T[:, :-1] *= np.array(self.col_scale, dtype=float)
+        row_div = np.array([self.row_scale[0]] + [self.col_scale[v] for v in self.basis], dtype=float)
+        return T / (row_div[:, None] * float(self.d))
+
+    # ------------------------------------------------------------------ helpers
+    def _shrink(self) -> None:
+        """Usa int64 enquanto os valores forem pequenos (velocidade de inteiro nativo)."""
+        if self.N.dtype == object and _max_abs(self.N) < _INT64_SAFE and abs(self.d) < _INT64_SAFE:
+            self.N = self.N.astype(np.int64)
+            self.d = int(self.d)
+
+    def _grow_or_shrink(self) -> None:
+        if self.N.dtype != object and (_max_abs(self.N) >= _INT64_SAFE or abs(self.d) >= _INT64_SAFE):
+            self.N = self.N.astype(object)
+        else:
+            self._shrink()
+
+
+def _max_abs(N) -> int:
+    return int(max(abs(int(N.max())), abs(int(N.min()))))
+
+
+def to_fraction(value) -> Fraction:
+    """Converte a entrada para racional usando a representação decimal (0.1 -> 1/10)."""
+    if isinstance(value, Fraction):
+        return value
+    return Fraction(str(float(value)))
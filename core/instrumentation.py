@@ -0,0 +1,137 @@
+"""Instrumentação opcional dos solvers: temporizadores, contadores e cProfile.
+
+``instrument(solver)`` envolve, *apenas na instância*, os pontos de
+precificação, teste da razão, pivô e registro do ``SimplexSolver`` (e a
+relaxação, a criação e a poda de nós do ``BranchBoundSolver``). Sem chamar
+``instrument``, nada é instalado e a resolução não tem custo extra algum.
+
+Exemplo::
+
+    solver = BranchBoundSolver()
+    stats = instrument(solver)
+    solver.solve(c, A, b)
+    print(stats.to_json(indent=2))
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from collections import defaultdict
+from typing import Dict, Tuple
+
+from .branch_bound_solver import BranchBoundSolver
+from .simplex_solver import SimplexSolver
+
+
+class SolverStats:
+    """Tempos acumulados (segundos), contadores e amostras de uma ou mais resoluções."""
+
+    def __init__(self) -> None:
+        self.timers: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, int] = defaultdict(int)
+        # Uma duração por ocorrência (ex.: "lp_solve" = uma por nó do B&B)
+        self.samples: Dict[str, list] = defaultdict(list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "timers": dict(self.timers),
+            "counters": dict(self.counters),
+            "samples": {name: list(values) for name, values in self.samples.items()},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def instrument(solver, stats: SolverStats | None = None) -> SolverStats:
+    """Instala temporizadores e contadores em ``solver`` e devolve o ``SolverStats``.
+
+    SimplexSolver — tempos ``pricing``, ``ratio_test``, ``pivot``,
+    ``logging``; contadores ``pivots``, ``degenerate_pivots`` e
+    ``tableau_copies``.
+    BranchBoundSolver — tempo ``lp_solve`` (com uma amostra por nó) e
+    ``logging``; contadores ``lp_solves``, ``nodes`` e ``pruned_<motivo>``.
+    As relaxações do B&B são instrumentadas com o mesmo ``stats``.
+
+    Vale para todas as resoluções seguintes da mesma instância.
+    """
+    stats = stats if stats is not None else SolverStats()
+    if isinstance(solver, BranchBoundSolver):
+        _instrument_branch_bound(solver, stats)
+    elif isinstance(solver, SimplexSolver):
+        _instrument_simplex(solver, stats)
+    else:
+        raise TypeError(f"Solver não suportado: {type(solver).__name__}")
+    return stats
+
+
+def profile_call(func, *args, sort: str = "cumulative", limit: int = 25, **kwargs) -> Tuple[object, str]:
+    """Executa ``func(*args, **kwargs)`` sob ``cProfile``.
+
+    Retorna ``(resultado, relatório)``, com o relatório do ``pstats``
+    ordenado por ``sort`` e limitado às ``limit`` primeiras funções.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+    return result, out.getvalue()
+
+
+# ------------------------------------------------------------------ helpers
+def _timed(stats, timer, func, counter=None, sample=False):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.timers[timer] += elapsed
+            if counter is not None:
+                stats.counters[counter] += 1
+            if sample:
+                stats.samples[timer].append(elapsed)
+    return wrapper
+
+
+def _instrument_simplex(solver, stats):
+    is_degenerate = solver._is_degenerate
+
+    def counted_is_degenerate(T, pr):
+        degenerate = is_degenerate(T, pr)
+        if degenerate:
+            stats.counters["degenerate_pivots"] += 1
+        return degenerate
+
+    solver._select_pivot_col = _timed(stats, "pricing", solver._select_pivot_col)
+    solver._select_pivot_row = _timed(stats, "ratio_test", solver._select_pivot_row)
+    solver._apply_pivot = _timed(stats, "pivot", solver._apply_pivot, counter="pivots")
+    solver._is_degenerate = counted_is_degenerate
+    # Cada registro de estado guarda uma cópia do tableau
+    solver._log_state = _timed(stats, "logging", solver._log_state, counter="tableau_copies")
+
+
+def _instrument_branch_bound(solver, stats):
+    add_node = solver._add_node
+    fathom = solver._fathom
+
+    def counted_add_node(*args, **kwargs):
+        stats.counters["nodes"] += 1
+        return add_node(*args, **kwargs)
+
+    def counted_fathom(node_id, reason):
+        stats.counters[f"pruned_{reason}"] += 1
+        return fathom(node_id, reason)
+
+    def new_simplex():
+        relax = SimplexSolver()
+        _instrument_simplex(relax, stats)
+        return relax
+
+    solver._relax = _timed(stats, "lp_solve", solver._relax, counter="lp_solves", sample=True)
+    solver._new_simplex = new_simplex
+    solver._add_node = counted_add_node
+    solver._fathom = counted_fathom
+    solver._log = _timed(stats, "logging", solver._log)
@@ -0,0 +1,185 @@
+from typing import List
+
+import numpy as np
+
+from .cancellation import CancellationToken, stop_requested
+from .simplex_solver import SimplexSolver
+from .warm_start import reoptimize, tableau_from_basis
+
+
+class InteriorPointSolver(SimplexSolver):
+    """Pontos interiores primal-dual (preditor-corretor de Mehrotra) com crossover.
+
+    Segunda engine de PL, com a mesma entrada do ``SimplexSolver``:
+    * Resolve ``Max cx s.a. [A | I] z = b, z >= 0`` por pontos interiores,
+      com Cholesky nas equações normais ``A D Aᵀ``.
+    * O crossover escolhe uma base a partir do ponto interior, reconstrói o
+      tableau do Big-M nessa base e finaliza com Simplex primal/dual, então
+      ``get_basis_info`` e a análise de sensibilidade continuam valendo.
+    * Se o ponto interior não convergir (inviável, ilimitado ou numérico),
+      recorre ao Simplex Big-M completo, que classifica o problema.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ipm_iterations: int = 0
+        self.ipm_converged: bool = False
+        self.crossover_pivots: int = 0
+
+    # ------------------------------------------------------------------
+    def solve(
+        self,
+        c: List[float],
+        A: List[List[float]],
+        b: List[float],
+        maximize: bool = True,
+        iteration_limit: int = 100,
+        ipm_iteration_limit: int = 100,
+        tol: float = 1e-8,
+        time_limit: float | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> None:
+        # Tableau Big-M, nomes e metadados idênticos aos do SimplexSolver
+        self.initialize(c, A, b, maximize, iteration_limit, time_limit=time_limit, cancel_token=cancel_token)
+
+        A_arr = np.asarray(A, dtype=float)
+        m, n = A_arr.shape
+        A_std = np.hstack([A_arr, np.eye(m)])
+        # Pontos interiores na forma min: custo -c (c interno já é de maximização)
+        cost = np.concatenate([-np.asarray(self.original_c, dtype=float), np.zeros(m)])
+        x, s, converged, its = self._mehrotra(
+            A_std, np.asarray(b, dtype=float), cost, ipm_iteration_limit, tol,
+            stop=lambda: stop_requested(self.cancel_token, self._deadline),
+        )
+        self.ipm_iterations = its
+        self.ipm_converged = converged
+
+        if converged:
+            basis = self._crossover_basis(A_std, x, s)
+            T = tableau_from_basis(self.T, basis)
+            status, T, pivots = reoptimize(T, basis, iteration_limit)
+            if status == "optimal":
+                self.crossover_pivots = pivots
+                self.T = T
+                self._current_basis = basis
+                step_dict = {"key": "simplex.log.ipm_crossover", "params": []}
+                desc_dict = {
+                    "key": "simplex.log.ipm_crossover_desc",
+                    "params": [its, pivots],
+                }
+                self._log_state(T, step_dict, desc_dict, (-1, -1))
+
+        # Finaliza (ótimo após crossover) ou resolve pelo Simplex Big-M;
+        # prazo/cancelamento já disparados encerram no primeiro step()
+        while self.step():
+            pass
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _mehrotra(A, b, c, iteration_limit, tol, stop=None):
+        """Preditor-corretor de Mehrotra para ``min cx s.a. Ax = b, x >= 0``.
+
+        ``stop`` (opcional) é consultado a cada iteração e interrompe sem
+        convergência. Retorna ``(x, s, convergiu, iterações)``.
+        """
+        N = A.shape[1]
+
+        # Ponto inicial de Mehrotra
+        solve = _normal_solver(A, np.ones(N))
+        x = A.T @ solve(b)
+        y = solve(A @ c)
+        s = c - A.T @ y
+        x += max(-1.5 * x.min(), 0.0)
+        s += max(-1.5 * s.min(), 0.0)
+        xs = x @ s
+        x += 0.5 * xs / max(s.sum(), 1e-12)
+        s += 0.5 * xs / max(x.sum(), 1e-12)
+        x = np.maximum(x, 1e-8)
+        s = np.maximum(s, 1e-8)
+
+        norm_b, norm_c = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(c)
+        for it in range(iteration_limit):
+            rp = b - A @ x
+            rd = c - A.T @ y - s
+            mu = x @ s / N
+            gap = abs(c @ x - b @ y) / (1.0 + abs(c @ x))
+            if np.linalg.norm(rp) / norm_b < tol and np.linalg.norm(rd) / norm_c < tol and gap < tol:
+                return x, s, True, it
+            if stop is not None and stop():
+                return x, s, False, it
+            # Iterados explodindo indicam problema inviável ou ilimitado
+            if not np.all(np.isfinite(x)) or np.abs(x).max() > 1e12 or np.abs(y).max() > 1e12:
+                return x, s, False, it
+
+            d = x / s
+            solve = _normal_solver(A, d)
+
+            def direction(rxs):
+                # A dx = rp, Aᵀdy + ds = rd, S dx + X ds = rxs
+                dy = solve(rp - A @ (rxs / s - d * rd))
+                ds = rd - A.T @ dy
+                dx = rxs / s - d * ds
+                return dx, dy, ds
+
+            # Preditor (afim)
+            dx_a, dy_a, ds_a = direction(-x * s)
+            ap = _step_length(x, dx_a)
+            ad = _step_length(s, ds_a)
+            mu_aff = (x + ap * dx_a) @ (s + ad * ds_a) / N
+            sigma = (mu_aff / mu) ** 3
+
+            # Corretor (centralidade + termo de segunda ordem)
+            dx, dy, ds = direction(-x * s - dx_a * ds_a + sigma * mu)
+            ap = min(1.0, 0.99 * _step_length(x, dx, np.inf))
+            ad = min(1.0, 0.99 * _step_length(s, ds, np.inf))
+            x = x + ap * dx
+            y = y + ad * dy
+            s = s + ad * ds
+        return x, s, False, iteration_limit
+
+    def _crossover_basis(self, A_std, x, s) -> List[int]:
+        """Escolhe m colunas independentes priorizando as mais 'básicas' (x_j grande).
+
+        Índices da forma padrão [A | I] coincidem com o layout do tableau Big-M
+        (x em 0..n-1, folga/excesso da linha i em n+i).
+        """
+        m = A_std.shape[0]
+        order = np.argsort(-(x / (x + s)))
+        Q = np.zeros((m, 0))
+        basis = []
+        for j in order:
+            col = A_std[:, j]
+            residual = col - Q @ (Q.T @ col)
+            norm = np.linalg.norm(residual)
+            if norm > 1e-8 * max(1.0, np.linalg.norm(col)):
+                Q = np.column_stack([Q, residual / norm])
+                basis.append(int(j))
+                if len(basis) == m:
+                    break
+        return basis
+
+
+def _normal_solver(A, d):
+    """Fatora ``A D Aᵀ`` por Cholesky e devolve uma função que resolve o sistema.
+
+    Uma regularização mínima é somada à diagonal se a matriz não for
+    numericamente definida positiva (comum perto do ótimo).
+    """
+    M = (A * d) @ A.T
+    eye = np.eye(M.shape[0])
+    reg = 0.0
+    while True:
+        try:
+            L = np.linalg.cholesky(M + reg * eye)
+            break
+        except np.linalg.LinAlgError:
+            reg = max(reg * 10, 1e-12 * max(1.0, np.abs(M).max()))
+    return lambda r: np.linalg.solve(L.T, np.linalg.solve(L, r))
+
+
+def _step_length(v, dv, cap=1.0):
+    """Maior passo α <= cap com v + α dv >= 0."""
+    neg = dv < 0
+    if not np.any(neg):
+        return cap
+    return min(cap, float(np.min(-v[neg] / dv[neg])))
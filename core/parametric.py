@@ -0,0 +1,208 @@
+"""Programação paramétrica: valor ótimo ao longo de ``b + θd`` ou ``c + θd``.
+
+Em vez de reresolver o problema em centenas de pontos, parte-se da base
+ótima em θ = 0 e caminha-se de breakpoint em breakpoint. Entre dois deles a
+base não muda e o valor ótimo é linear em θ; em cada breakpoint a base deixa
+de ser primal viável (RHS) ou dual viável (custos) e um pivô do Simplex dual
+ou primal leva à base do segmento seguinte.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .simplex_solver import SimplexSolver
+from .warm_start import optimal_basis, reoptimize, standard_tableau, tableau_from_basis
+
+
+def parametric_rhs(
+    c: List[float],
+    A: List[List[float]],
+    b: List[float],
+    d: List[float],
+    theta_min: float = 0.0,
+    theta_max: float = 1.0,
+    maximize: bool = True,
+    max_breakpoints: int = 100,
+    basis: Optional[List[int]] = None,
+) -> Dict:
+    """Curva ``z*(θ)`` para ``Max/Min cx s.a. Ax <= b + θd, x >= 0``.
+
+    Retorna um dicionário com ``thetas`` e ``values`` (vértices da curva
+    linear por partes), ``solutions`` em cada vértice, ``slopes`` e ``bases``
+    de cada segmento e ``limits`` (``"ok"``, ``"infeasible"`` ou
+    ``"breakpoint_limit"``) indicando por que a curva termina em cada ponta.
+
+    ``basis`` é a base ótima em θ = 0 (colunas de ``[A | I]``, como devolve
+    ``warm_start.solver_basis``); sem ela o problema é resolvido aqui. Várias
+    curvas do mesmo modelo podem partir da mesma base.
+    """
+    return _parametric(c, A, b, d, theta_min, theta_max, maximize, max_breakpoints, _walk_rhs, basis)
+
+
+def parametric_objective(
+    c: List[float],
+    A: List[List[float]],
+    b: List[float],
+    d: List[float],
+    theta_min: float = 0.0,
+    theta_max: float = 1.0,
+    maximize: bool = True,
+    max_breakpoints: int = 100,
+    basis: Optional[List[int]] = None,
+) -> Dict:
+    """Curva ``z*(θ)`` para ``Max/Min (c + θd)x s.a. Ax <= b, x >= 0``.
+
+    Mesmo formato e mesmo ``basis`` de ``parametric_rhs``; ``limits`` pode valer
+    ``"unbounded"`` quando, além de um breakpoint, o objetivo cresce sem limite.
+    """
+    return _parametric(c, A, b, d, theta_min, theta_max, maximize, max_breakpoints, _walk_objective, basis)
+
+
+# ------------------------------------------------------------------ helpers
+def _parametric(c, A, b, d, theta_min, theta_max, maximize, max_breakpoints, walk, basis=None):
+    if theta_min > 0 or theta_max < 0:
+        raise ValueError("O intervalo [theta_min, theta_max] deve conter 0.")
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    sign = 1.0 if maximize else -1.0
+    c_int = sign * np.asarray(c, dtype=float)
+    d = np.asarray(d, dtype=float)
+    # Para minimização, a direção de custo também é invertida (Max -cx)
+    d_int = sign * d if walk is _walk_objective else d
+
+    if basis is None:
+        basis = optimal_basis(c_int, A, b)
+    if basis is None:
+        return {"status": "not_optimal"}
+    basis = list(basis)
+    T = tableau_from_basis(standard_tableau(c_int, A, b), basis)
+    status, T, _ = reoptimize(T, basis)
+    if status != "optimal":
+        return {"status": "not_optimal"}
+
+    names = [f"x{j+1}" for j in range(n)] + [f"s{i+1}" for i in range(m)]
+    up = walk(T, list(basis), d_int, theta_max, max_breakpoints, n)
+    down = walk(T, list(basis), -d_int, -theta_min, max_breakpoints, n)
+
+    # Junta as duas caminhadas: a de -d é espelhada (θ -> -θ, inclinação -> -inclinação)
+    thetas = [-t for t in reversed(down["thetas"][1:])] + up["thetas"]
+    values = list(reversed(down["values"][1:])) + up["values"]
+    solutions = list(reversed(down["solutions"][1:])) + up["solutions"]
+    slopes = [-s for s in reversed(down["slopes"])] + up["slopes"]
+    bases = list(reversed(down["bases"])) + up["bases"]
+
+    return {
+        "status": "optimal",
+        "thetas": np.array(thetas),
+        "values": sign * np.array(values),
+        "solutions": np.array(solutions),
+        "slopes": sign * np.array(slopes),
+        "bases": [[names[i] for i in bs] for bs in bases],
+        "limits": {"lower": down["limit"], "upper": up["limit"]},
+    }
+
+
+def _walk_rhs(T, basis, d, t_end, max_breakpoints, n):
+    """Caminha em θ ∈ [0, t_end] ao longo de ``b + θd`` com pivôs do Simplex dual."""
+    m = len(basis)
+    # As colunas de folga do tableau guardam B^-1 (e os duais y na linha 0):
+    # B^-1 d vira uma segunda coluna de RHS, com dz/dθ = y·d na linha 0
+    M = np.column_stack([T, T[:, n:n + m] @ d])
+    rhs, direction = -2, -1
+
+    theta, pivots = 0.0, 0
+    result = _start(M[0, rhs], _basic_solution(M[1:, rhs], basis, n))
+    if t_end <= 0:
+        return result
+    while True:
+        x_B, d_B = M[1:, rhs], M[1:, direction]
+        falling = np.where(d_B < -1e-12)[0]
+        ratios = np.maximum(x_B[falling] / -d_B[falling], 0.0)
+        step = ratios.min() if len(falling) else np.inf
+        if theta + step >= t_end:
+            M[:, rhs] += (t_end - theta) * M[:, direction]
+            _close(result, t_end, M[0, rhs], M[0, direction], basis, M[1:, rhs], n, "ok")
+            return result
+
+        # Breakpoint: a variável básica da linha r zera e deixa a base
+        M[:, rhs] += step * M[:, direction]
+        theta += step
+        if step > 1e-12:
+            _close(result, theta, M[0, rhs], M[0, direction], basis, M[1:, rhs], n)
+        pr = falling[np.argmin(ratios)] + 1
+        row = M[pr, :rhs]
+        candidates = np.where(row < -1e-9)[0]
+        if len(candidates) == 0:
+            result["limit"] = "infeasible"
+            return result
+        pc = candidates[np.argmin(M[0, candidates] / -row[candidates])]
+        M = SimplexSolver._pivot(M, pr, pc)
+        basis[pr - 1] = int(pc)
+        pivots += 1
+        if pivots >= max_breakpoints:
+            result["limit"] = "breakpoint_limit"
+            return result
+
+
+def _walk_objective(T, basis, d, t_end, max_breakpoints, n):
+    """Caminha em θ ∈ [0, t_end] ao longo de ``c + θd`` com pivôs do Simplex primal."""
+    # Linha extra com os custos reduzidos da direção: r(θ) = r + θ·r_d,
+    # e no RHS dz/dθ = d_B·x_B
+    row = np.zeros(T.shape[1])
+    row[:n] = -d
+    M = np.vstack([T, row - row[basis] @ T[1:]])
+
+    theta, pivots = 0.0, 0
+    result = _start(M[0, -1], _basic_solution(M[1:-1, -1], basis, n))
+    if t_end <= 0:
+        return result
+    while True:
+        r, r_d = M[0, :-1], M[-1, :-1]
+        falling = np.where(r_d < -1e-12)[0]
+        ratios = np.maximum(r[falling] / -r_d[falling], 0.0)
+        step = ratios.min() if len(falling) else np.inf
+        if theta + step >= t_end:
+            M[0] += (t_end - theta) * M[-1]
+            _close(result, t_end, M[0, -1], M[-1, -1], basis, M[1:-1, -1], n, "ok")
+            return result
+
+        # Breakpoint: um custo reduzido zera e a variável entra na base
+        M[0] += step * M[-1]
+        theta += step
+        if step > 1e-12:
+            _close(result, theta, M[0, -1], M[-1, -1], basis, M[1:-1, -1], n)
+        pc = falling[np.argmin(ratios)]
+        pr = SimplexSolver._pivot_row(M[:-1], pc)
+        if pr == -1:
+            result["limit"] = "unbounded"
+            return result
+        M = SimplexSolver._pivot(M, pr, pc)
+        basis[pr - 1] = int(pc)
+        pivots += 1
+        if pivots >= max_breakpoints:
+            result["limit"] = "breakpoint_limit"
+            return result
+
+
+def _basic_solution(x_B, basis, n):
+    """Valores das variáveis de decisão a partir dos valores básicos."""
+    full = np.zeros(max(max(basis) + 1, n))
+    full[basis] = x_B
+    return full[:n]
+
+
+def _start(z, x):
+    """Caminhada que começa em θ = 0 com valor ``z`` e solução ``x``."""
+    return {"thetas": [0.0], "values": [z], "solutions": [x], "slopes": [], "bases": [], "limit": "ok"}
+
+
+def _close(result, theta, z, slope, basis, x_B, n, limit=None):
+    """Fecha o segmento atual no ponto ``theta`` (valor ``z``)."""
+    result["thetas"].append(theta)
+    result["values"].append(z)
+    result["solutions"].append(_basic_solution(x_B, basis, n))
+    result["slopes"].append(slope)
+    result["bases"].append(list(basis))
+    if limit is not None:
+        result["limit"] = limit
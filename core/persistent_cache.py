@@ -0,0 +1,203 @@
+"""Cache de resultados em disco (SQLite), compartilhado entre processos.
+
+Complementa o ``SolveCache`` em memória: cada entrada, indexada por
+``problem_fingerprint``, guarda um resumo em JSON (status, solução,
+objetivo, base e sensibilidade) e, opcionalmente, o *trace* — o objeto
+resolvido inteiro (solver com tableaux, árvore do B&B...) serializado com
+``pickle`` e comprimido com ``zlib``, para a UI reexibir tudo sem resolver.
+
+O arquivo usa WAL, então vários workers do servidor podem ler e gravar ao
+mesmo tempo. A remoção é por idade (``ttl``, em segundos) e por uso
+(LRU pelo último acesso, até ``max_entries``). Como o trace é um pickle,
+o arquivo deve ser local e confiável — nunca aponte para um banco recebido
+de terceiros.
+"""
+
+import json
+import pickle
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .branch_bound_solver import BranchBoundSolver
+from .simplex_solver import SimplexSolver
+
+# Versão do formato do trace: incrementar quando os atributos dos solvers mudarem,
+# para que traces gravados por versões anteriores do código sejam ignorados
+TRACE_VERSION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solves (
+    key      TEXT PRIMARY KEY,
+    status   TEXT,
+    summary  TEXT NOT NULL,
+    trace    BLOB,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL,
+    hits     INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class PersistentSolveCache:
+    """Cache LRU/TTL de resultados num arquivo SQLite.
+
+    ``store_trace=False`` grava apenas o resumo (entradas bem menores, mas
+    ``get`` devolve ``trace=None`` e a UI precisa resolver de novo).
+    """
+
+    def __init__(
+        self,
+        path,
+        max_entries: int = 1000,
+        ttl: Optional[float] = 30 * 24 * 3600,
+        store_trace: bool = True,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser pelo menos 1.")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store_trace = store_trace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+        try:
+            # O modo WAL não pode ser trocado dentro de uma transação
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_SCHEMA)
+            db.execute("CREATE INDEX IF NOT EXISTS solves_accessed ON solves (accessed)")
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """``{"status", "summary", "trace", "hits"}`` ou ``None`` (ausente ou expirada)."""
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT status, summary, trace, created, hits FROM solves WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            status, summary, trace, created, hits = row
+            if self.ttl is not None and now - created > self.ttl:
+                db.execute("DELETE FROM solves WHERE key = ?", (key,))
+                return None
+            db.execute("UPDATE solves SET accessed = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return {
+            "status": status,
+            "summary": json.loads(summary),
+            "trace": _load_trace(trace),
+            "hits": hits + 1,
+        }
+
+    def put(self, key: str, value: Any, summary: Optional[Dict[str, Any]] = None) -> None:
+        """Grava ``value`` (o trace) e seu resumo; ``summary`` padrão: ``summarize(value)``."""
+        summary = summarize(value) if summary is None else summary
+        trace = zlib.compress(pickle.dumps((TRACE_VERSION, value), protocol=pickle.HIGHEST_PROTOCOL)) if self.store_trace else None
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO solves (key, status, summary, trace, created, accessed, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, summary.get("status"), json.dumps(summary, default=_json_default), trace, now, now),
+            )
+            self._evict(db, now)
+
+    def evict(self) -> None:
+        """Remove entradas expiradas e as menos usadas além de ``max_entries``."""
+        with self._connect() as db:
+            self._evict(db, time.time())
+
+    def clear(self) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM solves")
+
+    def __contains__(self, key: str) -> bool:
+        with self._connect() as db:
+            return db.execute("SELECT 1 FROM solves WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM solves").fetchone()[0]
+
+    # ------------------------------------------------------------------ helpers
+    def _connect(self) -> "_Closing":
+        # Uma conexão por operação: seguro entre threads do Streamlit e entre processos
+        db = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+        db.execute("PRAGMA synchronous=NORMAL")
+        return _Closing(db)
+
+    def _evict(self, db, now: float) -> None:
+        if self.ttl is not None:
+            db.execute("DELETE FROM solves WHERE created < ?", (now - self.ttl,))
+        db.execute(
+            "DELETE FROM solves WHERE key IN "
+            "(SELECT key FROM solves ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+def summarize(value) -> Dict[str, Any]:
+    """Resumo serializável de um solver resolvido (ou ``{}`` para outros valores).
+
+    SimplexSolver: ``status``, ``solution``, ``objective`` (sentido do
+    usuário), ``basis`` (nomes das variáveis básicas) e ``sensitivity``.
+    BranchBoundSolver: ``status``, ``solution``, ``objective`` (maximizando)
+    e ``nodes``.
+    """
+    if isinstance(value, BranchBoundSolver):
+        found = value.best_solution is not None
+        return {
+            "status": value.status,
+            "solution": list(value.best_solution) if found else None,
+            "objective": value.best_value if found else None,
+            "nodes": len(value.nodes),
+        }
+    if isinstance(value, SimplexSolver):
+        summary = {"status": value.status, "solution": None, "objective": None, "basis": None, "sensitivity": None}
+        if value.optimal:
+            summary["solution"], summary["objective"] = value.get_solution()
+            summary["basis"] = [value._variable_names[i] for i in value._current_basis]
+            try:
+                summary["sensitivity"] = value.get_sensitivity_analysis()
+            except Exception:
+                pass  # ex.: pontos interiores sem base completa
+        return summary
+    return {}
+
+
+class _Closing:
+    """Context manager que fecha a conexão (o do sqlite3 só encerra a transação)."""
+
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self.db = db
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.db.execute("BEGIN")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.db.close()
+
+
+def _load_trace(blob: Optional[bytes]) -> Any:
+    if blob is None:
+        return None
+    try:
+        version, value = pickle.loads(zlib.decompress(blob))
+    except Exception:
+        return None
+    # Trace de uma versão incompatível do código: trata como ausente
+    return value if version == TRACE_VERSION else None
+
+
+def _json_default(value):
+    # Escalares e arrays do numpy
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
@@ -0,0 +1,98 @@
+"""Cortes e projeções de ``{x : A x <= b, x >= 0}`` em 2 ou 3 variáveis.
+
+Modelos com mais de três variáveis não têm região factível desenhável; aqui
+ela é reduzida às variáveis escolhidas (``dims``) de duas formas:
+
+* **corte** (``slice_constraints``): as demais variáveis ficam fixas num
+  ponto (tipicamente o ótimo), o que dá um polítopo exato nas ``dims``;
+* **projeção** (``projection_constraints``): a sombra da região nas
+  ``dims``, aproximada por fora pela função-suporte
+  ``h(u) = max u·x_dims`` amostrada em várias direções ``u``. Todas as
+  direções formam uma única família de PLs com o mesmo ``A`` e são
+  resolvidas de uma vez com ``solve_batch``; o resultado fica em cache.
+
+Ambas devolvem ``(A_d, b_d)`` no formato ``A_d y <= b_d`` (sem ``y >= 0``,
+que os gráficos já acrescentam).
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .batch_solver import solve_batch
+from .solve_cache import SolveCache, problem_fingerprint
+
+# Direções amostradas por padrão (2D: círculo; 3D: esfera)
+PROJECTION_DIRECTIONS = {2: 48, 3: 128}
+# Funções-suporte já calculadas (por modelo, variáveis e direções)
+_SUPPORT_CACHE = SolveCache(maxsize=32)
+
+
+def slice_constraints(A, b, point, dims: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Restrições nas ``dims`` com as demais variáveis fixas nos valores de ``point``.
+
+    Linhas que não envolvem nenhuma das ``dims`` são descartadas (viram uma
+    constante, satisfeita se ``point`` for factível).
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    point = np.asarray(point, dtype=float)
+    dims = _check_dims(dims, A.shape[1])
+    others = np.setdiff1d(np.arange(A.shape[1]), dims)
+
+    A_d = A[:, dims]
+    b_d = b - A[:, others] @ point[others]
+    keep = np.any(np.abs(A_d) > 1e-12, axis=1)
+    return A_d[keep], b_d[keep]
+
+
+def projection_constraints(A, b, dims: Sequence[int], n_directions=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Aproximação externa da projeção da região nas ``dims``.
+
+    Cada direção ``u`` amostrada (mais os eixos coordenados) vira o
+    semiplano ``u·y <= h(u)``. Direções em que a região é ilimitada não
+    geram restrição. Com mais direções a aproximação fica mais justa.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    dims = _check_dims(dims, A.shape[1])
+    k = len(dims)
+    n_directions = PROJECTION_DIRECTIONS[k] if n_directions is None else int(n_directions)
+
+    key = problem_fingerprint([0.0] * A.shape[1], A, b, dims=dims.tolist(), directions=n_directions)
+    U, h = _SUPPORT_CACHE.get_or_compute(key, lambda: _support_function(A, b, dims, n_directions))
+    return U.copy(), h.copy()
+
+
+def support_directions(k: int, n_directions: int) -> np.ndarray:
+    """Direções unitárias (n_directions, k) espalhadas no círculo (k=2) ou na esfera (k=3), mais ±eixos."""
+    if k == 2:
+        theta = 2 * np.pi * np.arange(n_directions) / n_directions
+        U = np.column_stack([np.cos(theta), np.sin(theta)])
+    else:
+        # Espiral de Fibonacci: pontos quase uniformes na esfera
+        i = np.arange(n_directions) + 0.5
+        phi = np.arccos(1 - 2 * i / n_directions)
+        theta = np.pi * (1 + 5 ** 0.5) * i
+        U = np.column_stack([np.cos(theta) * np.sin(phi), np.sin(theta) * np.sin(phi), np.cos(phi)])
+    axes = np.vstack([np.eye(k), -np.eye(k)])
+    return np.vstack([axes, U])
+
+
+def _support_function(A, b, dims, n_directions):
+    U = support_directions(len(dims), n_directions)
+    # Um cenário por direção: c_k = u_k nas dims e zero nas demais
+    C = np.zeros((len(U), A.shape[1]))
+    C[:, dims] = U
+    result = solve_batch(C, A.tolist(), b, maximize=True)
+    ok = result["status"] == "optimal"
+    return U[ok], result["objectives"][ok].astype(float)
+
+
+def _check_dims(dims, n_vars) -> np.ndarray:
+    dims = np.asarray(list(dims), dtype=int)
+    if len(dims) not in (2, 3):
+        raise ValueError("Escolha 2 ou 3 variáveis para o corte/projeção.")
+    if len(set(dims.tolist())) != len(dims) or dims.min() < 0 or dims.max() >= n_vars:
+        raise ValueError("Índices de variáveis inválidos para o corte/projeção.")
+    return dims
@@ -1,8 +1,13 @@
 import math
-from typing import List, Tuple
+from fractions import Fraction
+from typing import Iterator, List, Tuple
 
 import numpy as np
 
+from .cancellation import CancellationToken, make_deadline, stop_requested
+from .events import FinishedEvent, PivotEvent
+from .exact_tableau import ExactTableau, to_fraction
+
 
 class SimplexSolver:
     """Primal Simplex com método Big-M para lidar com bases iniciais inviáveis.
@@ -18,6 +23,11 @@ class SimplexSolver:
         self.steps: List[str] = []
         self.decisions: List[str] = []
         self.pivots: List[Tuple[int, int]] = []
+        # Base (índices das colunas básicas) de cada tableau registrado
+        self.bases: List[List[int]] = []
+        # Registros feitos por _log_state (cresce mesmo sem histórico) e get_path memorizado
+        self._records: int = 0
+        self._path = None
         self.optimal: bool = False
         self.unbounded: bool = False
         self.infeasible: bool = False
@@ -26,6 +36,26 @@ class SimplexSolver:
         self._variable_names: List[str] = []
         self._artificial_indices: List[int] = []
         self.constraints_info = [] # Metadata for sensitivity analysis
+        # Modo exato (Bareiss): tableau inteiro + denominador comum
+        self.exact: bool = False
+        self._exact: ExactTableau | None = None
+        self._exact_snapshots = []
+        # Anti-ciclagem: contagem de pivôs degenerados e regra ativada na estagnação
+        self.degenerate_pivots: int = 0
+        self.anti_cycling: str | None = "lexicographic"
+        self.stall_threshold: int = 5
+        self._degenerate_streak: int = 0
+        self._cycling_rule: str | None = None
+        self._lex_basis: List[int] = []
+        self._perturbation = None
+        # Parada antecipada: "iteration_limit", "time_limit" ou "cancelled"
+        self.stop_reason: str | None = None
+        self.cancel_token: CancellationToken | None = None
+        self._deadline: float | None = None
+        # Histórico completo (tableaux/steps) ou apenas o estado mais recente
+        self.keep_history: bool = True
+        # Eventos pendentes para iter_solve (None = ninguém consumindo)
+        self._pending_events = None
 
     # ------------------------------------------------------------------
     def initialize(
@@ -35,13 +65,50 @@ class SimplexSolver:
         b: List[float],
         maximize: bool = True,
         iteration_limit: int = 100,
+        exact: bool = False,
+        anti_cycling: str | None = "lexicographic",
+        stall_threshold: int = 5,
+        time_limit: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        keep_history: bool = True,
     ) -> None:
+        """Monta o tableau inicial (Big-M) e prepara a execução passo a passo.
+
+        ``anti_cycling`` define a regra ativada após ``stall_threshold`` pivôs
+        degenerados seguidos: ``"lexicographic"`` (teste da razão
+        lexicográfico), ``"perturbation"`` (perturbação limitada do RHS,
+        removida no final) ou ``None`` (Dantzig puro).
+
+        ``time_limit`` (segundos, tempo de parede) e ``cancel_token`` são
+        verificados a cada ``step()``; ao dispararem, o solver para com
+        ``stop_reason`` preenchido e mantém o último tableau como resultado parcial.
+
+        Com ``keep_history=False`` só o estado mais recente fica em
+        ``tableaux``/``steps``/``decisions``/``pivots`` (suficiente para a
+        solução e a sensibilidade), sem copiar todo o histórico.
+        """
+        if anti_cycling not in (None, "lexicographic", "perturbation"):
+            raise ValueError(f"Regra anti-ciclagem desconhecida: {anti_cycling}")
         # Reset total
         self.__init__()
         self._maximize = maximize
+        self.exact = exact
+        self.anti_cycling = anti_cycling
+        self.stall_threshold = stall_threshold
+        self.cancel_token = cancel_token
+        self._deadline = make_deadline(time_limit)
+        self.keep_history = keep_history
         
         M = 1e6  # Penalidade Big-M
 
+        if exact:
+            # Entradas racionais (0.1 -> 1/10) e M inteiro; o tableau é montado
+            # em um array de objetos e convertido para a forma inteira de Bareiss
+            c = [to_fraction(v) for v in c]
+            A = [[to_fraction(v) for v in row] for row in A]
+            b = [to_fraction(v) for v in b]
+            M = 10 ** 6
+
         # Ajustar função objetivo para minimização interna (padrão do tableau)
         # Se Max Z, tableau usa linha -Z + cx = 0 -> Z - cx = 0.
         # Aqui vamos manter a convenção: Row 0 representa a equação da função objetivo.
@@ -57,13 +124,13 @@ class SimplexSolver:
         # Ex: Max Z = 2x1 + 3x2 -> Z - 2x1 - 3x2 = 0.
         # T[0] = [-2, -3, ...]
         
-        c_input = np.array(c, dtype=float)
+        c_input = np.array(c, dtype=object if exact else float)
         if not maximize:
             c_input = -c_input
             
         # Converter para lista para manipulação
         c_list = list(c_input)
-        self.original_c = c_list # Store for sensitivity
+        self.original_c = [float(v) for v in c_list] if exact else c_list # Store for sensitivity
         
         m = len(A)
         n = len(c)
@@ -112,7 +179,7 @@ class SimplexSolver:
         # Ordem: [x1...xn] [s1...s_total] [a1...a_total]
         
         total_vars = n + n_slack + n_surplus + n_artificial
-        T = np.zeros((m + 1, total_vars + 1))
+        T = np.zeros((m + 1, total_vars + 1), dtype=object if exact else float)
         
         # Nomes das variáveis
         self._variable_names = [f"x{i+1}" for i in range(n)]
@@ -184,6 +251,10 @@ class SimplexSolver:
             if info["type"] == "ge":
                 # Esta linha tem variável artificial na base
                 T[0] = T[0] - M * T[i+1]
+
+        if exact:
+            self._exact = ExactTableau(T, basis)
+            T = self._exact.to_float()
                 
         # Log Inicial
         basis_vars_names = [self._variable_names[i] for i in basis]
@@ -215,7 +286,21 @@ class SimplexSolver:
         self.iteration_count += 1
         T = self.T
 
-        if self._is_optimal(T):
+        if self._exact.is_optimal() if self.exact else self._is_optimal(T):
+            if self._perturbation is not None:
+                status, T = self._remove_perturbation(T)
+                # Sem δ a base pode não ser recuperável: não reportar um ótimo falso
+                if status == "infeasible":
+                    self._log_infeasible(T)
+                    self.infeasible = True
+                    self.finished = True
+                    return False
+                if status != "optimal":
+                    self._log_timeout(T, self.iteration_limit)
+                    self.stop_reason = "iteration_limit"
+                    self.finished = True
+                    return False
+
             # Verificar inviabilidade (variável artificial na base com valor > 0)
             if self._check_infeasibility(T):
                 infeasible_desc = (
@@ -236,22 +321,54 @@ class SimplexSolver:
         if self.iteration_count > self.iteration_limit:
              # Limite atingido
             self._log_timeout(T, self.iteration_limit)
+            self.stop_reason = "iteration_limit"
+            self.finished = True
+            return False
+
+        # Prazo e cancelamento cooperativo (verificados antes de cada pivô)
+        reason = stop_requested(self.cancel_token, self._deadline)
+        if reason is not None:
+            self._log_stopped(T, reason)
+            self.stop_reason = reason
             self.finished = True
             return False
 
-        pc = self._pivot_col(T)
-        pr = self._pivot_row(T, pc)
+        # Estagnação: muitos pivôs degenerados seguidos podem indicar ciclagem
+        if self._cycling_rule is None and self.anti_cycling and self._degenerate_streak >= self.stall_threshold:
+            T = self._start_anti_cycling(T)
+
+        pc = self._select_pivot_col(T)
+        pr = self._select_pivot_row(T, pc)
         
         if pr == -1:
             self.unbounded = True
             self._log_unbounded(T, pc)
             self.finished = True
             return False
+
+        degenerate = self._is_degenerate(T, pr)
+        if degenerate:
+            self.degenerate_pivots += 1
+            self._degenerate_streak += 1
+        else:
+            self._degenerate_streak = 0
             
         # Executar pivot
         self._log_iteration(T, self.iteration_count, pr, pc)
-        self.T = self._pivot(T, pr, pc)
+        leaving = self._current_basis[pr - 1]
+        self.T = self._apply_pivot(T, pr, pc)
         self._current_basis[pr - 1] = pc
+
+        if self._pending_events is not None:
+            z = self.T[0, -1]
+            self._pending_events.append(PivotEvent(
+                iteration=self.iteration_count,
+                entering=self._variable_names[pc],
+                leaving=self._variable_names[leaving],
+                pivot=(int(pr), int(pc)),
+                objective=float(z if self._maximize else -z),
+                degenerate=bool(degenerate),
+            ))
         return True
 
     def solve(
@@ -261,11 +378,52 @@ class SimplexSolver:
         b: List[float],
         maximize: bool = True,
         iteration_limit: int = 100,
+        exact: bool = False,
+        anti_cycling: str | None = "lexicographic",
+        stall_threshold: int = 5,
+        time_limit: float | None = None,
+        cancel_token: CancellationToken | None = None,
+        keep_history: bool = True,
     ) -> None:
-        self.initialize(c, A, b, maximize, iteration_limit)
+        self.initialize(
+            c, A, b, maximize, iteration_limit, exact, anti_cycling, stall_threshold,
+            time_limit=time_limit, cancel_token=cancel_token, keep_history=keep_history,
+        )
         while self.step():
             pass
 
+    def iter_solve(self, c, A, b, **options) -> Iterator:
+        """Resolve como ``solve()``, mas gera um ``PivotEvent`` a cada pivô.
+
+        Aceita as mesmas opções de ``initialize``. Termina com um
+        ``FinishedEvent``; o consumidor pode parar a qualquer momento (o
+        solver fica no estado parcial, como após ``step()``).
+        """
+        self.initialize(c, A, b, **options)
+        self._pending_events = []
+        try:
+            running = True
+            while running:
+                running = self.step()
+                yield from self._pending_events
+                self._pending_events.clear()
+            objective = float(self.get_solution()[1]) if self.optimal else None
+            # Cada step() conta uma iteração; a última apenas constata o fim
+            yield FinishedEvent(self.status, objective, self.iteration_count - 1)
+        finally:
+            self._pending_events = None
+
+    @property
+    def status(self) -> str:
+        """``"optimal"``, ``"unbounded"``, ``"infeasible"``, motivo de parada ou ``"running"``."""
+        if self.optimal:
+            return "optimal"
+        if self.unbounded:
+            return "unbounded"
+        if self.infeasible:
+            return "infeasible"
+        return self.stop_reason or "running"
+
     # ------------------------------------------------------------------
     
     def _log_iteration(self, T, it, pr, pc):
@@ -324,17 +482,112 @@ class SimplexSolver:
         }
         self._log_state(T, step_dict, desc_dict, (-1, -1))
 
+    # ---------------------------------------------- operações do passo
+    # Pontos únicos de precificação, teste da razão e pivô (float ou exato);
+    # ``core.instrumentation.instrument`` os envolve com temporizadores.
+    def _select_pivot_col(self, T):
+        return self._exact.pivot_col() if self.exact else self._pivot_col(T)
+
+    def _select_pivot_row(self, T, pc):
+        lex_cols = self._lex_basis if self._cycling_rule == "lexicographic" else None
+        if self.exact:
+            return self._exact.pivot_row(pc, lex_cols)
+        return self._pivot_row_lex(T, pc, lex_cols) if lex_cols else self._pivot_row(T, pc)
+
+    def _is_degenerate(self, T, pr):
+        return self._exact.is_degenerate(pr) if self.exact else T[pr, -1] <= 1e-9
+
+    def _apply_pivot(self, T, pr, pc):
+        if self.exact:
+            self._exact.pivot(pr, pc)
+            return self._exact.to_float()
+        return self._pivot(T, pr, pc)
+
+    def _log_stopped(self, T, reason):
+        step_dict = {
+            "key": "simplex.log.stopped",
+            "params": []
+        }
+        desc_dict = {
+            "key": f"simplex.log.stopped_{reason}_desc",
+            "params": [self.iteration_count - 1]
+        }
+        self._log_state(T, step_dict, desc_dict, (-1, -1))
+
+    def _start_anti_cycling(self, T):
+        """Ativa a regra anti-ciclagem tomando a base atual como referência.
+
+        Na base de referência o tableau tem colunas identidade, então as linhas
+        ``[b_i | e_i]`` são lexicograficamente positivas e o teste da razão
+        lexicográfico (ou a perturbação ``b + δ``) impede a repetição de bases.
+        """
+        self._lex_basis = list(self._current_basis)
+        # Perturbação quebraria a aritmética exata: nesse modo usa-se sempre a lexicográfica
+        rule = "lexicographic" if self.exact else self.anti_cycling
+        self._cycling_rule = rule
+
+        if rule == "perturbation":
+            # δ_i distintos e pequenos, limitados pela escala do RHS (semente fixa)
+            rng = np.random.default_rng(0)
+            scale = max(1.0, float(np.abs(T[1:, -1]).max()))
+            self._perturbation = 1e-7 * scale * rng.uniform(0.5, 1.0, len(self._lex_basis))
+            T = T.copy()
+            T[:, -1] += T[:, self._lex_basis] @ self._perturbation
+            self.T = T
+
+        step_dict = {"key": "simplex.log.anti_cycling", "params": []}
+        desc_dict = {
+            "key": f"simplex.log.anti_cycling_{rule}_desc",
+            "params": [self._degenerate_streak, self.degenerate_pivots],
+        }
+        self._log_state(T, step_dict, desc_dict, (-1, -1))
+        return T
+
+    def _remove_perturbation(self, T):
+        """Desfaz ``b + δ`` no tableau ótimo e recupera a viabilidade com Simplex dual.
+
+        Retorna ``(status, T)`` com o status do Simplex dual (``"optimal"``,
+        ``"infeasible"`` ou ``"iteration_limit"``).
+        """
+        from .warm_start import dual_simplex
+
+        # Colunas da base de referência acumulam as operações feitas desde a perturbação
+        T = T.copy()
+        T[:, -1] -= T[:, self._lex_basis] @ self._perturbation
+        self._perturbation = None
+        status, T, pivots = dual_simplex(T, self._current_basis, self.iteration_limit)
+        self.T = T
+
+        step_dict = {"key": "simplex.log.perturbation_removed", "params": []}
+        desc_dict = {"key": "simplex.log.perturbation_removed_desc", "params": [pivots]}
+        self._log_state(T, step_dict, desc_dict, (-1, -1))
+        return status, T
+
     def _log_state(self, tableau, step, decision, pivot):
+        if not self.keep_history and self.tableaux:
+            # Apenas o estado mais recente (get_solution e afins usam o último)
+            self.tableaux.clear()
+            self.steps.clear()
+            self.decisions.clear()
+            self.pivots.clear()
+            self.bases.clear()
+            self._exact_snapshots.clear()
         self.tableaux.append(tableau.copy())
         self.steps.append(step)
         self.decisions.append(decision)
         self.pivots.append(pivot)
+        self.bases.append(list(self._current_basis))
+        if self.exact:
+            self._exact_snapshots.append(self._exact.snapshot())
+        self._records += 1
 
     def _check_infeasibility(self, T):
         # Verifica se alguma variável artificial está na base com valor > tolerância
+        # (no modo exato, qualquer valor positivo, sem tolerância)
         for i, var_idx in enumerate(self._current_basis):
             if var_idx in self._artificial_indices:
-                if T[i+1, -1] > 1e-6:
+                value = self._exact.basic_value(i + 1) if self.exact else T[i+1, -1]
+                if value > (0 if self.exact else 1e-6):
                     return True
         return False
         
@@ -365,35 +618,41 @@ class SimplexSolver:
         # Regra de Bland: menor índice em caso de empate (já garantido pelo argmin no primeiro menor)
         # Mas argmin pega o menor VALOR.
         # Para evitar ciclagem, idealmente pegamos o primeiro índice com valor negativo.
-        # Mas Dantzig (menor valor) é mais rápido. Vamos manter Dantzig.
+        # Mas Dantzig (menor valor) é mais rápido. Vamos manter Dantzig; a ciclagem
+        # é tratada em step() pela regra anti-ciclagem ativada na estagnação.
         return candidates[np.argmin(costs[candidates])]
 
     @staticmethod
     def _pivot_row(T, pc):
-        # Razão mínima
-        min_ratio = float('inf')
-        pivot_row = -1
-        
-        for i in range(1, T.shape[0]):
-            elem = T[i, pc]
-            if elem > 1e-9:
-                ratio = T[i, -1] / elem
-                if ratio < min_ratio:
-                    min_ratio = ratio
-                    pivot_row = i
-        
-        return pivot_row
+        # Razão mínima (em empate, a primeira linha — argmin devolve o primeiro)
+        col = T[1:, pc]
+        candidates = np.where(col > 1e-9)[0]
+        if len(candidates) == 0:
+            return -1
+        ratios = T[1:, -1][candidates] / col[candidates]
+        return int(candidates[np.argmin(ratios)]) + 1
+
+    @staticmethod
+    def _pivot_row_lex(T, pc, lex_cols):
+        # Razão mínima com empates desfeitos pela regra lexicográfica:
+        # compara T[i, j] / T[i, pc] nas colunas da base de referência, em ordem
+        col = T[1:, pc]
+        rows = np.where(col > 1e-9)[0]
+        if len(rows) == 0:
+            return -1
+        for j in [-1] + list(lex_cols):
+            ratios = T[rows + 1, j] / col[rows]
+            rows = rows[ratios <= ratios.min() + 1e-9]
+            if len(rows) == 1:
+                break
+        return int(rows[0]) + 1
 
     @staticmethod
     def _pivot(T, pr, pc):
-        T2 = T.copy()
-        pivot_val = T[pr, pc]
-        T2[pr] = T[pr] / pivot_val
-        
-        for i in range(T.shape[0]):
-            if i != pr:
-                factor = T[i, pc]
-                T2[i] = T[i] - factor * T2[pr]
+        # Eliminação de Gauss-Jordan em bloco: T2[i] = T[i] - T[i, pc] * T2[pr]
+        pivot_row = T[pr] / T[pr, pc]
+        T2 = T - np.outer(T[:, pc], pivot_row)
+        T2[pr] = pivot_row
         return T2
 
     def get_solution(self):
@@ -425,6 +684,56 @@ class SimplexSolver:
             
         return final_sol, z
 
+    def get_path(self):
+        """Pontos visitados pelo Simplex, um por tableau registrado.
+
+        Calculado a partir de ``tableaux``/``bases`` (sem resolver de novo) e
+        guardado até o próximo registro, também com ``keep_history=False``:
+        ``points`` (k, n) com as variáveis de decisão, ``objective`` (k,) com
+        Z no sentido do usuário e ``artificial`` (k,), verdadeiro enquanto há
+        artificial positiva na base (ponto ainda fora da região factível).
+        """
+        if self._path is not None and self._path[0] == self._records:
+            return self._path[1]
+        n = len(self.original_c)
+        k = min(len(self.tableaux), len(self.bases))
+        points = np.zeros((k, n))
+        artificial = np.zeros(k, dtype=bool)
+        artificials = set(self._artificial_indices)
+        for it in range(k):
+            T = self.tableaux[it]
+            for row, var in enumerate(self.bases[it], start=1):
+                value = float(T[row, -1])
+                if var < n:
+                    points[it, var] = value
+                elif var in artificials and value > 1e-6:
+                    artificial[it] = True
+        # original_c já está no sentido interno (Max); volta ao do usuário
+        sign = 1.0 if self._maximize else -1.0
+        objective = sign * (points @ np.asarray(self.original_c, dtype=float)) + 0.0
+        path = {"points": points, "objective": objective, "artificial": artificial}
+        self._path = (self._records, path)
+        return path
+
+    def get_exact_tableau(self, idx: int = -1):
+        """Tableau ``idx`` do histórico em ``Fraction`` (apenas no modo exato)."""
+        if not self.exact or not self._exact_snapshots:
+            return None
+        return self._exact.to_fractions(self._exact_snapshots[idx])
+
+    def get_exact_solution(self):
+        """Como ``get_solution``, mas com valores ``Fraction`` exatos."""
+        if not self.exact or not self.optimal or self.infeasible:
+            return None, None
+        T = self.get_exact_tableau(-1)
+        n = len(self.original_c)
+        sol = [Fraction(0)] * n
+        for i, var_idx in enumerate(self._current_basis):
+            if var_idx < n:
+                sol[var_idx] = T[i+1, -1]
+        z = T[0, -1]
+        return sol, (z if self._maximize else -z)
+
     def get_basis_info(self):
         if not self.optimal:
             return None
@@ -436,161 +745,114 @@ class SimplexSolver:
             info.append((name, val))
         return info
 
-    def get_sensitivity_analysis(self):
-        """Retorna análise de sensibilidade para RHS e Função Objetivo."""
+    def get_sensitivity_arrays(self):
+        """Análise de sensibilidade em arrays NumPy, calculada a partir de B^-1.
+
+        No tableau ótimo, a coluna de cada folga/excesso é a coluna de B^-1
+        da restrição correspondente e a linha 0 traz os custos reduzidos, então
+        todos os intervalos saem de operações em bloco, sem laços por linha.
+
+        Retorna ``{"rhs": {...}, "objective": {...}}`` com um array por campo;
+        limites ilimitados aparecem como ``±inf``.
+        """
         if not self.optimal or self.infeasible or not self.tableaux:
             return None
 
         T = self.tableaux[-1]
-        m, n = T.shape[0] - 1, len(self.original_c) # n original vars
-        
-        analysis = {
-            "rhs": [],
-            "objective": []
+        n = len(self.original_c)
+        n_total = len(self._variable_names)
+        b_current = T[1:, -1]
+        costs = T[0, :n_total]
+
+        # 1. RHS: b* + delta * S_i >= 0, com S_i = B^-1 e_i (coluna da folga i;
+        # a do excesso de uma restrição >= tem coeficiente -1, logo é -B^-1 e_i)
+        slack_cols = np.array([info["slack_idx"] for info in self.constraints_info], dtype=int)
+        sign = np.array([1.0 if info["type"] == "le" else -1.0 for info in self.constraints_info])
+        S = T[1:, slack_cols] * sign
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = -b_current[:, None] / S
+        delta_min = np.max(np.where(S >= 1e-9, ratios, -np.inf), axis=0)
+        delta_max = np.min(np.where(S <= -1e-9, ratios, np.inf), axis=0)
+        rhs = np.array([info["rhs"] for info in self.constraints_info], dtype=float)
+
+        # 2. Custos c_j. Posição de cada variável na base (-1 = não-básica)
+        position = np.full(n_total, -1)
+        position[self._current_basis] = np.arange(len(self._current_basis))
+        nonbasic = position < 0
+        c_orig = np.asarray(self.original_c, dtype=float)
+        is_basic = ~nonbasic[:n]
+
+        # Não-básicas: c_j pode crescer até anular o custo reduzido
+        cost_min = np.full(n, -np.inf)
+        cost_max = c_orig + costs[:n]
+
+        # Básicas: r_k - delta * y_rk >= 0 para toda não-básica k da linha r
+        basic_vars = np.where(is_basic)[0]
+        if len(basic_vars):
+            Y = T[position[basic_vars] + 1, :n_total]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                R = costs / Y
+            upper = np.min(np.where(nonbasic & (Y >= 1e-9), R, np.inf), axis=1)
+            lower = np.max(np.where(nonbasic & (Y <= -1e-9), R, -np.inf), axis=1)
+            cost_min[basic_vars] = c_orig[basic_vars] + lower
+            cost_max[basic_vars] = c_orig[basic_vars] + upper
+
+        return {
+            "rhs": {
+                "shadow_price": T[0, slack_cols],
+                "current_value": rhs,
+                "min": rhs + delta_min,
+                "max": rhs + delta_max,
+                "type": np.array([info["type"] for info in self.constraints_info]),
+            },
+            "objective": {
+                "var": np.array(self._variable_names[:n]),
+                "current_cost": c_orig,
+                "min": cost_min,
+                "max": cost_max,
+                "basic": is_basic,
+            },
         }
-        
-        # 1. Análise de RHS (Shadow Prices e Intervalos)
-        for i, info in enumerate(self.constraints_info):
-            slack_idx = info["slack_idx"]
-            
-            # Shadow Price (Preço Sombra)
-            # Para restrição <= (slack): Shadow Price = valor na linha 0 correspondente à slack.
-            # Para restrição >= (surplus): Surplus tem coeff -1 na matriz, então cuidado.
-            # O tableau final tem custos reduzidos.
-            # Dual variable y_i = reduced cost of slack_i? 
-            # In optimal tableau, reduced cost of slack s_i is y_i.
-            # Mas cuidado com Max/Min e sinais.
-            # Assumindo Max Z padrão.
-            shadow_price = T[0, slack_idx]
-            
-            # Intervalo de Estabilidade do RHS (b_i)
-            # b_new = b + delta
-            # Condição: B^-1 (b + delta*e_i) >= 0
-            # Sendo S_i a coluna da slack no tableau ótimo (= B^-1 * e_i se slack coeff fosse I)
-            # Se for <=, slack column S_i corresponde ao vetor coluna da inversa da base para aquela restrição.
-            # b* (atual) = T[1:, -1]
-            # Column S_i = T[1:, slack_idx]
-            # Novo RHS das restrições básicas: b* - delta * S_i >= 0
-            # delta * S_i <= b*
-            
-            b_current = T[1:, -1]
-            col_slack = T[1:, slack_idx]
-            
-            # Encontrar limites para Delta
-            delta_min = -float('inf')
-            delta_max = float('inf')
-            
-            for r in range(m):
-                s_val = col_slack[r]
-                b_val = b_current[r]
-                
-                if abs(s_val) < 1e-9:
-                    continue
-                
-                # delta * s_val <= b_val
-                if s_val > 0:
-                    # delta <= b_val / s_val
-                    upper = b_val / s_val
-                    delta_max = min(delta_max, upper)
-                else:
-                    # delta * (neg) <= b_val -> delta >= b_val / s_val
-                    lower = b_val / s_val
-                    delta_min = max(delta_min, lower)
-            
-            # Ajustar para valores originais
-            original_rhs = info["rhs"]
-            
-            # Se restrição era >=, o slack era surplus (coeff -1), a lógica inverte?
-            # Na verdade, a coluna da variável de folga/excesso carrega a informação da inversa.
-            # Se for >=, shadow price costuma ser negativo num problema de Max (penaliza).
-            # O valor no tableau (custo reduzido) deve refletir isso.
-            
-            analysis["rhs"].append({
-                "id": i+1,
-                "shadow_price": shadow_price,
-                "current_value": original_rhs,
-                "min": original_rhs + delta_min if delta_min != -float('inf') else "-∞",
-                "max": original_rhs + delta_max if delta_max != float('inf') else "+∞",
-                "type": info["type"]
-            })
-
-        # 2. Análise da Função Objetivo (Coeficientes c_j)
-        # Intervalos de otimalidade
-        
-        # Identificar variáveis básicas e não-básicas originais
-        basic_indices = set(self._current_basis)
-        
-        for j in range(n):
-            var_name = self._variable_names[j] # x1, x2...
-            c_orig = self.original_c[j]
-            
-            if j in basic_indices:
-                # Variável Básica
-                # A mudança em c_j afeta os custos reduzidos das não-básicas.
-                # Delta c_j
-                # c'_j = c_j + delta
-                # Novo custo reduzido das não básicas k: r'_k = r_k - delta * y_kj
-                # Onde y_kj é o elemento do tableau na linha da variável básica x_j e coluna k.
-                # Precisamos saber em qual linha 'r' do tableau a variável x_j é básica.
-                
-                # Buscar linha onde x_j é básica
-                try:
-                    row_idx = self._current_basis.index(j) # 0 a m-1
-                except ValueError:
-                    continue # Não deveria ocorrer se j in basic_indices
-                
-                # Linha do tableau (row_idx + 1)
-                row_vals = T[row_idx + 1, :]
-                
-                delta_min = -float('inf')
-                delta_max = float('inf')
-                
-                # Iterar sobre não-básicas
-                for k in range(len(self._variable_names)): # Todas vars
-                    if k not in basic_indices:
-                        # reduced_cost_k >= 0 (para manter otimalidade Max)
-                        # r_k - delta * row_vals[k] >= 0
-                        # delta * row_vals[k] <= r_k
-                        
-                        r_k = T[0, k]
-                        y_kj = row_vals[k]
-                        
-                        if abs(y_kj) < 1e-9:
-                            continue
-                            
-                        if y_kj > 0:
-                            # delta <= r_k / y_kj
-                            upper = r_k / y_kj
-                            delta_max = min(delta_max, upper)
-                        else:
-                            # delta * neg <= r_k -> delta >= r_k / y_kj (lembrando que y_kj é neg, inverte sentido dividindo)
-                            lower = r_k / y_kj
-                            delta_min = max(delta_min, lower)
-                            
-                analysis["objective"].append({
-                    "var": var_name,
-                    "current_cost": c_orig,
-                    "min": c_orig + delta_min if delta_min != -float('inf') else "-∞",
-                    "max": c_orig + delta_max if delta_max != float('inf') else "+∞",
-                    "status": "Básica"
-                })
-                
-            else:
-                # Variável Não-Básica
-                # Pode aumentar até igualar o custo reduzido
-                # Reduced cost r_j = z_j - c_j >= 0
-                # Se aumentarmos c_j em delta -> novo r'_j = z_j - (c_j + delta) = r_j - delta
-                # Otimalidade: r'_j >= 0 -> r_j - delta >= 0 -> delta <= r_j
-                # Diminuir c_j (delta negativo) não afeta otimalidade (r_j aumenta).
-                
-                reduced_cost = T[0, j]
-                
-                analysis["objective"].append({
-                    "var": var_name,
-                    "current_cost": c_orig,
-                    "min": "-∞",
-                    "max": c_orig + reduced_cost,
-                    "status": "Não-Básica"
-                })
 
-        return analysis
\ No newline at end of file
+    def get_sensitivity_analysis(self):
+        """Retorna análise de sensibilidade para RHS e Função Objetivo.
+
+        Visão em listas de dicionários (usada pelas páginas) sobre os arrays
+        de ``get_sensitivity_arrays``; limites ilimitados viram "-∞"/"+∞".
+        """
+        arrays = self.get_sensitivity_arrays()
+        if arrays is None:
+            return None
+
+        def bound(value):
+            if value == -np.inf:
+                return "-∞"
+            if value == np.inf:
+                return "+∞"
+            return value
+
+        rhs = arrays["rhs"]
+        obj = arrays["objective"]
+        return {
+            "rhs": [
+                {
+                    "id": i + 1,
+                    "shadow_price": rhs["shadow_price"][i],
+                    "current_value": rhs["current_value"][i],
+                    "min": bound(rhs["min"][i]),
+                    "max": bound(rhs["max"][i]),
+                    "type": str(rhs["type"][i]),
+                }
+                for i in range(len(rhs["current_value"]))
+            ],
+            "objective": [
+                {
+                    "var": str(obj["var"][j]),
+                    "current_cost": obj["current_cost"][j],
+                    "min": bound(obj["min"][j]),
+                    "max": bound(obj["max"][j]),
+                    "status": "Básica" if obj["basic"][j] else "Não-Básica",
+                }
+                for j in range(len(obj["current_cost"]))
+            ],
+        }
@@ -0,0 +1,115 @@
+"""Cache de resultados indexado pela impressão digital canônica do problema.
+
+``problem_fingerprint`` reduz um modelo (``c``, ``A``, ``b``, sentidos,
+variáveis inteiras, Max/Min e opções do solver) a um hash estável: números
+viram ``float`` (``-0.0`` e ``0`` coincidem com ``0.0``), listas de índices
+são ordenadas e opções que não alteram o resultado (prazo, token de
+cancelamento) são ignoradas. ``SolveCache`` guarda os resultados num LRU
+limitado e seguro entre threads; a UI o compartilha entre sessões.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Opções que só limitam a execução; resultados interrompidos não são guardados
+_VOLATILE_OPTIONS = ("time_limit", "cancel_token", "keep_history")
+
+
+def problem_fingerprint(
+    c,
+    A,
+    b,
+    senses=None,
+    integer_vars=None,
+    maximize: bool = True,
+    **options,
+) -> str:
+    """Hash SHA-256 (hex) da forma canônica do problema e das opções do solver.
+
+    ``senses`` é opcional: quem já converteu tudo para ``<=`` pode omiti-lo,
+    e modelos equivalentes passam a compartilhar a mesma entrada.
+    """
+    canonical = {
+        "c": [_number(v) for v in c],
+        "A": [[_number(v) for v in row] for row in A],
+        "b": [_number(v) for v in b],
+        "senses": list(senses) if senses is not None else None,
+        "integer_vars": sorted(int(i) for i in integer_vars) if integer_vars is not None else None,
+        "maximize": bool(maximize),
+        "options": {k: options[k] for k in sorted(options) if k not in _VOLATILE_OPTIONS},
+    }
+    payload = json.dumps(canonical, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SolveCache:
+    """LRU de resultados com no máximo ``maxsize`` entradas.
+
+    Os valores são compartilhados por quem os lê: não devem ser modificados
+    depois de guardados (ex.: não chamar ``step()`` num solver em cache).
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Valor em cache ou ``compute()``, guardado se ``cacheable(valor)`` (ou sempre)."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            if cacheable is None or cacheable(value):
+                self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+
+def _number(value) -> float:
+    value = float(value)
+    return 0.0 if value == 0 else value
+
+
+_MISSING = object()
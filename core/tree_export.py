@@ -0,0 +1,177 @@
+"""Exportação incremental da árvore do Branch & Bound (DOT, GraphML, JSON Lines).
+
+Um *sink* recebe cada nó do ``BranchBoundSolver`` uma única vez, quando o
+nó está encerrado (ramificado ou podado) ou, no fim da resolução, ainda em
+aberto. Combinado com ``keep_history=False`` a memória do solver fica
+constante e a árvore inteira vai para o arquivo, para ferramentas externas
+(Graphviz, Gephi, yEd, pandas...)::
+
+    with open_sink("arvore.jsonl") as sink:
+        solver.solve(c, A, b, keep_history=False, sink=sink)
+
+O solver não fecha o sink: quem o abre decide quando encerrar o arquivo.
+"""
+
+import json
+import math
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional
+from xml.sax.saxutils import escape
+
+# Extensão do arquivo -> formato
+_FORMATS = {".dot": "dot", ".gv": "dot", ".graphml": "graphml", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+class TreeSink(ABC):
+    """Base dos sinks: abre o destino, escreve cabeçalho, nós e rodapé.
+
+    ``target`` é um caminho (aberto e fechado pelo sink) ou um arquivo de
+    texto já aberto (apenas escrito; fechá-lo fica com quem o passou).
+    """
+
+    def __init__(self, target) -> None:
+        if hasattr(target, "write"):
+            self._file, self._owned = target, False
+        else:
+            self._file, self._owned = open(target, "w", encoding="utf-8"), True
+        self.written = 0
+        self.closed = False
+        self._file.write(self._header())
+
+    def write(self, node: Dict) -> None:
+        """Grava um nó (dicionário de ``BranchBoundSolver.nodes``)."""
+        self._file.write(self._format(node))
+        self.written += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._file.write(self._footer())
+        self.closed = True
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "TreeSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Formatos -------------------------------------------------------------
+    def _header(self) -> str:
+        return ""
+
+    def _footer(self) -> str:
+        return ""
+
+    @abstractmethod
+    def _format(self, node: Dict) -> str:
+        """Texto de um nó no formato do sink."""
+
+
+class JsonLinesSink(TreeSink):
+    """Um objeto JSON por linha com todos os campos do nó (``-inf`` vira ``null``)."""
+
+    def _format(self, node: Dict) -> str:
+        record = {
+            "id": node["id"],
+            "parent": node["parent"],
+            "bounds": {str(var): [op, val] for var, (op, val) in node["bounds"].items()},
+            "solution": None if node["solution"] is None else [float(v) for v in node["solution"]],
+            "value": _finite(node["value"]),
+            "feasible": node["feasible"],
+            "integer_feasible": node["integer_feasible"],
+            "processed": node["processed"],
+            "pruned": node.get("pruned"),
+            "branch_reason": node["branch_reason"],
+        }
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+class DotSink(TreeSink):
+    """Grafo do Graphviz: um nó ``n<id>`` e a aresta do pai rotulada com a ramificação."""
+
+    def _header(self) -> str:
+        return "digraph branch_and_bound {\n  node [shape=box, fontname=\"Helvetica\"];\n"
+
+    def _footer(self) -> str:
+        return "}\n"
+
+    def _format(self, node: Dict) -> str:
+        value = _finite(node["value"])
+        label = f"#{node['id']}\\nZ={value:.3f}" if value is not None else f"#{node['id']}\\n—"
+        lines = [f"  n{node['id']} [label={_dot_quote(label)}, status={_dot_quote(_status(node))}];\n"]
+        if node["parent"] is not None:
+            lines.append(f"  n{node['parent']} -> n{node['id']} [label={_dot_quote(node['branch_reason'] or '')}];\n")
+        return "".join(lines)
+
+
+class GraphMLSink(TreeSink):
+    """GraphML com atributos ``value``, ``status``, ``bounds`` e ``branch`` (rótulo da aresta)."""
+
+    def _header(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            '  <key id="value" for="node" attr.name="value" attr.type="double"/>\n'
+            '  <key id="status" for="node" attr.name="status" attr.type="string"/>\n'
+            '  <key id="bounds" for="node" attr.name="bounds" attr.type="string"/>\n'
+            '  <key id="solution" for="node" attr.name="solution" attr.type="string"/>\n'
+            '  <key id="branch" for="edge" attr.name="branch" attr.type="string"/>\n'
+            '  <graph id="branch_and_bound" edgedefault="directed">\n'
+        )
+
+    def _footer(self) -> str:
+        return "  </graph>\n</graphml>\n"
+
+    def _format(self, node: Dict) -> str:
+        value = _finite(node["value"])
+        bounds = ", ".join(f"x{var + 1} {op} {val}" for var, (op, val) in node["bounds"].items())
+        solution = "" if node["solution"] is None else json.dumps([float(v) for v in node["solution"]])
+        data = [("status", _status(node)), ("bounds", bounds), ("solution", solution)]
+        if value is not None:
+            data.insert(0, ("value", repr(value)))
+        body = "".join(f'      <data key="{key}">{escape(text)}</data>\n' for key, text in data)
+        lines = [f'    <node id="n{node["id"]}">\n{body}    </node>\n']
+        if node["parent"] is not None:
+            lines.append(
+                f'    <edge source="n{node["parent"]}" target="n{node["id"]}">'
+                f'<data key="branch">{escape(node["branch_reason"] or "")}</data></edge>\n'
+            )
+        return "".join(lines)
+
+
+def open_sink(path, fmt: Optional[str] = None) -> TreeSink:
+    """Sink para ``path``; ``fmt`` (``"dot"``, ``"graphml"``, ``"jsonl"``) padrão: pela extensão."""
+    fmt = fmt or _FORMATS.get(Path(path).suffix.lower())
+    sinks = {"dot": DotSink, "graphml": GraphMLSink, "jsonl": JsonLinesSink}
+    if fmt not in sinks:
+        raise ValueError(f"Formato de exportação desconhecido: {fmt!r} (use dot, graphml ou jsonl).")
+    return sinks[fmt](path)
+
+
+def _status(node: Dict) -> str:
+    """``infeasible``, ``integer``, ``bound`` (podado), ``branched`` ou ``open``."""
+    if not node["feasible"]:
+        return "infeasible"
+    if node["integer_feasible"]:
+        return "integer"
+    if node.get("pruned"):
+        return node["pruned"]
+    return "branched" if node["processed"] else "open"
+
+
+def _finite(value) -> Optional[float]:
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _dot_quote(text: str) -> str:
+    return '"' + text.replace('"', '\\"') + '"'
+
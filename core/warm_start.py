@@ -0,0 +1,151 @@
+"""Reaproveitamento de bases (warm start) para o Simplex em tableau.
+
+Utilitários que reconstroem o tableau de uma base conhecida e continuam as
+iterações com o Simplex primal ou dual, sem refazer a fase Big-M. Seguem a
+mesma convenção do ``SimplexSolver``: problema interno de maximização, linha 0
+com os custos reduzidos (ótimo quando todos >= 0) e RHS na última coluna.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .simplex_solver import SimplexSolver
+
+
+def standard_tableau(c, A, b) -> np.ndarray:
+    """Monta o tableau de ``Max cx s.a. Ax <= b, x >= 0`` com folgas explícitas.
+
+    Colunas: ``[x1..xn][s1..sm][RHS]``. A base de folgas é a identidade, mas
+    o RHS pode ser negativo (base primal inviável, útil para o Simplex dual).
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    T = np.zeros((m + 1, n + m + 1))
+    T[0, :n] = -np.asarray(c, dtype=float)
+    T[1:, :n] = A
+    T[1:, n:n + m] = np.eye(m)
+    T[1:, -1] = b
+    return T
+
+
+def optimal_basis(c, A, b, iteration_limit: int = 100) -> Optional[List[int]]:
+    """Base ótima de ``Max cx s.a. Ax <= b`` em colunas de ``[A | I]``.
+
+    Resolve com o próprio ``SimplexSolver`` (Big-M) e extrai a base com
+    ``solver_basis``. Retorna ``None`` se o problema não tiver ótimo ou
+    houver linha redundante.
+    """
+    solver = SimplexSolver()
+    solver.solve(list(c), np.asarray(A, dtype=float).tolist(), list(b), maximize=True, iteration_limit=iteration_limit)
+    return solver_basis(solver)
+
+
+def solver_basis(solver: SimplexSolver) -> Optional[List[int]]:
+    """Base ótima de um ``SimplexSolver`` já resolvido, em colunas de ``[A | I]``.
+
+    Artificiais que ficaram na base com valor zero são trocadas por pivôs
+    degenerados (a base segue primal viável; ``reoptimize`` recupera a
+    otimalidade se preciso). Retorna ``None`` se o solver não chegou ao
+    ótimo ou houver linha redundante.
+    """
+    if not solver.optimal:
+        return None
+    n = len(solver.original_c)
+    m = len(solver._current_basis)
+
+    # Colunas de folga/excesso do SimplexSolver ficam em n+i, como em [A | I]
+    T = solver.tableaux[-1]
+    basis = [int(idx) for idx in solver._current_basis]
+    for r, idx in enumerate(basis):
+        if idx < n + m:
+            continue
+        row = np.abs(T[r + 1, :n + m])
+        row[basis[:r] + basis[r + 1:]] = 0.0
+        j = int(np.argmax(row))
+        if row[j] <= 1e-9:
+            return None
+        T = SimplexSolver._pivot(T, r + 1, j)
+        basis[r] = j
+    return basis
+
+
+def tableau_from_basis(T0: np.ndarray, basis: List[int]) -> np.ndarray:
+    """Reescreve o tableau ``T0`` (base inicial identidade) na base ``basis``.
+
+    Equivale a aplicar de uma só vez todos os pivôs que levariam à base:
+    ``T[1:] = B^-1 T0[1:]`` e ``T[0] = T0[0] - c_B T[1:]``.
+    """
+    B = T0[1:, basis]
+    T = np.empty_like(T0)
+    T[1:] = np.linalg.solve(B, T0[1:])
+    T[0] = T0[0] - T0[0, basis] @ T[1:]
+    return T
+
+
+def primal_simplex(
+    T: np.ndarray, basis: List[int], iteration_limit: int = 100
+) -> Tuple[str, np.ndarray, int]:
+    """Continua o Simplex primal a partir de uma base primal viável.
+
+    Retorna ``(status, T, iterações)`` com status ``"optimal"``,
+    ``"unbounded"`` ou ``"iteration_limit"``. ``basis`` é atualizada in-place.
+    """
+    for it in range(iteration_limit):
+        pc = SimplexSolver._pivot_col(T)
+        if pc == -1:
+            return "optimal", T, it
+        pr = SimplexSolver._pivot_row(T, pc)
+        if pr == -1:
+            return "unbounded", T, it
+        T = SimplexSolver._pivot(T, pr, pc)
+        basis[pr - 1] = pc
+    if SimplexSolver._is_optimal(T):
+        return "optimal", T, iteration_limit
+    return "iteration_limit", T, iteration_limit
+
+
+def dual_simplex(
+    T: np.ndarray, basis: List[int], iteration_limit: int = 100
+) -> Tuple[str, np.ndarray, int]:
+    """Continua o Simplex dual a partir de uma base dual viável (custos >= 0).
+
+    Sai a linha de RHS mais negativo; entra a coluna de menor razão
+    ``custo / |a_rj|`` entre os ``a_rj < 0``. Status possíveis:
+    ``"optimal"``, ``"infeasible"`` ou ``"iteration_limit"``.
+    """
+    for it in range(iteration_limit):
+        rhs = T[1:, -1]
+        r = int(np.argmin(rhs))
+        if rhs[r] >= -1e-9:
+            return "optimal", T, it
+        pr = r + 1
+        row = T[pr, :-1]
+        candidates = np.where(row < -1e-9)[0]
+        if len(candidates) == 0:
+            return "infeasible", T, it
+        ratios = T[0, candidates] / -row[candidates]
+        pc = candidates[np.argmin(ratios)]
+        T = SimplexSolver._pivot(T, pr, pc)
+        basis[pr - 1] = pc
+    if np.all(T[1:, -1] >= -1e-9):
+        return "optimal", T, iteration_limit
+    return "iteration_limit", T, iteration_limit
+
+
+def reoptimize(
+    T: np.ndarray, basis: List[int], iteration_limit: int = 100
+) -> Tuple[str, np.ndarray, int]:
+    """Escolhe Simplex primal ou dual conforme a viabilidade da base atual.
+
+    Se a base não for nem primal nem dual viável, retorna ``"cold"`` para que
+    o chamador recorra a uma resolução completa (Big-M).
+    """
+    primal_ok = np.all(T[1:, -1] >= -1e-9)
+    dual_ok = SimplexSolver._is_optimal(T)
+    if primal_ok:
+        return primal_simplex(T, basis, iteration_limit)
+    if dual_ok:
+        return dual_simplex(T, basis, iteration_limit)
+    return "cold", T, 0
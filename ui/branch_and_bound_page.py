@@ -1,10 +1,23 @@
+from collections import deque
+
 import streamlit as st
 import pandas as pd
 import numpy as np # Adicionado para tratar tipos do numpy na formatação
 
 from .helpers import _store_problem, _load_problem, number_emojis
+from .plots import BranchBoundOverlay
 from core.branch_bound_solver import BranchBoundSolver
-from ui.lang import t
+from core.cancellation import CancellationToken
+from .helpers import SOLVE_TIME_LIMIT, is_cacheable, cached_result, store_result
+from .jobs import SolveJob, cancel_job, finished_job, show_job_progress, submit_job
+from core.solve_cache import problem_fingerprint
+from ui.lang import t, current_language
+
+# Árvores maiores que isto têm subárvores encerradas agrupadas em resumos
+TREE_COLLAPSE_THRESHOLD = 60
+# Nível de detalhe: máximo de nós desenhados e profundidade exibida
+TREE_MAX_NODES = 300
+TREE_MAX_DEPTH = 12
 
 def bab_ui():
     st.markdown(f"<h1 style='text-align: center;'>{t('bab.title')}</h1>", unsafe_allow_html=True)
@@ -148,26 +161,66 @@ def bab_ui():
                     final_c = [-x for x in final_c]
 
                 solver = BranchBoundSolver()
+                cancel_token = CancellationToken()
+                options = {
+                    "integer_vars": int_vars, "strategy": selected_strategy,
+                    "time_limit": SOLVE_TIME_LIMIT, "cancel_token": cancel_token,
+                }
                 
                 if step_by_step:
-                    solver.initialize(final_c, A_conv, b_conv, integer_vars=int_vars, strategy=selected_strategy)
-                    st.session_state["bb_solver"] = solver
+                    cancel_job("bb_job")
+                    st.session_state["bb_solver"] = solver # Salva para exibir resultados abaixo
+                    # Sem prazo: o relógio correria enquanto o usuário lê cada passo
+                    solver.initialize(final_c, A_conv, b_conv, **{**options, "time_limit": None})
                     st.rerun() # Força atualização para mostrar o botão de próximo passo imediatamente
                 else:
-                    # Modo normal (completo)
-                    solver.solve(final_c, A_conv, b_conv, integer_vars=int_vars, strategy=selected_strategy)
-                    st.session_state["bb_solver"] = solver # Salva para exibir resultados abaixo
+                    cache_key = problem_fingerprint(
+                        final_c, A_conv, b_conv, integer_vars=int_vars, solver="bb", strategy=selected_strategy
+                    )
+                    cached = cached_result(cache_key)
+                    if cached is not None:
+                        cancel_job("bb_job")
+                        st.session_state["bb_solver"] = cached
+                        st.toast(t("common.cached_result"))
+                    else:
+                        # Modo normal (completo): resolve num worker, com progresso e botão de cancelar
+                        # Progresso lido da página enquanto o worker expande a árvore (limite definido no initialize)
+                        job = SolveJob(
+                            solver, cancel_token,
+                            lambda: solver.iter_solve(final_c, A_conv, b_conv, **options),
+                            lambda job: (
+                                len(solver.nodes) / getattr(solver, "node_limit", float("inf")),
+                                t("bab.messages.progress").format(len(solver.nodes), len(getattr(solver, "queue", ()))),
+                            ),
+                            context={"cache_key": cache_key},
+                        )
+                        if submit_job("bb_job", job):
+                            st.session_state.pop("bb_solver", None)
                     
         except Exception as e:
             st.error(f"{t('bab.messages.error')} {str(e)}")
             st.exception(e)
 
+    # Resolução em segundo plano: recolhe o resultado quando o worker termina
+    job = finished_job("bb_job")
+    if job is not None:
+        if job.error is not None:
+            st.error(f"{t('bab.messages.error')} {str(job.error)}")
+            st.exception(job.error)
+        else:
+            st.session_state["bb_solver"] = job.solver
+            if is_cacheable(job.solver):
+                store_result(job.context["cache_key"], job.solver)
+    show_job_progress("bb_job")
+
     # Lógica de execução do próximo passo (verificação via chave ou botão renderizado posteriormente)
     pass
 
     # Exibição dos Resultados (sempre que houver um solver no estado)
     if "bb_solver" in st.session_state:
         solver = st.session_state["bb_solver"]
+        if solver.stop_reason in ("time_limit", "cancelled"):
+            st.warning(t(f"bab.messages.stopped_{solver.stop_reason}"))
         
         # Resultados Parciais ou Finais
         if solver.nodes: # Só mostrar se já tiver algum nó
@@ -208,6 +261,10 @@ def bab_ui():
 
             # Renderizar Grafo
             _render_branch_bound_tree(solver)
+
+            # Modelos com 2 variáveis: região, pontos inteiros e ramificações
+            if len(solver.c) == 2:
+                _render_branch_bound_region(solver)
             
             # Exibir logs, solução e legenda ABAIXO do grafo em duas colunas
             st.markdown("---")
@@ -278,76 +335,80 @@ def _format_solution(solution, max_vars_to_show=5):
     return "{" + ", ".join(items) + "}"
 
 
+def _render_branch_bound_region(solver):
+    """
+    Região factível com a malha inteira, os cortes e as regiões podadas.
+    A sobreposição fica na sessão e é atualizada só com os nós novos.
+    """
+    state = st.session_state.get("bb_overlay")
+    if state is None or state[0] is not solver:
+        state = (solver, BranchBoundOverlay(solver.c, solver.A, solver.b, solver.integer_vars))
+        st.session_state["bb_overlay"] = state
+    overlay = state[1]
+    overlay.update(solver.nodes)
+
+    fig = overlay.figure(incumbent=solver.best_solution)
+    if fig is not None:
+        st.markdown(t("bab.results.plot_title"))
+        st.plotly_chart(fig, width="stretch")
+
+
 def _render_branch_bound_tree(solver):
     """
     Renderiza a árvore de Branch & Bound usando a biblioteca st-link-analysis.
+
+    Os elementos de cada nó ficam em cache na sessão e só são refeitos quando
+    o status do nó muda. Árvores grandes são resumidas (ver ``_visible_tree``)
+    e a chave do componente é fixa: novos nós atualizam o grafo já montado,
+    refazendo apenas o layout.
     """
     
     try:
         from st_link_analysis import st_link_analysis, NodeStyle, EdgeStyle
 
-        nodes_data = []
-        edges_data = []
-
         status_map = {
             "OPTIMAL": {"label": t("bab.tree_labels.OPTIMAL"), "color": "#2e7d32"},
             "INTEGER": {"label": t("bab.tree_labels.INTEGER"), "color": "#8e24aa"},
             "INFEASIBLE": {"label": t("bab.tree_labels.INFEASIBLE"), "color": "#f44336"},
             "PRUNED": {"label": t("bab.tree_labels.PRUNED"), "color": "#9e9e9e"},
             "FRACTIONAL": {"label": t("bab.tree_labels.FRACTIONAL"), "color": "#2196f3"},
-            "ROOT": {"label": t("bab.tree_labels.ROOT"), "color": "#ffc107"}
+            "ROOT": {"label": t("bab.tree_labels.ROOT"), "color": "#ffc107"},
+            "SUMMARY": {"label": t("bab.tree_labels.SUMMARY"), "color": "#607d8b"},
         }
 
-        for node_info in solver.nodes:
-            node_id = str(node_info["id"])
-            
-            status_key = "ROOT"
-            if node_info['id'] == 0:
-                 status_key = "ROOT"
-                 # Se a raiz já for inteira e ótima
-                 if node_info.get("integer_feasible") and abs(node_info["value"] - solver.best_value) < 1e-6:
-                     status_key = "OPTIMAL"
-            elif not node_info["feasible"]:
-                status_key = "INFEASIBLE"
-            elif node_info.get("integer_feasible"):
-                if abs(node_info["value"] - solver.best_value) < 1e-6:
-                    status_key = "OPTIMAL"
-                else:
-                    status_key = "INTEGER"
-            elif node_info.get("pruned"):
-                status_key = "PRUNED"
-            else:
-                status_key = "FRACTIONAL"
-            
-            status_details = status_map[status_key]
-            
-            bounds_str = ", ".join([f"x{var+1} {op} {val}" for var, (op, val) in node_info.get("bounds", {}).items()])
-            
-            solution_str = _format_solution(node_info.get("solution"))
-
-            nodes_data.append({
-                "data": {
-                    "id": node_id,
-                    "label": status_details["label"],
-                    "caption": f"Z={node_info.get('value', 0):.2f}",
-                    "Valor Z": f"{node_info.get('value', 0):.3f}",
-                    "Status": status_details["label"],
-                    "Bounds": bounds_str if bounds_str else "Nenhum",
-                    "Solução": solution_str
-                }
-            })
-
-            if node_info.get("parent") is not None:
-                branch_label = node_info.get("branch_reason", "BRANCH")
-                edges_data.append({
-                    "data": {
-                        "id": f'edge_{node_info["parent"]}_{node_id}',
-                        "label": branch_label,
-                        "source": str(node_info["parent"]),
-                        "target": node_id,
-                        "Solução": solution_str  # Adds solution info to the edge sidebar
-                    }
-                })
+        # Elementos já montados (id -> (assinatura, nó, aresta)) desta resolução
+        state = st.session_state.get("bb_tree_elements")
+        if state is None or state[0] is not solver:
+            state = (solver, {})
+            st.session_state["bb_tree_elements"] = state
+        element_cache = state[1]
+
+        visible, summaries = _visible_tree(solver)
+        language = current_language()
+        nodes_data = []
+        edges_data = []
+
+        for node_id in visible:
+            node_info = solver.nodes[node_id]
+            status_key = _node_status(node_info, solver.best_value)
+            signature = (status_key, language)
+            cached = element_cache.get(node_id)
+            if cached is None or cached[0] != signature:
+                cached = (signature, *_tree_elements(node_info, status_map[status_key]["label"]))
+                element_cache[node_id] = cached
+            nodes_data.append(cached[1])
+            if cached[2] is not None:
+                edges_data.append(cached[2])
+
+        # Subárvores agrupadas: um nó-resumo por pai visível
+        for parent_id, hidden in summaries.items():
+            summary_id = f"more_{parent_id}"
+            label = t("bab.results.tree_hidden").format(hidden)
+            nodes_data.append({"data": {"id": summary_id, "label": status_map["SUMMARY"]["label"], "caption": label, "Status": label}})
+            edges_data.append({"data": {"id": f"edge_{parent_id}_{summary_id}", "label": "…", "source": str(parent_id), "target": summary_id}})
+
+        if summaries:
+            st.caption(t("bab.results.tree_lod").format(len(visible), len(solver.nodes)))
         
         node_styles = [
             NodeStyle(status["label"], status["color"], "caption")
@@ -368,6 +429,8 @@ def _render_branch_bound_tree(solver):
             "rankSep": 50,        # Ajustado para equilíbrio
             "nodeSep": 40,        # Ajustado para equilíbrio
             "spacingFactor": 1.2,
+            # Muda junto com a estrutura exibida: o componente refaz só o layout (sem remontar)
+            "revision": str(hash((tuple(visible), tuple(summaries.items())))),
         }
 
         st_link_analysis(
@@ -375,9 +438,120 @@ def _render_branch_bound_tree(solver):
             layout=layout_config,
             node_styles=node_styles,
             edge_styles=edge_styles,
-            key=f"bb_tree_viz_{len(solver.nodes)}" # Chave dinâmica para forçar re-renderização do layout a cada passo
+            key="bb_tree_viz",
         )
         
     except Exception as e:
         st.error(f"❌ Ocorreu um erro inesperado ao tentar renderizar a árvore: {str(e)}")
-        st.exception(e)
\ No newline at end of file
+        st.exception(e)
+
+
+def _node_status(node_info, best_value):
+    """Chave de ``status_map`` para o nó (depende do incumbente atual)."""
+    if node_info["id"] == 0:
+        # Se a raiz já for inteira e ótima
+        if node_info.get("integer_feasible") and abs(node_info["value"] - best_value) < 1e-6:
+            return "OPTIMAL"
+        return "ROOT"
+    if not node_info["feasible"]:
+        return "INFEASIBLE"
+    if node_info.get("integer_feasible"):
+        return "OPTIMAL" if abs(node_info["value"] - best_value) < 1e-6 else "INTEGER"
+    if node_info.get("pruned"):
+        return "PRUNED"
+    return "FRACTIONAL"
+
+
+def _tree_elements(node_info, label):
+    """Elementos (nó, aresta do pai ou ``None``) do st-link-analysis para um nó."""
+    node_id = str(node_info["id"])
+    bounds_str = ", ".join([f"x{var+1} {op} {val}" for var, (op, val) in node_info.get("bounds", {}).items()])
+    solution_str = _format_solution(node_info.get("solution"))
+
+    node = {
+        "data": {
+            "id": node_id,
+            "label": label,
+            "caption": f"Z={node_info.get('value', 0):.2f}",
+            "Valor Z": f"{node_info.get('value', 0):.3f}",
+            "Status": label,
+            "Bounds": bounds_str if bounds_str else "Nenhum",
+            "Solução": solution_str
+        }
+    }
+    edge = None
+    if node_info.get("parent") is not None:
+        branch_label = node_info.get("branch_reason", "BRANCH")
+        edge = {
+            "data": {
+                "id": f'edge_{node_info["parent"]}_{node_id}',
+                "label": branch_label,
+                "source": str(node_info["parent"]),
+                "target": node_id,
+                "Solução": solution_str  # Adds solution info to the edge sidebar
+            }
+        }
+    return node, edge
+
+
+def _visible_tree(solver):
+    """
+    Nós exibidos (ids, em largura) e resumos ``{pai: nós ocultos}``.
+
+    Até ``TREE_COLLAPSE_THRESHOLD`` nós a árvore aparece inteira. Acima
+    disso, subárvores já encerradas sem solução inteira (só podados e
+    inviáveis) viram um resumo, nada abaixo de ``TREE_MAX_DEPTH`` é
+    exibido e no máximo ``TREE_MAX_NODES`` nós são desenhados. O caminho
+    da raiz até o incumbente é sempre mantido.
+    """
+    nodes = solver.nodes
+    total = len(nodes)
+    if total <= TREE_COLLAPSE_THRESHOLD:
+        return [node["id"] for node in nodes if node is not None], {}
+
+    children = [[] for _ in range(total)]
+    for node in nodes:
+        if node is not None and node["parent"] is not None:
+            children[node["parent"]].append(node["id"])
+
+    # Filhos têm id maior que o pai: percorrer de trás para frente é pós-ordem
+    size = [1] * total
+    closed = [False] * total
+    for i in range(total - 1, -1, -1):
+        for k in children[i]:
+            size[i] += size[k]
+        node = nodes[i]
+        if node is None:
+            closed[i] = True
+        elif children[i]:
+            closed[i] = all(closed[k] for k in children[i])
+        else:
+            closed[i] = not node["feasible"] or node.get("pruned") == "bound"
+
+    keep = set()
+    incumbent = next(
+        (node["id"] for node in nodes
+         if node is not None and node.get("integer_feasible") and abs(node["value"] - solver.best_value) < 1e-6),
+        None,
+    )
+    while incumbent is not None:
+        keep.add(incumbent)
+        incumbent = nodes[incumbent]["parent"] if nodes[incumbent] is not None else None
+
+    visible, summaries = [], {}
+    frontier = deque([(0, 0)])
+    while frontier:
+        node_id, depth = frontier.popleft()
+        visible.append(node_id)
+        for k in children[node_id]:
+            shown = k in keep or (
+                nodes[k] is not None
+                and not (closed[k] and size[k] > 1)
+                and depth < TREE_MAX_DEPTH
+                and len(visible) + len(frontier) < TREE_MAX_NODES
+            )
+            if shown:
+                frontier.append((k, depth + 1))
+            else:
+                summaries[node_id] = summaries.get(node_id, 0) + size[k]
+    return visible, summaries
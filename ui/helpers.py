@@ -1,5 +1,20 @@
+import os
+from pathlib import Path
+
 import streamlit as st
 
+from core.persistent_cache import PersistentSolveCache
+from core.solve_cache import SolveCache
+
+# Nenhuma resolução disparada pela UI roda por mais que isto (servidor compartilhado)
+SOLVE_TIME_LIMIT = 30.0
+# Entradas do cache de resultados compartilhado entre sessões
+SOLVE_CACHE_SIZE = 64
+# Cache em disco (SQLite) compartilhado entre processos; SOLVER_PL_CACHE_DB="" desativa
+SOLVE_CACHE_DB = os.environ.get(
+    "SOLVER_PL_CACHE_DB", str(Path(__file__).resolve().parent.parent / ".cache" / "solve_cache.sqlite")
+)
+
 def _store_problem(c, A, b, int_vars=None):
     st.session_state["problem"] = {"c": c, "A": A, "b": b, "int_vars": int_vars or []}
 
@@ -21,4 +36,59 @@ number_emojis = {
         8: "8️⃣",
         9: "9️⃣",
         10: "🔟"
-    }
\ No newline at end of file
+    }
+
+
+@st.cache_resource
+def solve_cache() -> SolveCache:
+    """Cache LRU de resultados, um por servidor (compartilhado entre sessões)."""
+    return SolveCache(maxsize=SOLVE_CACHE_SIZE)
+
+
+@st.cache_resource
+def persistent_cache() -> PersistentSolveCache | None:
+    """Cache em disco (``None`` se desativado ou se o arquivo não puder ser aberto)."""
+    if not SOLVE_CACHE_DB:
+        return None
+    try:
+        return PersistentSolveCache(SOLVE_CACHE_DB)
+    except Exception:
+        return None
+
+
+def is_cacheable(solver) -> bool:
+    """Resultados interrompidos por prazo ou cancelamento não vão para o cache."""
+    return solver.finished and solver.stop_reason not in ("time_limit", "cancelled")
+
+
+def cached_result(key):
+    """Resultado já calculado para ``key``: memória primeiro, depois o disco.
+
+    Um acerto no disco volta para o cache em memória. Falhas de E/S contam
+    como ausência — o cache nunca impede a resolução.
+    """
+    value = solve_cache().get(key)
+    if value is not None:
+        return value
+    disk = persistent_cache()
+    if disk is None:
+        return None
+    try:
+        entry = disk.get(key)
+    except Exception:
+        return None
+    if entry is None or entry["trace"] is None:
+        return None
+    solve_cache().put(key, entry["trace"])
+    return entry["trace"]
+
+
+def store_result(key, value, summary=None) -> None:
+    """Guarda ``value`` nos caches em memória e em disco (``summary``: resumo JSON)."""
+    solve_cache().put(key, value)
+    disk = persistent_cache()
+    if disk is not None:
+        try:
+            disk.put(key, value, summary)
+        except Exception:
+            pass
@@ -0,0 +1,166 @@
+"""Resoluções em segundo plano para as páginas do Streamlit.
+
+A página cria o solver, embrulha a execução num ``SolveJob`` e o envia com
+``submit_job``: o script termina na hora e a resolução roda numa thread do
+``SolvePool`` (um por servidor, compartilhado entre sessões). Enquanto isso,
+``show_job_progress`` exibe uma barra de progresso alimentada pelos eventos
+do ``iter_solve`` e um botão de cancelar (``CancellationToken``); quando o
+job termina, a página é reexecutada e ``finished_job`` entrega o resultado.
+
+Justiça entre usuários: o pool tem ``SOLVE_WORKERS`` threads e aceita no
+máximo ``MAX_PENDING_JOBS`` jobs esperando (além disso o envio é recusado),
+cada sessão tem um único job por página (um novo envio cancela o anterior)
+e toda resolução respeita ``SOLVE_TIME_LIMIT``.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import streamlit as st
+
+from core.cancellation import CancellationToken
+from ui.lang import t
+
+# Threads de resolução por servidor; SOLVER_PL_WORKERS ajusta
+SOLVE_WORKERS = int(os.environ.get("SOLVER_PL_WORKERS", "4"))
+# Jobs aguardando um worker livre; acima disso novos envios são recusados
+MAX_PENDING_JOBS = 16
+# Intervalo (segundos) entre atualizações da barra de progresso
+PROGRESS_INTERVAL = 0.5
+
+
+class SolveJob:
+    """Uma resolução enviada ao pool.
+
+    ``run()`` executa o solver e devolve os eventos (``iter_solve``) ou
+    ``None``; ``progress(job)`` devolve ``(fração ou None, texto)`` para a
+    barra. Só a thread do worker escreve no job e no solver; a página apenas
+    lê contadores até ``done`` — depois disso o solver é da página.
+    ``context`` guarda o que a página precisa para recolher o resultado.
+    """
+
+    def __init__(
+        self,
+        solver,
+        cancel_token: CancellationToken,
+        run: Callable[[], Optional[Iterable]],
+        progress: Callable[["SolveJob"], Tuple[Optional[float], str]],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.solver = solver
+        self.cancel_token = cancel_token
+        self.context = context or {}
+        self.events = 0
+        self.last_event = None
+        self.error: Optional[BaseException] = None
+        self.submitted = time.perf_counter()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.future: Optional[Future] = None
+        self._run = run
+        self._progress = progress
+
+    @property
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def cancel(self) -> None:
+        """Pede o cancelamento; um job ainda na fila termina logo ao começar."""
+        self.cancel_token.cancel()
+
+    def progress(self) -> Tuple[Optional[float], str]:
+        if self.started is None:
+            return 0.0, t("common.job_queued")
+        return self._progress(self)
+
+    def _work(self) -> None:
+        self.started = time.perf_counter()
+        try:
+            for event in self._run() or ():
+                self.last_event = event
+                self.events += 1
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = time.perf_counter()
+
+
+class SolvePool:
+    """Pool limitado de threads; ``submit`` recusa (``False``) quando está cheio."""
+
+    def __init__(self, workers: int = SOLVE_WORKERS, max_pending: int = MAX_PENDING_JOBS) -> None:
+        if workers < 1:
+            raise ValueError("workers deve ser pelo menos 1.")
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solver_pl")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+
+    def submit(self, job: SolveJob) -> bool:
+        if not self._slots.acquire(blocking=False):
+            return False
+        job.future = self._executor.submit(job._work)
+        job.future.add_done_callback(lambda _: self._slots.release())
+        return True
+
+
+@st.cache_resource
+def solve_pool() -> SolvePool:
+    """Pool de resolução, um por servidor (compartilhado entre sessões)."""
+    return SolvePool()
+
+
+def submit_job(key: str, job: SolveJob) -> bool:
+    """Envia ``job`` e o guarda em ``st.session_state[key]``, cancelando o job anterior da sessão.
+
+    Retorna ``False`` (e avisa na página) se o servidor estiver cheio.
+    """
+    cancel_job(key)
+    if not solve_pool().submit(job):
+        st.warning(t("common.server_busy"))
+        return False
+    st.session_state[key] = job
+    return True
+
+
+def cancel_job(key: str) -> None:
+    """Cancela o job de ``key`` (se ainda roda) e o retira da sessão.
+
+    Usado quando a página obtém o resultado por outro caminho (passo a passo,
+    cache): o job antigo não deve sobrescrever o solver nem manter a barra.
+    """
+    job = st.session_state.pop(key, None)
+    if job is not None and not job.done:
+        job.cancel()
+
+
+def finished_job(key: str) -> Optional[SolveJob]:
+    """O job de ``key`` se já terminou (e o retira da sessão); senão ``None``."""
+    job = st.session_state.get(key)
+    if job is None or not job.done:
+        return None
+    del st.session_state[key]
+    return job
+
+
+def show_job_progress(key: str) -> None:
+    """Barra de progresso e botão de cancelar enquanto o job de ``key`` roda."""
+    if key in st.session_state:
+        _job_progress(key)
+
+
+@st.fragment(run_every=PROGRESS_INTERVAL)
+def _job_progress(key: str) -> None:
+    # Só este trecho é reexecutado a cada intervalo; ao terminar, a página inteira recolhe o resultado
+    job = st.session_state.get(key)
+    if job is None:
+        return
+    if job.done:
+        st.rerun()
+    fraction, text = job.progress()
+    if fraction is None:
+        st.caption(text)
+    else:
+        st.progress(min(max(fraction, 0.0), 1.0), text=text)
+    st.button(t("common.cancel"), on_click=job.cancel, key=f"{key}_cancel", disabled=job.cancel_token.cancelled)
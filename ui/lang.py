@@ -1,6 +1,7 @@
 import streamlit as st
 import json
 import os
+import time
 
 # --- Configuration ---
 LOCALES_DIR = os.path.join(os.path.dirname(__file__), "locales")
@@ -17,18 +18,42 @@ DISPLAY_NAMES = {
 
 # Global storage for loaded languages
 STRINGS = {}
+FLAT_STRINGS = {}  # Format: {"code": {"dotted.key": value}} (one entry per nested node)
 AVAILABLE_LANGUAGES = {}  # Format: {"code": "Display Name"}
 
+# Locale files are checked for changes (mtime) at most once per interval
+RELOAD_CHECK_INTERVAL = 2.0
+_MTIMES = {}  # Format: {"filename": mtime_ns} of the files currently loaded
+_last_check = 0.0
 
-def load_languages():
+
+def _flatten(tree, prefix=""):
+    """{"a": {"b": "x"}} -> {"a": {...}, "a.b": "x"}: every node reachable by its dotted path."""
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+    return flat
+
+
+def _scan_locales():
+    """{"filename": mtime_ns} of the JSON files in LOCALES_DIR."""
+    with os.scandir(LOCALES_DIR) as entries:
+        return {e.name: e.stat().st_mtime_ns for e in entries if e.name.endswith(".json") and e.is_file()}
+
+
+def load_languages(force: bool = False):
     """
-    Loads all JSON translation files from the 'locales' directory.
-    Updates STRINGS and AVAILABLE_LANGUAGES globals.
+    Loads the JSON translation files from the 'locales' directory.
+    Only files that are new or whose mtime changed are re-read (all of them
+    if force=True); removed files are dropped.
+    Updates STRINGS, FLAT_STRINGS and AVAILABLE_LANGUAGES globals.
     """
-    global STRINGS, AVAILABLE_LANGUAGES
-    STRINGS = {}
-    AVAILABLE_LANGUAGES = {}
-    
+    global STRINGS, FLAT_STRINGS, AVAILABLE_LANGUAGES, _MTIMES, _last_check
+    _last_check = time.monotonic()
+
     if not os.path.exists(LOCALES_DIR):
         # Fallback/Safety: Create directory if it doesn't exist
         try:
@@ -37,58 +62,64 @@ def load_languages():
            pass
         return
 
-    # iterate over JSON files
-    for filename in sorted(os.listdir(LOCALES_DIR)):
-        if filename.endswith(".json"):
-            lang_code = filename[:-5]
-            try:
-                file_path = os.path.join(LOCALES_DIR, filename)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    STRINGS[lang_code] = json.load(f)
-                
-                # Set display name (default to Upper Code if unknown)
-                AVAILABLE_LANGUAGES[lang_code] = DISPLAY_NAMES.get(lang_code, lang_code.upper())
-            except Exception as e:
-                print(f"Error loading language file {filename}: {e}")
+    mtimes = _scan_locales()
+    if not force and mtimes == _MTIMES:
+        return
+
+    # Build new dicts and swap them in at the end (reruns run in parallel threads)
+    strings, flat = {}, {}
+    for filename in sorted(mtimes):
+        lang_code = filename[:-5]
+        if not force and _MTIMES.get(filename) == mtimes[filename] and lang_code in STRINGS:
+            strings[lang_code], flat[lang_code] = STRINGS[lang_code], FLAT_STRINGS[lang_code]
+            continue
+        try:
+            file_path = os.path.join(LOCALES_DIR, filename)
+            with open(file_path, "r", encoding="utf-8") as f:
+                strings[lang_code] = json.load(f)
+            flat[lang_code] = _flatten(strings[lang_code])
+        except Exception as e:
+            print(f"Error loading language file {filename}: {e}")
+            # Keep the previous version (e.g. file caught mid-save)
+            if lang_code in STRINGS:
+                strings[lang_code], flat[lang_code] = STRINGS[lang_code], FLAT_STRINGS[lang_code]
+
+    # Set display name (default to Upper Code if unknown)
+    AVAILABLE_LANGUAGES = {code: DISPLAY_NAMES.get(code, code.upper()) for code in strings}
+    STRINGS, FLAT_STRINGS, _MTIMES = strings, flat, mtimes
 
 # Perform initial load on module import
 load_languages()
 
 
-def t(key_path: str) -> any:
-    """
-    Retrieves a string or object from the dictionary based on the current language.
-    Usage: t("home.title")
-    """
+def current_language() -> str:
+    """Code of the language t() translates to (session choice or its fallback)."""
     # Default to 'pt' if language not set
     current_lang = st.session_state.get("language", "pt")
     
     # Fallback to 'pt' if current_lang is not loaded
-    if current_lang not in STRINGS:
+    if current_lang not in FLAT_STRINGS:
         current_lang = "pt"
         # If 'pt' is also missing (e.g. only 'en.json' exists), take the first available
-        if "pt" not in STRINGS and STRINGS:
-             current_lang = list(STRINGS.keys())[0]
-    
-    keys = key_path.split(".")
-    
-    # Start with the language dictionary
-    value = STRINGS.get(current_lang, {})
-    
-    # Traverse keys
-    for k in keys:
-        if isinstance(value, dict):
-             value = value.get(k, None)
-        else:
-             return f"[{key_path}]" # Key nesting error
-        
-        if value is None:
-            return f"[{key_path}]" # Key not found
-            
+        if "pt" not in FLAT_STRINGS and FLAT_STRINGS:
+             current_lang = next(iter(FLAT_STRINGS))
+    return current_lang
+
+
+def t(key_path: str) -> any:
+    """
+    Retrieves a string or object from the dictionary based on the current language.
+    Usage: t("home.title")
+    """
+    value = FLAT_STRINGS.get(current_language(), {}).get(key_path)
+    if value is None:
+        return f"[{key_path}]" # Key not found
     return value
 
 
 def get_available_languages():
-    """Returns the dictionary of available languages, reloading from disk to catch new files."""
-    load_languages()
+    """Returns the dictionary of available languages, picking up new or edited files
+    (checked at most once every RELOAD_CHECK_INTERVAL seconds)."""
+    if time.monotonic() - _last_check >= RELOAD_CHECK_INTERVAL:
+        load_languages()
     return AVAILABLE_LANGUAGES
@@ -0,0 +1,43 @@
+"""Páginas carregadas sob demanda para o ``st.navigation`` do ``app.py``.
+
+``lazy_page("ui.simplex_page", "simplex_ui")`` devolve uma função com o mesmo
+nome da página (o ``st.Page`` deriva a URL dele) que só importa o módulo
+quando a página é exibida pela primeira vez. Assim abrir a Home não espera
+plotly, pandas, ``st_link_analysis`` e os solvers.
+
+O tempo da primeira importação de cada módulo fica em ``IMPORT_TIMES``
+(segundos) e aparece no log do Streamlit com ``--logger.level=debug``.
+"""
+
+import importlib
+import sys
+import time
+from typing import Callable, Dict
+
+from streamlit.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Módulo -> segundos gastos na primeira importação (neste processo)
+IMPORT_TIMES: Dict[str, float] = {}
+
+
+def lazy_page(module: str, func: str) -> Callable[[], None]:
+    """Página que importa ``module`` e chama ``module.func()`` ao ser exibida."""
+
+    def page():
+        return getattr(load_module(module), func)()
+
+    page.__name__ = page.__qualname__ = func
+    return page
+
+
+def load_module(module: str):
+    """Importa ``module`` registrando o tempo da primeira importação."""
+    if module in sys.modules:
+        return sys.modules[module]
+    start = time.perf_counter()
+    loaded = importlib.import_module(module)
+    IMPORT_TIMES[module] = time.perf_counter() - start
+    _LOGGER.debug("Página %s importada em %.1f ms", module, IMPORT_TIMES[module] * 1000)
+    return loaded
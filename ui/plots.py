@@ -1,10 +1,59 @@
-from itertools import combinations
+from collections import deque
+from functools import wraps
+from itertools import chain, combinations, islice, product
 from typing import List, Tuple, Optional
-from ui.lang import t
+from ui.lang import t, current_language
 
 import numpy as np
 import plotly.graph_objects as go
 
+from core.projection import projection_constraints, slice_constraints
+from core.solve_cache import SolveCache
+
+# Figuras das regiões factíveis já montadas (LRU, compartilhado entre sessões)
+FIGURE_CACHE_SIZE = 32
+# Acima disto, feasible_region_2d usa WebGL e um único traço para as restrições
+LARGE_PLOT_CONSTRAINTS = 20
+_FIGURE_CACHE = SolveCache(maxsize=FIGURE_CACHE_SIZE)
+
+
+def memoized_figure(func):
+    """
+    Guarda a figura de ``func(c, A, b, optimal_solution)`` no ``_FIGURE_CACHE``,
+    indexada pelos dados do problema e pelo idioma (rótulos vêm de t()).
+    A figura devolvida é compartilhada: quem chama não deve modificá-la.
+    """
+    @wraps(func)
+    def wrapper(c, A, b, optimal_solution=None, **options):
+        key = (
+            func.__name__,
+            current_language(),
+            _as_key(c),
+            tuple(_as_key(row) for row in A),
+            _as_key(b),
+            None if optimal_solution is None else _as_key(optimal_solution),
+            tuple((name, _freeze(value)) for name, value in sorted(options.items())),
+        )
+        return _FIGURE_CACHE.get_or_compute(
+            key, lambda: func(c, A, b, optimal_solution=optimal_solution, **options)
+        )
+    return wrapper
+
+
+def _as_key(values):
+    return tuple(float(v) for v in values)
+
+
+def _freeze(value):
+    """Versão hashable de opções (dicts, listas e arrays aninhados)."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (np.generic, float, int)):
+        return value.item() if isinstance(value, np.generic) else value
+    return value
+
 
 def _get_hyperplanes(c, A, b):
     """
@@ -31,33 +80,227 @@ def _get_hyperplanes(c, A, b):
 
 def find_vertices(A_all, b_all, n_vars):
     """
-    Encontra vértices da região factível testando interseções.
-    Funciona para n_vars = 2 ou 3.
+    Encontra os vértices da região factível {x : A_all x <= b_all}.
+    2D: interseção de semiplanos (ordenação por ângulo + deque), O(m log m).
+    3D: descrição dupla incremental (corte de um poliedro por semiespaço).
+    Regiões degeneradas (sem interior, ex.: igualdades) e outras dimensões
+    caem na enumeração combinatória das interseções.
+    """
+    A_all = np.asarray(A_all, dtype=float)
+    b_all = np.asarray(b_all, dtype=float)
+
+    vertices = None
+    if n_vars == 2:
+        vertices = _half_plane_vertices(A_all, b_all)
+    elif n_vars == 3:
+        vertices = _double_description_vertices(A_all, b_all)
+    if vertices is None:
+        return _combinatorial_vertices(A_all, b_all, n_vars)
+
+    # Mesmo critério de factibilidade e deduplicação da enumeração combinatória
+    vertices = vertices[np.all(vertices @ A_all.T <= b_all + 1e-6, axis=1)]
+    return _unique_rows(vertices)
+
+
+def _combinatorial_vertices(A_all, b_all, n_vars, chunk_size=50_000):
+    """
+    Testa as C(m, n) interseções de n restrições (fallback), em lotes:
+    sistemas empilhados (K, n, n) resolvidos numa única chamada, máscara
+    para os singulares (det == 0) e factibilidade como um produto matricial.
+    Mesmo resultado, na mesma ordem, que testar combinação por combinação.
     """
-    vertices = []
     n_constraints = len(b_all)
-    
-    # Combinar n_vars restrições para achar intersecção
-    # C(n_constraints, n_vars)
-    for indices in combinations(range(n_constraints), n_vars):
+    combos = combinations(range(n_constraints), n_vars)
+    candidates = []
+    while True:
+        idx = np.fromiter(chain.from_iterable(islice(combos, chunk_size)), dtype=np.intp).reshape(-1, n_vars)
+        if len(idx) == 0:
+            break
+        A_sub = A_all[idx]
+        b_sub = b_all[idx]
+        regular = np.linalg.det(A_sub) != 0
+        A_sub, b_sub = A_sub[regular], b_sub[regular]
         try:
-            A_sub = A_all[list(indices)]
-            b_sub = b_all[list(indices)]
-            
-            # Resolver sistema linear A_sub * x = b_sub
-            if np.linalg.det(A_sub) != 0:
-                x = np.linalg.solve(A_sub, b_sub)
-                
-                # Verificar se satisfaz TODAS as outras restrições
-                # Tolerância numérica é crucial
-                if np.all(np.dot(A_all, x) <= b_all + 1e-6):
-                    # Filtrar duplicatas
-                    if not any(np.allclose(x, v) for v in vertices):
-                        vertices.append(x)
+            X = np.linalg.solve(A_sub, b_sub[..., None])[..., 0]
         except np.linalg.LinAlgError:
+            # Algum sistema com det != 0 mas singular na fatoração: resolve um a um
+            X = np.array([_solve_or_nan(a, rhs) for a, rhs in zip(A_sub, b_sub)]).reshape(-1, n_vars)
+            X = X[~np.isnan(X).any(axis=1)]
+        # Verificar se satisfaz TODAS as restrições (tolerância numérica é crucial)
+        feasible = np.all(X @ A_all.T <= b_all + 1e-6, axis=1)
+        candidates.append(X[feasible])
+
+    if not candidates:
+        return np.array([])
+    return _dedupe_allclose(np.vstack(candidates))
+
+
+def _solve_or_nan(A_sub, b_sub):
+    try:
+        return np.linalg.solve(A_sub, b_sub)
+    except np.linalg.LinAlgError:
+        return np.full(len(b_sub), np.nan)
+
+
+def _dedupe_allclose(points):
+    """
+    Mantém cada ponto que não é ``np.allclose`` a um já mantido (em ordem).
+    Pontos são indexados numa grade com células do tamanho da tolerância do
+    allclose; cada ponto só é comparado com os das células vizinhas.
+    """
+    if len(points) == 0:
+        return np.array([])
+    rtol, atol = 1e-5, 1e-8  # padrões do np.allclose
+    cell = atol + rtol * np.max(np.abs(points))
+    keys = np.floor(points / cell).astype(np.int64)
+    offsets = list(product((-1, 0, 1), repeat=points.shape[1]))
+
+    grid = {}
+    kept = []
+    for i, key in enumerate(map(tuple, keys)):
+        near = (j for off in offsets for j in grid.get(tuple(k + o for k, o in zip(key, off)), ()))
+        if any(np.allclose(points[i], points[j]) for j in near):
+            continue
+        grid.setdefault(key, []).append(i)
+        kept.append(i)
+    return points[kept]
+
+
+def _normalized_with_box(A_all, b_all, n_vars):
+    """
+    Normaliza as linhas (folga = distância) e acrescenta a caixa |x_i| <= M,
+    grande o bastante para conter os vértices de interesse. Retorna
+    (A, b, is_box) ou None se alguma linha nula for violada (0 <= b < 0).
+    """
+    norms = np.linalg.norm(A_all, axis=1)
+    nonzero = norms > 1e-12
+    if np.any(~nonzero & (b_all < -1e-6)):
+        return None
+    A = A_all[nonzero] / norms[nonzero, None]
+    b = b_all[nonzero] / norms[nonzero]
+    M = 1e6 * (1.0 + (np.max(np.abs(b)) if len(b) else 0.0))
+    box = np.vstack([np.eye(n_vars), -np.eye(n_vars)])
+    is_box = np.r_[np.zeros(len(b), dtype=bool), np.ones(2 * n_vars, dtype=bool)]
+    return np.vstack([A, box]), np.r_[b, np.full(2 * n_vars, M)], is_box
+
+
+def _half_plane_vertices(A_all, b_all):
+    """
+    Interseção de semiplanos a·x <= b: ordena pelo ângulo da normal e mantém
+    em um deque apenas os semiplanos que formam a fronteira.
+    Retorna os vértices (sem os da caixa auxiliar) ou None se a região for
+    vazia ou sem interior — casos deixados para a enumeração combinatória.
+    """
+    prepared = _normalized_with_box(A_all, b_all, 2)
+    if prepared is None:
+        return np.empty((0, 2))
+    A, b, is_box = prepared
+
+    def intersect(i, j):
+        return np.linalg.solve(A[[i, j]], b[[i, j]])
+
+    def outside(i, p):
+        return A[i] @ p > b[i] + 1e-9 * (1.0 + np.max(np.abs(p)))
+
+    # Mesmo ângulo: só o semiplano mais restritivo (menor b) importa
+    angles = np.round(np.arctan2(A[:, 1], A[:, 0]), 12)
+    order = np.lexsort((b, angles))
+    order = order[np.r_[True, angles[order][1:] != angles[order][:-1]]]
+
+    dq = deque()
+    for i in order:
+        while len(dq) >= 2 and outside(i, intersect(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) >= 2 and outside(i, intersect(dq[0], dq[1])):
+            dq.popleft()
+        if dq and abs(np.cross(A[dq[-1]], A[i])) < 1e-12:
+            return None  # semiplanos opostos adjacentes: região vazia ou degenerada
+        dq.append(i)
+    while len(dq) >= 3 and outside(dq[0], intersect(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) >= 3 and outside(dq[-1], intersect(dq[0], dq[1])):
+        dq.popleft()
+    if len(dq) < 3:
+        return None
+
+    lines = list(dq)
+    vertices = []
+    for i, j in zip(lines, lines[1:] + lines[:1]):
+        if abs(np.cross(A[i], A[j])) < 1e-12:
+            return None
+        if not (is_box[i] or is_box[j]):
+            vertices.append(intersect(i, j))
+    return np.array(vertices).reshape(-1, 2)
+
+
+def _double_description_vertices(A_all, b_all):
+    """
+    Método da descrição dupla em 3D: parte da caixa auxiliar e corta por uma
+    restrição de cada vez. Cada vértice guarda o conjunto de restrições
+    ativas; dois vértices são adjacentes se nenhum outro vértice contém as
+    restrições ativas que eles têm em comum (teste combinatório). Arestas
+    que cruzam o plano de corte geram os novos vértices.
+    Retorna None se a região ficar vazia (fallback combinatório).
+    """
+    prepared = _normalized_with_box(A_all, b_all, 3)
+    if prepared is None:
+        return np.empty((0, 3))
+    A, b, is_box = prepared
+    m = len(b) - 6
+    M = b[-1]
+
+    # Caixa inicial: 8 cantos, cada um ativo em 3 faces da caixa
+    corners = np.array([[sx, sy, sz] for sx in (1, -1) for sy in (1, -1) for sz in (1, -1)], dtype=float)
+    V = corners * M
+    Z = np.zeros((8, len(b)), dtype=bool)
+    Z[:, m:] = np.isclose(V @ A[m:].T, b[m:])
+
+    for k in range(m):
+        slack = V @ A[k] - b[k]
+        tol = 1e-9 * (1.0 + np.max(np.abs(V), axis=1))
+        plus, minus = slack > tol, slack < -tol
+        if not np.any(minus) and not np.any(~plus):
+            return None
+        Z[~plus & ~minus, k] = True
+        if not np.any(plus):
             continue
-            
-    return np.array(vertices)
+
+        # Pares (vértice fora, vértice dentro) e as faces ativas em comum
+        P, N = np.flatnonzero(plus), np.flatnonzero(minus)
+        pi, nj = np.repeat(P, len(N)), np.tile(N, len(P))
+        common = Z[pi] & Z[nj]
+        candidate = common.sum(axis=1) >= 2
+        pi, nj, common = pi[candidate], nj[candidate], common[candidate]
+        # Adjacentes se nenhum outro vértice está em todas as faces comuns
+        missing = common.astype(np.int32) @ (~Z).T.astype(np.int32)
+        holders = missing == 0
+        rows = np.arange(len(pi))
+        holders[rows, pi] = False
+        holders[rows, nj] = False
+        adjacent = ~np.any(holders, axis=1)
+        pi, nj, common = pi[adjacent], nj[adjacent], common[adjacent]
+
+        step = slack[pi] / (slack[pi] - slack[nj])
+        new_V = V[pi] + step[:, None] * (V[nj] - V[pi])
+        new_Z = common
+        new_Z[:, k] = True
+
+        keep = ~plus
+        V = np.vstack([V[keep], new_V])
+        Z = np.vstack([Z[keep], new_Z])
+
+    if len(V) == 0:
+        return None
+    # Vértices na caixa auxiliar não pertencem à região original
+    return V[~np.any(Z[:, m:], axis=1)]
+
+
+def _unique_rows(vertices, decimals=6):
+    """Remove pontos repetidos (arredondados), preservando a primeira ocorrência."""
+    if len(vertices) == 0:
+        return np.array([])
+    _, first = np.unique(np.round(vertices, decimals), axis=0, return_index=True)
+    return vertices[np.sort(first)]
 
 def ordered_polygon_2d(vertices):
     """Ordena vértices 2D angularmente para plotagem correta."""
@@ -71,9 +314,20 @@ def ordered_polygon_2d(vertices):
     return vertices[sort_order]
 
 
-def feasible_region_2d(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None):
+@memoized_figure
+def feasible_region_2d(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None, large: Optional[bool] = None, show_constraints: bool = True, axis_names=("x₁", "x₂")):
+    """
+    Região factível 2D. ``large`` (padrão: mais de ``LARGE_PLOT_CONSTRAINTS``
+    restrições) usa WebGL e desenha todas as restrições num único traço de
+    segmentos recortados; só as ativas no ótimo entram na legenda.
+    ``show_constraints=False`` omite as retas das restrições e ``axis_names``
+    renomeia as variáveis nos eixos e rótulos.
+    """
+    xn, yn = axis_names
     if len(c) != 2:
         return None
+    if large is None:
+        large = len(A) > LARGE_PLOT_CONSTRAINTS
 
     A_all, b_all = _get_hyperplanes(c, A, b)
     vertices = find_vertices(A_all, b_all, 2)
@@ -87,9 +341,10 @@ def feasible_region_2d(c: List[float], A: List[List[float]], b: List[float], opt
     y_plot = np.append(vertices[:, 1], vertices[0, 1])
 
     fig = go.Figure()
+    Scatter = go.Scattergl if large else go.Scatter
 
     # Preenchimento
-    fig.add_trace(go.Scatter(
+    fig.add_trace(Scatter(
         x=x_plot, y=y_plot, fill="toself", 
         mode="lines+markers", name=t("tableau.results.feasible_region"),
         line=dict(color='rgba(0, 100, 255, 0.8)', width=2),
@@ -103,24 +358,29 @@ def feasible_region_2d(c: List[float], A: List[List[float]], b: List[float], opt
     x_range = np.linspace(x_min, x_max, 100)
     colors = ["red", "green", "orange", "purple", "brown"]
     
-    for idx, (a, rhs) in enumerate(zip(A, b)):
-        if abs(a[1]) > 1e-6:
-            y_line = (rhs - a[0] * x_range) / a[1]
-            mask = (y_line >= y_min) & (y_line <= y_max)
-            if np.any(mask):
-                 fig.add_trace(go.Scatter(
-                    x=x_range[mask], y=y_line[mask], mode="lines",
-                    name=f"R{idx+1}: {a[0]}x₁ + {a[1]}x₂ ≤ {rhs}",
-                    line=dict(color=colors[idx % len(colors)], dash='dash')
-                 ))
-        elif abs(a[0]) > 1e-6:
-            x_val = rhs / a[0]
-            if x_min <= x_val <= x_max:
-                fig.add_trace(go.Scatter(
-                    x=[x_val, x_val], y=[y_min, y_max], mode="lines",
-                    name=f"R{idx+1}: {a[0]}x₁ ≤ {rhs}",
-                    line=dict(color=colors[idx % len(colors)], dash='dash')
-                ))
+    if not show_constraints:
+        pass
+    elif large:
+        _add_merged_constraints(fig, A, b, (x_min, x_max, y_min, y_max), optimal_solution, colors, axis_names)
+    else:
+        for idx, (a, rhs) in enumerate(zip(A, b)):
+            if abs(a[1]) > 1e-6:
+                y_line = (rhs - a[0] * x_range) / a[1]
+                mask = (y_line >= y_min) & (y_line <= y_max)
+                if np.any(mask):
+                     fig.add_trace(go.Scatter(
+                        x=x_range[mask], y=y_line[mask], mode="lines",
+                        name=f"R{idx+1}: {a[0]}{xn} + {a[1]}{yn} ≤ {rhs}",
+                        line=dict(color=colors[idx % len(colors)], dash='dash')
+                     ))
+            elif abs(a[0]) > 1e-6:
+                x_val = rhs / a[0]
+                if x_min <= x_val <= x_max:
+                    fig.add_trace(go.Scatter(
+                        x=[x_val, x_val], y=[y_min, y_max], mode="lines",
+                        name=f"R{idx+1}: {a[0]}{xn} ≤ {rhs}",
+                        line=dict(color=colors[idx % len(colors)], dash='dash')
+                    ))
 
     # Gradiente (Seta com Annotation)
     center = vertices.mean(axis=0)
@@ -141,19 +401,88 @@ def feasible_region_2d(c: List[float], A: List[List[float]], b: List[float], opt
 
     # Ponto Ótimo
     if optimal_solution and len(optimal_solution) >= 2:
-        fig.add_trace(go.Scatter(
+        fig.add_trace(Scatter(
             x=[optimal_solution[0]], y=[optimal_solution[1]],
             mode="markers", name="Solução Ótima",
             marker=dict(symbol="star", size=20, color="gold", line=dict(color="white", width=1))
         ))
 
     fig.update_layout(
-        xaxis_title="x₁", yaxis_title="x₂",
+        xaxis_title=xn, yaxis_title=yn,
         showlegend=True, template="plotly_white", height=600
     )
     return fig
 
-def feasible_region_3d(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None):
+def clip_lines_2d(A, b, box):
+    """
+    Segmento de cada reta a·x = b dentro da caixa (x_min, x_max, y_min, y_max).
+    Retorna (m, 2, 2) com os extremos e a máscara das retas que cruzam a caixa.
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float)
+    x_min, x_max, y_min, y_max = box
+    a0, a1 = A[:, 0:1], A[:, 1:2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Cortes com as bordas verticais (x fixo) e horizontais (y fixo)
+        xs = np.array([x_min, x_max])
+        ys_at_x = (b[:, None] - a0 * xs) / a1
+        ys = np.array([y_min, y_max])
+        xs_at_y = (b[:, None] - a1 * ys) / a0
+    pts = np.concatenate([
+        np.stack([np.broadcast_to(xs, ys_at_x.shape), ys_at_x], axis=-1),
+        np.stack([xs_at_y, np.broadcast_to(ys, xs_at_y.shape)], axis=-1),
+    ], axis=1)  # (m, 4, 2)
+    tol = 1e-9 * max(1.0, x_max - x_min, y_max - y_min)
+    inside = (
+        np.isfinite(pts).all(axis=-1)
+        & (pts[..., 0] >= x_min - tol) & (pts[..., 0] <= x_max + tol)
+        & (pts[..., 1] >= y_min - tol) & (pts[..., 1] <= y_max + tol)
+    )
+    # Extremos ao longo da direção da reta
+    direction = np.stack([-A[:, 1], A[:, 0]], axis=1)
+    proj = np.einsum("mkd,md->mk", np.nan_to_num(pts), direction)
+    lo = np.where(inside, proj, np.inf).argmin(axis=1)
+    hi = np.where(inside, proj, -np.inf).argmax(axis=1)
+    rows = np.arange(len(A))
+    segments = np.stack([pts[rows, lo], pts[rows, hi]], axis=1)
+    return segments, inside.any(axis=1)
+
+
+def _add_merged_constraints(fig, A, b, box, optimal_solution, colors, axis_names=("x₁", "x₂")):
+    """Todas as restrições num traço WebGL (segmentos separados por None); as ativas no ótimo ganham traço e legenda próprios."""
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float)
+    segments, visible = clip_lines_2d(A, b, box)
+    xn, yn = axis_names
+    labels = [f"R{i+1}: {a[0]}{xn} + {a[1]}{yn} ≤ {rhs}" for i, (a, rhs) in enumerate(zip(A.tolist(), b.tolist()))]
+
+    binding = np.zeros(len(b), dtype=bool)
+    if optimal_solution is not None and len(optimal_solution) >= 2:
+        x_opt = np.asarray(optimal_solution[:2], dtype=float)
+        binding = np.abs(A @ x_opt - b) <= 1e-6 * (1.0 + np.abs(b))
+
+    rest = np.flatnonzero(visible & ~binding)
+    if len(rest):
+        # x1, x2, None por restrição
+        xy = np.full((len(rest), 3, 2), np.nan)
+        xy[:, :2] = segments[rest]
+        text = np.repeat(np.array(labels, dtype=object)[rest], 3)
+        fig.add_trace(go.Scattergl(
+            x=np.where(np.isnan(xy[..., 0]), None, xy[..., 0]).ravel(),
+            y=np.where(np.isnan(xy[..., 1]), None, xy[..., 1]).ravel(),
+            mode="lines", showlegend=False, name="",
+            line=dict(color="rgba(128, 128, 128, 0.6)", width=1, dash="dash"),
+            text=text, hovertemplate="%{text}<extra></extra>",
+        ))
+    for idx in np.flatnonzero(visible & binding):
+        fig.add_trace(go.Scattergl(
+            x=segments[idx, :, 0], y=segments[idx, :, 1], mode="lines",
+            name=labels[idx], line=dict(color=colors[idx % len(colors)], dash="dash", width=2),
+        ))
+
+
+@memoized_figure
+def feasible_region_3d(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None, axis_names=("x₁", "x₂", "x₃")):
     if len(c) != 3:
         return None
 
@@ -230,7 +559,298 @@ def feasible_region_3d(c: List[float], A: List[List[float]], b: List[float], opt
         ))
 
     fig.update_layout(
-        scene=dict(xaxis_title='x₁', yaxis_title='x₂', zaxis_title='x₃'),
+        scene=dict(xaxis_title=axis_names[0], yaxis_title=axis_names[1], zaxis_title=axis_names[2]),
         height=700
     )
     return fig
+
+
+@memoized_figure
+def simplex_path_figure(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None, path=None):
+    """
+    Região factível (2D/3D) com o caminho percorrido pelo Simplex.
+
+    ``path`` é o resultado de ``SimplexSolver.get_path()``. Todos os quadros
+    são montados aqui uma única vez: o slider apenas reposiciona o marcador
+    da iteração (restyle no navegador), sem recalcular nada no servidor.
+    """
+    n = len(c)
+    base = feasible_region_2d(c, A, b, optimal_solution) if n == 2 else feasible_region_3d(c, A, b, optimal_solution)
+    if base is None or not path or len(path["points"]) == 0:
+        return base
+
+    # Cópia: a figura base é compartilhada pelo cache
+    fig = go.Figure(base)
+    points = np.asarray(path["points"], dtype=float)[:, :n]
+    objective = np.asarray(path["objective"], dtype=float)
+    artificial = np.asarray(path.get("artificial", np.zeros(len(points), dtype=bool)), dtype=bool)
+    labels = [
+        t("simplex.results.path_point").format(k, z) + (f" — {t('simplex.results.path_artificial')}" if art else "")
+        for k, (z, art) in enumerate(zip(objective, artificial))
+    ]
+    coords = dict(x=points[:, 0], y=points[:, 1]) if n == 2 else dict(x=points[:, 0], y=points[:, 1], z=points[:, 2])
+    Scatter = go.Scatter if n == 2 else go.Scatter3d
+
+    fig.add_trace(Scatter(
+        **coords, mode="lines+markers", name=t("simplex.results.path"),
+        line=dict(color="#FF4B4B", width=3 if n == 2 else 5),
+        marker=dict(size=7 if n == 2 else 4, color="#FF4B4B"),
+        text=labels, hovertemplate="%{text}<extra></extra>",
+    ))
+    last = len(points) - 1
+    current = {axis: [values[last]] for axis, values in coords.items()}
+    fig.add_trace(Scatter(
+        **current, mode="markers+text", name=t("simplex.results.path_current"),
+        marker=dict(size=16 if n == 2 else 8, color="#FF4B4B", symbol="circle-open" if n == 2 else "circle",
+                    line=dict(width=3, color="#FF4B4B")),
+        text=[labels[last]], textposition="top center", hoverinfo="skip",
+    ))
+
+    # Um passo por iteração: só troca as coordenadas/rótulo do marcador atual
+    marker_idx = len(fig.data) - 1
+    steps = [
+        dict(
+            method="restyle",
+            label=str(k),
+            args=[{**{axis: [[float(values[k])]] for axis, values in coords.items()}, "text": [[labels[k]]]}, [marker_idx]],
+        )
+        for k in range(len(points))
+    ]
+    fig.update_layout(sliders=[dict(
+        active=last, steps=steps, pad=dict(t=40),
+        currentvalue=dict(prefix=t("simplex.results.path_slider")),
+    )])
+    return fig
+
+
+@memoized_figure
+def reduced_region_figure(c: List[float], A: List[List[float]], b: List[float], optimal_solution: Optional[List[float]] = None, dims=(0, 1), mode: str = "slice"):
+    """
+    Região factível de um modelo com muitas variáveis vista em 2 ou 3 delas.
+
+    ``mode="slice"``: corte com as demais variáveis fixas em
+    ``optimal_solution`` (obrigatório). ``mode="projection"``: projeção nas
+    ``dims`` aproximada pela função-suporte (PLs em lote, ver
+    ``core.projection``); as retas desenhadas seriam só as direções
+    amostradas, então apenas a região aparece.
+    """
+    dims = [int(d) for d in dims]
+    c_d = [float(c[d]) for d in dims]
+    opt_d = None if optimal_solution is None else [float(optimal_solution[d]) for d in dims]
+    if mode == "slice":
+        if optimal_solution is None:
+            return None
+        A_d, b_d = slice_constraints(A, b, optimal_solution, dims)
+    else:
+        A_d, b_d = projection_constraints(A, b, dims)
+    if len(A_d) == 0:
+        return None
+
+    A_d, b_d = A_d.tolist(), b_d.tolist()
+    names = tuple(f"x{d + 1}".translate(_SUBSCRIPTS) for d in dims)
+    if len(dims) == 2:
+        return feasible_region_2d(c_d, A_d, b_d, opt_d, show_constraints=mode == "slice", axis_names=names)
+    return feasible_region_3d(c_d, A_d, b_d, opt_d, axis_names=names)
+
+
+_SUBSCRIPTS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+# Acima disto (pontos na caixa da região), a malha de pontos inteiros não é desenhada
+LATTICE_MAX_POINTS = 20_000
+
+
+class BranchBoundOverlay:
+    """
+    Região factível 2D do Branch & Bound com pontos inteiros, cortes de
+    ramificação e regiões podadas.
+
+    A malha inteira é calculada uma vez (grade vetorizada + uma máscara
+    ``A x <= b``). ``update(nodes)`` só processa os nós novos (o corte de
+    cada filho) e os que ainda estavam na fila (podados depois viram a
+    sombra da sua caixa), então avançar o B&B passo a passo não refaz nem
+    percorre o que já foi desenhado.
+    """
+
+    def __init__(self, c, A, b, integer_vars):
+        self.c, self.A, self.b = list(c), [list(row) for row in A], list(b)
+        self.integer_vars = list(integer_vars)
+        A_all, b_all = _get_hyperplanes(self.c, self.A, self.b)
+        self._A_all, self._b_all = A_all.astype(float), b_all.astype(float)
+        vertices = find_vertices(A_all, b_all, 2)
+        if len(vertices):
+            self.box = (vertices[:, 0].min() - 1, vertices[:, 0].max() + 1,
+                        vertices[:, 1].min() - 1, vertices[:, 1].max() + 1)
+        else:
+            self.box = None
+        self.lattice = self._lattice() if self.box is not None else np.empty((0, 2))
+        self.cuts: List[np.ndarray] = []            # segmentos (2, 2)
+        self.shaded = {"bound": [], "infeasible": []}  # polígonos (k, 2)
+        self._seen = 0
+        # Nós ainda na fila: os únicos que podem ser podados depois de vistos
+        self._open = set()
+
+    def update(self, nodes) -> None:
+        """Acrescenta cortes dos nós criados e sombras dos nós podados desde a última chamada."""
+        if self.box is None:
+            return
+        # Os abertos de antes primeiro: um nó novo já é tratado no próprio laço
+        candidates = sorted(self._open)
+        self._open.clear()
+        for node in nodes[self._seen:]:
+            if node is None:
+                continue
+            candidates.append(node["id"])
+            if node["parent"] is None:
+                continue
+            parent = nodes[node["parent"]]
+            segment = self._cut_segment(node, parent) if parent is not None else None
+            if segment is not None:
+                self.cuts.append(segment)
+        self._seen = len(nodes)
+
+        for node_id in candidates:
+            node = nodes[node_id]
+            if node is None:
+                continue
+            reason = node.get("pruned")
+            if reason is None:
+                if not node["processed"]:
+                    self._open.add(node_id)
+                continue
+            polygon = self._node_region(node, reason) if reason in self.shaded else ()
+            if len(polygon) >= 3:
+                self.shaded[reason].append(polygon)
+
+    def figure(self, incumbent=None):
+        """Figura com a região (cache compartilhado) e as camadas do B&B já acumuladas."""
+        base = feasible_region_2d(self.c, self.A, self.b)
+        if base is None:
+            return None
+        # Cópia: a figura base é compartilhada pelo cache
+        fig = go.Figure(base)
+        styles = {
+            "bound": ("rgba(158, 158, 158, 0.45)", t("bab.results.plot_pruned")),
+            "infeasible": ("rgba(244, 67, 54, 0.25)", t("bab.results.plot_infeasible")),
+        }
+        for reason, (color, name) in styles.items():
+            if self.shaded[reason]:
+                x, y = _joined(self.shaded[reason], close=True)
+                fig.add_trace(go.Scatter(x=x, y=y, fill="toself", fillcolor=color, mode="lines",
+                                         line=dict(width=0), name=name, hoverinfo="skip"))
+        if len(self.lattice):
+            fig.add_trace(go.Scatter(x=self.lattice[:, 0], y=self.lattice[:, 1], mode="markers",
+                                     name=t("bab.results.plot_lattice"),
+                                     marker=dict(size=6, color="#444444")))
+        if self.cuts:
+            x, y = _joined(self.cuts)
+            fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name=t("bab.results.plot_cuts"),
+                                     line=dict(color="#8e24aa", width=2)))
+        if incumbent is not None:
+            fig.add_trace(go.Scatter(x=[incumbent[0]], y=[incumbent[1]], mode="markers",
+                                     name=t("bab.results.plot_incumbent"),
+                                     marker=dict(symbol="star", size=18, color="#2e7d32", line=dict(color="white", width=1))))
+        return fig
+
+    # ------------------------------------------------------------------ helpers
+    def _lattice(self):
+        x_min, x_max, y_min, y_max = self.box
+        xs = np.arange(max(0, np.ceil(x_min)), np.floor(x_max) + 1)
+        ys = np.arange(max(0, np.ceil(y_min)), np.floor(y_max) + 1)
+        if len(xs) * len(ys) > LATTICE_MAX_POINTS or not {0, 1} <= set(self.integer_vars):
+            return np.empty((0, 2))
+        X, Y = np.meshgrid(xs, ys)
+        points = np.column_stack([X.ravel(), Y.ravel()])
+        return points[np.all(points @ self._A_all.T <= self._b_all + 1e-9, axis=1)]
+
+    def _node_box(self, node):
+        lo, hi = np.zeros(2), np.full(2, np.inf)
+        for var, (op, val) in node["bounds"].items():
+            if var > 1:
+                continue
+            if op == "<=":
+                hi[var] = min(hi[var], val)
+            else:
+                lo[var] = max(lo[var], val)
+        return lo, hi
+
+    def _cut_segment(self, node, parent):
+        """Reta da nova restrição do filho, restrita à caixa do pai e à região do PL."""
+        changed = [var for var, bound in node["bounds"].items() if parent["bounds"].get(var) != bound]
+        if len(changed) != 1 or changed[0] > 1:
+            return None
+        var = changed[0]
+        val = node["bounds"][var][1]
+        lo, hi = self._node_box(parent)
+        other = 1 - var
+        x_min, x_max, y_min, y_max = self.box
+        span = (x_min, x_max) if other == 0 else (y_min, y_max)
+        start, end = np.zeros(2), np.zeros(2)
+        start[var] = end[var] = val
+        start[other], end[other] = max(lo[other], span[0]), min(hi[other], span[1])
+        return _clip_segment(start, end, self._A_all, self._b_all)
+
+    def _node_region(self, node, reason):
+        """Parte da região do PL dentro da caixa do nó (podado por limite) ou a própria caixa (inviável)."""
+        lo, hi = self._node_box(node)
+        x_min, x_max, y_min, y_max = self.box
+        lo = np.maximum(lo, [x_min, y_min])
+        hi = np.minimum(hi, [x_max, y_max])
+        if np.any(lo > hi):
+            return np.empty((0, 2))
+        if reason == "infeasible":
+            return np.array([[lo[0], lo[1]], [hi[0], lo[1]], [hi[0], hi[1]], [lo[0], hi[1]]])
+        box_A = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+        box_b = np.array([hi[0], hi[1], -lo[0], -lo[1]])
+        vertices = find_vertices(np.vstack([self._A_all, box_A]), np.concatenate([self._b_all, box_b]), 2)
+        return ordered_polygon_2d(vertices) if len(vertices) >= 3 else np.empty((0, 2))
+
+
+def _clip_segment(start, end, A, b):
+    """Trecho de ``start→end`` dentro de ``{x : A x <= b}`` (ou ``None``)."""
+    d = end - start
+    num = b - A @ start
+    den = A @ d
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = num / den
+    if np.any((np.abs(den) < 1e-12) & (num < -1e-9)):
+        return None
+    t_lo = np.max(ratios[den < -1e-12], initial=0.0)
+    t_hi = np.min(ratios[den > 1e-12], initial=1.0)
+    if t_lo > t_hi:
+        return None
+    return np.array([start + t_lo * d, start + t_hi * d])
+
+
+def _joined(pieces, close=False):
+    """Coordenadas x, y de vários segmentos/polígonos num só traço (separados por None)."""
+    xs, ys = [], []
+    for piece in pieces:
+        if close:
+            piece = np.vstack([piece, piece[:1]])
+        xs.extend(piece[:, 0].tolist() + [None])
+        ys.extend(piece[:, 1].tolist() + [None])
+    return xs, ys
+
+
+def parametric_curves(curves, x_title: str, y_title: str = "Z*"):
+    """Curvas lineares por partes do valor ótimo (análise paramétrica).
+
+    ``curves`` é uma lista de ``(rótulo, resultado)`` com resultados de
+    ``core.parametric``; cada curva é desenhada pelos seus breakpoints.
+    """
+    fig = go.Figure()
+    for label, result in curves:
+        if result.get("status") != "optimal":
+            continue
+        fig.add_trace(go.Scatter(
+            x=result["thetas"], y=result["values"],
+            mode="lines+markers", name=label,
+            hovertemplate=f"{label}<br>Δ=%{{x:.3f}}<br>Z=%{{y:.3f}}<extra></extra>"
+        ))
+    fig.add_vline(x=0, line=dict(color="#888", dash="dot"))
+    fig.update_layout(
+        xaxis_title=x_title, yaxis_title=y_title,
+        showlegend=True, template="plotly_white", height=450
+    )
+    return fig
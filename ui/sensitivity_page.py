@@ -4,7 +4,11 @@ import streamlit as st
 import pandas as pd
 
 from core.simplex_solver import SimplexSolver
-from .helpers import number_emojis
+from core.parametric import parametric_rhs, parametric_objective
+from core.warm_start import solver_basis
+from core.solve_cache import problem_fingerprint
+from .helpers import number_emojis, cached_result, store_result
+from .plots import parametric_curves
 from ui.lang import t
 
 def sensitivity_ui():
@@ -91,14 +95,19 @@ def sensitivity_ui():
                 b_conv.append(-rhs)
 
         try:
-            solver = SimplexSolver()
-            solver.solve(c, A_conv, b_conv, maximize=is_max)
-            
-            if not solver.optimal:
+            # Análise + curvas paramétricas de um modelo já visto saem do cache compartilhado
+            cache_key = problem_fingerprint(c, A_conv, b_conv, maximize=is_max, solver="sensitivity")
+            report = cached_result(cache_key)
+            if report is None:
+                report = _sensitivity_report(c, A_conv, b_conv, is_max)
+                if report is not None:
+                    store_result(cache_key, report, {"status": "optimal", "sensitivity": report["analysis"]})
+
+            if report is None:
                 st.error(t("sensitivity.error_optimal"))
                 return
 
-            analysis = solver.get_sensitivity_analysis()
+            analysis = report["analysis"]
             
             st.divider()
             st.success(t("sensitivity.success_gen"))
@@ -137,6 +146,18 @@ def sensitivity_ui():
                 })
             
             st.dataframe(pd.DataFrame(rhs_data), width="stretch", hide_index=True)
+
+            # 3. Análise Paramétrica (curvas completas de Z* por parâmetro)
+            st.subheader(t("sensitivity.results.param_title"))
+            st.markdown(t("sensitivity.results.param_desc"))
+
+            rhs_curves, obj_curves = report["rhs_curves"], report["obj_curves"]
+
+            tab_rhs, tab_obj = st.tabs([t("sensitivity.results.param_rhs_tab"), t("sensitivity.results.param_obj_tab")])
+            with tab_rhs:
+                st.plotly_chart(parametric_curves(rhs_curves, t("sensitivity.results.param_axis_rhs")), width="stretch")
+            with tab_obj:
+                st.plotly_chart(parametric_curves(obj_curves, t("sensitivity.results.param_axis_obj")), width="stretch")
             
             # Dica visual
             st.info(t("sensitivity.tip"))
@@ -144,3 +165,33 @@ def sensitivity_ui():
         except Exception as e:
             st.error(f"{t('bab.messages.error')} {e}")
             st.exception(e)
+
+
+def _sensitivity_report(c, A, b, is_max):
+    """Análise de sensibilidade e curvas paramétricas (``None`` se não houver ótimo)."""
+    solver = SimplexSolver()
+    solver.solve(c, A, b, maximize=is_max)
+    if not solver.optimal:
+        return None
+
+    # Todas as curvas partem da base ótima desta única resolução; sem base em
+    # [A | I] (linha redundante) não há curvas, e nada é resolvido de novo
+    basis = solver_basis(solver)
+    if basis is None:
+        return {"analysis": solver.get_sensitivity_analysis(), "rhs_curves": [], "obj_curves": []}
+
+    rhs_curves = []
+    for i, rhs in enumerate(b):
+        d = [0.0] * len(b)
+        d[i] = 1.0
+        span = max(abs(rhs), 1.0)
+        rhs_curves.append((f"R{i+1}", parametric_rhs(c, A, b, d, -span, span, maximize=is_max, basis=basis)))
+
+    obj_curves = []
+    for j, cost in enumerate(c):
+        d = [0.0] * len(c)
+        d[j] = 1.0
+        span = max(abs(cost), 1.0)
+        obj_curves.append((f"x{j+1}", parametric_objective(c, A, b, d, -span, span, maximize=is_max, basis=basis)))
+
+    return {"analysis": solver.get_sensitivity_analysis(), "rhs_curves": rhs_curves, "obj_curves": obj_curves}
@@ -2,9 +2,13 @@ from typing import List
 
 import streamlit as st
 
-from .helpers import _store_problem, _load_problem, number_emojis
+from .helpers import _store_problem, _load_problem, number_emojis, SOLVE_TIME_LIMIT, is_cacheable, cached_result, store_result
+from .jobs import SolveJob, cancel_job, finished_job, show_job_progress, submit_job
+from core.cancellation import CancellationToken
+from core.solve_cache import problem_fingerprint
 from core.simplex_solver import SimplexSolver
-from .plots import feasible_region_2d, feasible_region_3d
+from core.interior_point_solver import InteriorPointSolver
+from .plots import feasible_region_2d, feasible_region_3d, reduced_region_figure, simplex_path_figure
 from .tableau_display import (
     show_tableau_with_basis_info, 
     show_final_solution,
@@ -101,12 +105,23 @@ def simplex_ui():
             senses.append(sense)
 
     # -------- botão resolver ----------------------------------------
+    engine_options = {
+        t("simplex.engines.simplex"): "simplex",
+        t("simplex.engines.ipm"): "ipm",
+    }
+    engine_label = st.radio(t("simplex.engine"), list(engine_options.keys()), horizontal=True, help=t("simplex.engine_help"))
+    engine = engine_options.get(engine_label, "simplex")
+
     col_opt1, col_opt2, col_btn = st.columns([0.35, 0.25, 0.4])
     with col_opt1:
         didactic_mode = st.checkbox(t("simplex.didactic"), value=True, help="Mostrar explicações detalhadas passo a passo", key="didactic_mode_cb")
     with col_opt2:
-        step_by_step = st.checkbox(t("simplex.step_by_step"), value=False, disabled=not didactic_mode)
-        if not didactic_mode: step_by_step = False
+        # Pontos interiores não tem execução pivô a pivô
+        step_by_step = st.checkbox(t("simplex.step_by_step"), value=False, disabled=not didactic_mode or engine == "ipm")
+        if not didactic_mode or engine == "ipm": step_by_step = False
+        # Aritmética exata (Bareiss) só faz sentido no tableau do Simplex
+        exact = st.checkbox(t("simplex.exact"), value=False, help=t("simplex.exact_help"), disabled=engine == "ipm")
+        if engine == "ipm": exact = False
     with col_btn:
         solve_clicked = st.button(t("simplex.btn_solve"), type="primary", width="stretch")
 
@@ -127,34 +142,65 @@ def simplex_ui():
                 b_conv.append(-rhs)
         
         try:
-             solver = SimplexSolver()
+             solver = InteriorPointSolver() if engine == "ipm" else SimplexSolver()
              # is_max já está definido na linha 41
+             cancel_token = CancellationToken()
+             limits = {"time_limit": SOLVE_TIME_LIMIT, "cancel_token": cancel_token}
+             params = {"c": c, "A": A_conv, "b": b_conv, "max": is_max}
              
              if step_by_step and didactic_mode:
-                 solver.initialize(c, A_conv, b_conv, maximize=is_max)
+                 # Sem prazo: o relógio correria enquanto o usuário lê cada passo
+                 solver.initialize(c, A_conv, b_conv, maximize=is_max, exact=exact, cancel_token=cancel_token)
+                 cancel_job("simplex_job")
                  st.session_state["simplex_solver"] = solver
-                 st.session_state["simplex_params"] = {
-                     "c": c, "A": A_conv, "b": b_conv, "max": is_max
-                 }
+                 st.session_state["simplex_params"] = params
                  st.rerun()
              else:
-                 solver.solve(c, A_conv, b_conv, maximize=is_max)
-                 st.session_state["simplex_solver"] = solver
-                 st.session_state["simplex_params"] = {
-                     "c": c, "A": A_conv, "b": b_conv, "max": is_max
-                 }
-                 
-                 # Salvar histórico no modo normal
-                 if solver.optimal:
-                     sol, z = solver.get_solution()
-                     st.session_state.setdefault("history", []).append({
-                        "method": "Simplex", "c": c, "A": A, "b": b, "z": z, "solution": sol, "maximize": is_max
+                 # Mesmo modelo já resolvido (por qualquer sessão): reaproveita o solver
+                 cache_key = problem_fingerprint(c, A_conv, b_conv, maximize=is_max, engine=engine, exact=exact)
+                 cached = cached_result(cache_key)
+                 if cached is not None:
+                     cancel_job("simplex_job")
+                     st.session_state["simplex_solver"] = cached
+                     st.session_state["simplex_params"] = params
+                     st.toast(t("common.cached_result"))
+                     _save_history(cached, c, A, b, is_max)
+                 else:
+                     # Resolve num worker; o resultado é recolhido numa próxima execução da página
+                     if engine == "ipm":
+                         run = lambda: solver.solve(c, A_conv, b_conv, maximize=is_max, **limits)
+                         progress = lambda job: (None, t("simplex.results.progress_ipm"))
+                     else:
+                         run = lambda: solver.iter_solve(c, A_conv, b_conv, maximize=is_max, exact=exact, **limits)
+                         # Lido da página enquanto o worker itera (atributos criados no initialize)
+                         progress = lambda job: (
+                             getattr(solver, "iteration_count", 0) / max(getattr(solver, "iteration_limit", 1), 1),
+                             t("simplex.results.progress").format(getattr(solver, "iteration_count", 0)),
+                         )
+                     job = SolveJob(solver, cancel_token, run, progress, context={
+                         "params": params, "cache_key": cache_key, "history": (c, A, b, is_max),
                      })
+                     if submit_job("simplex_job", job):
+                         st.session_state.pop("simplex_solver", None)
                      
         except Exception as e:
              st.error(f"Erro ao iniciar solver: {e}")
              st.exception(e)
 
+    # Resolução em segundo plano: recolhe o resultado quando o worker termina
+    job = finished_job("simplex_job")
+    if job is not None:
+        if job.error is not None:
+            st.error(f"Erro ao iniciar solver: {job.error}")
+            st.exception(job.error)
+        else:
+            st.session_state["simplex_solver"] = job.solver
+            st.session_state["simplex_params"] = job.context["params"]
+            if is_cacheable(job.solver):
+                store_result(job.context["cache_key"], job.solver)
+            _save_history(job.solver, *job.context["history"])
+    show_job_progress("simplex_job")
+
 
 
     # --------------------------------------------------------------------------
@@ -169,6 +215,8 @@ def simplex_ui():
             st.error(t("simplex.results.unbounded"))
         elif solver.infeasible:
              st.error(t("simplex.results.infeasible"))
+        elif solver.stop_reason in ("time_limit", "cancelled"):
+             st.warning(t(f"simplex.results.stopped_{solver.stop_reason}"))
         
         # Validar se tem tableaux para mostrar
         if solver.tableaux:
@@ -183,9 +231,14 @@ def simplex_ui():
                         objective_value=final_z, 
                         basis_info=basis_info,
                         maximize=is_max,
-                        method="Simplex Primal",
+                        method=t("simplex.engines.ipm") if isinstance(solver, InteriorPointSolver) else "Simplex Primal",
                         iterations=len(solver.steps) - 1
                      )
+                     if getattr(solver, "exact", False):
+                         _, exact_z = solver.get_exact_solution()
+                         st.caption(t("simplex.results.exact_value").format(exact_z))
+                     if getattr(solver, "degenerate_pivots", 0):
+                         st.caption(t("simplex.results.degenerate_pivots").format(solver.degenerate_pivots))
                  except Exception as e:
                      st.warning(f"Detalhes da solução não disponíveis: {e}")
 
@@ -203,6 +256,9 @@ def simplex_ui():
         for idx, (tbl, step, desc, piv) in enumerate(
             zip(solver.tableaux, solver.steps, solver.decisions, solver.pivots)
         ):
+            # No modo exato o tableau exibido é o de frações (sem arredondamento)
+            tbl_view = solver.get_exact_tableau(idx) if getattr(solver, "exact", False) else tbl
+
             # Expandir lógica
             is_initial = idx == 0
             is_final = "Ótima" in step or "Optimal" in step
@@ -241,7 +297,7 @@ def simplex_ui():
                     else:
                         basis_info = [(f"s{i+1}", tbl[i+1, -1]) for i in range(tbl.shape[0]-1)]
                     # Mostrar tableau com índices corretos das variáveis básicas
-                    show_tableau_with_basis_info(tbl, basis_info, pivot=piv, show_legend=didactic_mode)
+                    show_tableau_with_basis_info(tbl_view, basis_info, pivot=piv, show_legend=didactic_mode)
                     
                     if piv != (-1, -1) and idx > 0:
                         pr, pc = piv
@@ -298,7 +354,7 @@ def simplex_ui():
                 
                 st.markdown(f"##### **{step_text}**")
                 # Passar basis_vars=None para esconder a seção "Status da Base Atual"
-                show_tableau_with_basis_info(tbl, basis_vars=None, pivot=piv, show_legend=False)
+                show_tableau_with_basis_info(tbl_view, basis_vars=None, pivot=piv, show_legend=False)
                 st.markdown("---")
 
         # ----- Visualização da Região Factível (2D/3D) -------------------
@@ -319,12 +375,36 @@ def simplex_ui():
                      pass
 
              fig = None
-             if n_plot == 2:
-                 st.markdown(t("simplex.results.plot_2d"))
+             if n_plot in (2, 3):
+                 st.markdown(t("simplex.results.plot_2d") if n_plot == 2 else t("simplex.results.plot_3d"))
+                 show_path = st.checkbox(t("simplex.results.show_path"), value=True, key="simplex_show_path")
+             if n_plot in (2, 3) and show_path and solver.tableaux:
+                 # Caminho calculado uma vez por resolução; o slider da figura percorre as iterações
+                 fig = simplex_path_figure(c_plot, A_plot, b_plot, optimal_solution=optimal_sol, path=solver.get_path())
+             elif n_plot == 2:
                  fig = feasible_region_2d(c_plot, A_plot, b_plot, optimal_solution=optimal_sol)
              elif n_plot == 3:
-                 st.markdown(t("simplex.results.plot_3d"))
                  fig = feasible_region_3d(c_plot, A_plot, b_plot, optimal_solution=optimal_sol)
+             elif n_plot > 3 and optimal_sol is not None:
+                 # Mais de 3 variáveis: corte ou projeção nas variáveis escolhidas
+                 st.markdown(t("simplex.results.plot_nd"))
+                 var_names = [f"x{i+1}" for i in range(n_plot)]
+                 view_modes = {t("simplex.results.view_slice"): "slice", t("simplex.results.view_projection"): "projection"}
+                 col_vars, col_mode = st.columns([0.6, 0.4])
+                 with col_vars:
+                     picked = st.multiselect(t("simplex.results.view_vars"), var_names, default=var_names[:2], max_selections=3, key="simplex_view_vars", help=t("simplex.results.view_vars_help"))
+                 with col_mode:
+                     view_mode = view_modes[st.radio(t("simplex.results.view_mode"), list(view_modes), horizontal=True, key="simplex_view_mode")]
+                 if len(picked) in (2, 3):
+                     dims = sorted(var_names.index(v) for v in picked)
+                     fig = reduced_region_figure(c_plot, A_plot, b_plot, optimal_solution=optimal_sol, dims=dims, mode=view_mode)
+                     if view_mode == "slice":
+                         fixed = ", ".join(f"x{i+1} = {optimal_sol[i]:.3f}" for i in range(n_plot) if i not in dims)
+                         st.caption(t("simplex.results.view_slice_caption").format(fixed))
+                     else:
+                         st.caption(t("simplex.results.view_projection_caption"))
+                 else:
+                     st.info(t("simplex.results.view_pick"))
              
              if fig:
                  st.plotly_chart(fig, use_container_width=True)
@@ -334,4 +414,10 @@ def simplex_ui():
                 
 
 
-
+def _save_history(solver, c, A, b, is_max):
+    """Registra no histórico da sessão uma resolução ótima (modo normal)."""
+    if solver.optimal:
+        sol, z = solver.get_solution()
+        st.session_state.setdefault("history", []).append({
+            "method": "Simplex", "c": c, "A": A, "b": b, "z": z, "solution": sol, "maximize": is_max
+        })
@@ -1,15 +1,22 @@
+from fractions import Fraction
+
 import pandas as pd
 import streamlit as st
 import numpy as np
 from ui.lang import t
 
 
+def _format_cell(value):
+    # Tableaux do modo exato trazem Fraction (ex.: 7/3); os demais, float
+    return str(value) if isinstance(value, (Fraction, str)) else f"{value:.3f}"
+
+
 def show_tableau(T, caption="", pivot: tuple[int, int] | None = None, basis_vars=None, show_legend=True):
     """
     Mostra o tableau com formatação aprimorada e índices corretos das variáveis básicas.
     
     Args:
-        T: Tableau do simplex (numpy array)
+        T: Tableau do simplex (numpy array, float ou Fraction no modo exato)
         caption: Título/descrição do tableau
         pivot: Tupla (linha, coluna) para destacar elemento pivot
         basis_vars: Lista de nomes das variáveis básicas para os índices das linhas
@@ -32,9 +39,12 @@ def show_tableau(T, caption="", pivot: tuple[int, int] | None = None, basis_vars
 
     # Criar DataFrame
     df = pd.DataFrame(T, index=row_names, columns=col_names)
+    if T.dtype == object:
+        # Frações viram texto (o Arrow do st.dataframe não serializa Fraction)
+        df = df.map(_format_cell)
 
     # Aplicar formatação
-    styler = df.style.format("{:.3f}")
+    styler = df.style.format(_format_cell)
     
     # Destacar elemento pivot se fornecido
     if pivot and pivot != (-1, -1):